@@ -1,5 +1,23 @@
 """CLI and related executables for Fentarxiu."""
 
-from cli.messages_ca import failure_to_message_ca
+from typing import TYPE_CHECKING
 
-__all__ = ["failure_to_message_ca"]
+from lazy_exports import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from cli.messages_ca import (
+        failure_to_message_ca,
+        format_failures_ca,
+        register_message_ca,
+    )
+
+# Public name -> defining module, imported on first access.
+_LAZY_ATTRS = {
+    "failure_to_message_ca": "cli.messages_ca",
+    "format_failures_ca": "cli.messages_ca",
+    "register_message_ca": "cli.messages_ca",
+}
+
+__all__ = ["failure_to_message_ca", "format_failures_ca", "register_message_ca"]
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
@@ -0,0 +1,52 @@
+"""Typer CLI for Fentarxiu: compile an instrument catalogue file.
+
+Reads a catalogue in CSV, JSON or TOML (see string_checker.data.catalogue_io),
+checks it for invalid or duplicate entries, and writes the compiled .fxcat
+form that sheet_parser --catalogue loads through a memory map.
+"""
+
+from pathlib import Path
+
+from typer import Argument, Option, Typer, echo
+
+from cli.messages import DEFAULT_LANGUAGE, Language, load_messages
+from string_checker.data import COMPILED_SUFFIX
+
+app = Typer(
+    help=(
+        "Compila un catàleg d'instruments (.csv, .json o .toml) al format "
+        f"{COMPILED_SUFFIX}, que es carrega més ràpid."
+    ),
+)
+
+_SOURCE_ARGUMENT = Argument(..., help="Catàleg d'origen (.csv, .json o .toml).")
+_OUTPUT_ARGUMENT = Argument(
+    None,
+    help=f"Fitxer compilat. Per defecte, el d'origen amb extensió {COMPILED_SUFFIX}.",
+)
+
+_LANG_OPTION = Option(
+    DEFAULT_LANGUAGE,
+    "--lang",
+    help="Idioma dels missatges: ca (valencià), es o en.",
+)
+
+
+@app.callback(invoke_without_command=True)
+def main(
+    source: Path = _SOURCE_ARGUMENT,
+    output: Path | None = _OUTPUT_ARGUMENT,
+    lang: Language = _LANG_OPTION,
+) -> None:
+    """Compila un catàleg d'instruments."""
+    from string_checker import CatalogueError, InstrumentCatalogue
+
+    messages = load_messages(lang)
+    try:
+        catalogue = InstrumentCatalogue.from_file(source)
+    except CatalogueError as e:
+        echo(messages.text("catalogue_error", error=e), err=True)
+        raise SystemExit(1) from e
+    destination = output or source.with_suffix(COMPILED_SUFFIX)
+    catalogue.save_compiled(destination)
+    echo(messages.text("catalogue_compiled", n=len(catalogue.index), path=destination))
@@ -0,0 +1,177 @@
+"""Streaming, atomically published validation logs for the CLIs.
+
+The log is written in one of three formats (see OutputFormat): the text
+log for people, or JSON Lines / CSV records for tools. Messages come from
+a MessageCatalogue (Valencian by default, see cli.messages).
+"""
+
+import csv
+import json
+import os
+from enum import Enum
+from pathlib import Path
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Self
+
+from cli.messages import MessageCatalogue, load_messages
+
+if TYPE_CHECKING:
+    from string_checker.failures.base import ValidationFailure
+
+
+class OutputFormat(Enum):
+    """Format of the log written by the CLIs.
+
+    TEXT is the readable log: a "<label>: <path>" line per failing entry
+    followed by one line per failure. JSONL writes one JSON object per
+    failing entry: {"path", "id", "failures": [record, ...]} where each
+    record holds "code" (the FailureKind value), "message_<lang>" (the
+    message in the log language, e.g. message_ca) and the failure's own
+    attributes (index, char, message...). CSV writes one row per failure
+    with the columns path, id, code, message_<lang> and details, the JSON
+    object of the failure's attributes.
+    """
+
+    TEXT = "text"
+    JSONL = "jsonl"
+    CSV = "csv"
+
+
+def failure_to_record(
+    failure: "ValidationFailure", messages: MessageCatalogue | None = None
+) -> dict[str, object]:
+    """Return a JSON-serializable record of a failure.
+
+    Args:
+        failure: A validation failure from the checker.
+        messages: Catalogue of the message; defaults to Valencian.
+
+    Returns:
+        {"code": FailureKind value, "message_<lang>": message} plus every
+        other attrs field of the failure under its own name.
+
+    """
+    import attrs
+
+    messages = messages or load_messages()
+    record: dict[str, object] = {
+        "code": failure.code.value,
+        f"message_{messages.language.value}": messages.failure_message(failure),
+    }
+    if attrs.has(type(failure)):
+        for name, value in attrs.asdict(failure, recurse=False).items():
+            if name != "code":
+                record[name] = value.value if isinstance(value, Enum) else value
+    return record
+
+
+class LogWriter:
+    """Writes one block per failing entry as it is validated.
+
+    Blocks go to a temporary file next to the log, which replaces log_path
+    only when the with-block completes without an exception. On error
+    (including SystemExit) the temporary file is removed, so the log is
+    still only created when the run succeeds. Memory stays flat however many
+    entries fail.
+
+    With log_path None nothing is written; failing entries are only counted.
+    """
+
+    def __init__(
+        self,
+        log_path: Path | None,
+        label: str,
+        output_format: OutputFormat = OutputFormat.TEXT,
+        messages: MessageCatalogue | None = None,
+    ) -> None:
+        """Prepare a writer for log_path.
+
+        Args:
+            log_path: Destination log, or None to only count failures.
+            label: Heading word of each text block, e.g. "Fitxer" or "Carpeta".
+            output_format: Format of the log (see OutputFormat).
+            messages: Catalogue of the failure messages; defaults to Valencian.
+
+        """
+        self.log_path = log_path
+        self.label = label
+        self.output_format = output_format
+        self.messages = messages or load_messages()
+        self._message_key = f"message_{self.messages.language.value}"
+        self.count = 0
+        self._tmp_path: Path | None = None
+        self._file: IO[str] | None = None
+        self._csv: csv.DictWriter | None = None
+
+    def __enter__(self) -> Self:
+        """Open the temporary file next to log_path."""
+        if self.log_path is not None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._tmp_path = self.log_path.with_name(
+                f".{self.log_path.name}.{os.getpid()}.tmp"
+            )
+            # The csv module writes its own line endings; the other formats
+            # keep the platform's, as the text log always has.
+            csv_output = self.output_format is OutputFormat.CSV
+            self._file = self._tmp_path.open(
+                "w", encoding="utf-8", newline="" if csv_output else None
+            )
+            if csv_output:
+                columns = ("path", "id", "code", self._message_key, "details")
+                self._csv = csv.DictWriter(self._file, columns)
+                self._csv.writeheader()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Publish the log on success; discard the temporary file otherwise."""
+        if self._file is None or self._tmp_path is None or self.log_path is None:
+            return
+        self._file.close()
+        if exc_type is None:
+            self._tmp_path.replace(self.log_path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+    def write(self, display_path: str, failures: tuple, file_id: str = "") -> None:
+        """Append the block for one failing entry.
+
+        Args:
+            display_path: Path shown after the label.
+            failures: Failures of the entry.
+            file_id: Drive ID of the entry, for the JSONL and CSV formats.
+
+        """
+        self.count += 1
+        if self._file is None:
+            return
+        if self.output_format is OutputFormat.JSONL:
+            entry = {
+                "path": display_path,
+                "id": file_id,
+                "failures": [failure_to_record(f, self.messages) for f in failures],
+            }
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        elif self._csv is not None:
+            for failure in failures:
+                record = failure_to_record(failure, self.messages)
+                code = record.pop("code")
+                message = record.pop(self._message_key)
+                self._csv.writerow(
+                    {
+                        "path": display_path,
+                        "id": file_id,
+                        "code": code,
+                        self._message_key: message,
+                        "details": json.dumps(record, ensure_ascii=False),
+                    }
+                )
+        else:
+            self._file.write(
+                f"{self.label}: {display_path}\n"
+                f"{self.messages.format_failures(failures)}\n"
+            )
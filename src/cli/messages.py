@@ -0,0 +1,131 @@
+"""Message catalogues for the CLIs, one module per language.
+
+Each language lives in cli.messages_<code> (messages_ca, messages_es,
+messages_en) and defines a module-level CATALOGUE: the progress messages of
+the CLIs and the formatters that turn validation failures into log lines.
+load_messages imports a language module the first time it is asked for, so
+a run only pays for the language it uses.
+"""
+
+import importlib
+from collections.abc import Callable, Mapping, Sequence
+from enum import Enum
+from functools import cache
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from string_checker.failures.base import ValidationFailure
+
+MessageFormatter = Callable[["ValidationFailure"], str]
+_F = TypeVar("_F", bound="ValidationFailure")
+
+
+class Language(Enum):
+    """Language of the CLI messages and the log (--lang)."""
+
+    CA = "ca"
+    ES = "es"
+    EN = "en"
+
+
+DEFAULT_LANGUAGE = Language.CA
+
+
+class MessageCatalogue:
+    """Progress messages and failure formatters of one language.
+
+    Templates are str.format strings keyed by message name (see the
+    language modules for the keys). Failure formatters are looked up by
+    exact failure type; a type without one is resolved through its MRO
+    once and the result is remembered until the next registration.
+    """
+
+    def __init__(
+        self, language: Language, templates: Mapping[str, str], fallback: str
+    ) -> None:
+        """Build a catalogue.
+
+        Args:
+            language: Language of the messages.
+            templates: Message name -> str.format template.
+            fallback: Message for failure types without a formatter.
+
+        """
+        self.language = language
+        self._render = {key: template.format for key, template in templates.items()}
+        self._fallback = fallback
+        self._formatters: dict[type[ValidationFailure], MessageFormatter] = {}
+        self._resolved: dict[type, MessageFormatter | None] = {}
+
+    @property
+    def keys(self) -> frozenset[str]:
+        """Return the names of the message templates."""
+        return frozenset(self._render)
+
+    def text(self, key: str, **fields: object) -> str:
+        """Return the message key filled in with fields.
+
+        Raises:
+            KeyError: If the catalogue has no message key.
+
+        """
+        return self._render[key](**fields)
+
+    def register(self, failure_type: type[_F], formatter: Callable[[_F], str]) -> None:
+        """Register the message formatter of a failure type.
+
+        Subclasses of failure_type without a formatter of their own use it
+        too. Registering a type again replaces its formatter.
+
+        Args:
+            failure_type: Concrete (or base) failure class.
+            formatter: Returns the single-line message of a failure.
+
+        """
+        self._formatters[failure_type] = formatter
+        self._resolved.clear()
+
+    def _resolve(self, failure_type: type) -> MessageFormatter | None:
+        """Return the formatter of the nearest registered class in the MRO."""
+        try:
+            return self._resolved[failure_type]
+        except KeyError:
+            pass
+        formatter = next(
+            (
+                self._formatters[c]
+                for c in failure_type.__mro__
+                if c in self._formatters
+            ),
+            None,
+        )
+        self._resolved[failure_type] = formatter
+        return formatter
+
+    def failure_message(self, failure: "ValidationFailure") -> str:
+        """Return the single-line message of a failure (or the fallback)."""
+        formatter = self._resolve(type(failure))
+        return formatter(failure) if formatter is not None else self._fallback
+
+    def failure_lines(self, failures: "Sequence[ValidationFailure]") -> list[str]:
+        """Return one "  - <message>" log line per failure, without newlines."""
+        return [f"  - {self.failure_message(f)}" for f in failures]
+
+    def format_failures(self, failures: "Sequence[ValidationFailure]") -> str:
+        """Return the log lines of failures as one string, one line per failure."""
+        return "".join(f"  - {self.failure_message(f)}\n" for f in failures)
+
+
+@cache
+def load_messages(language: Language = DEFAULT_LANGUAGE) -> MessageCatalogue:
+    """Return the catalogue of a language, importing its module on first use.
+
+    Args:
+        language: Language to load.
+
+    Returns:
+        The CATALOGUE of cli.messages_<language code>.
+
+    """
+    module = importlib.import_module(f"cli.messages_{language.value}")
+    return module.CATALOGUE
@@ -2,11 +2,14 @@
 
 Used by the CLI log so non-technical users can understand what is wrong
 with each filename. Does not modify failure classes; only reads their
-attributes to build messages.
+attributes to build messages. This is the default catalogue (see
+cli.messages); messages_es and messages_en hold the same keys.
 """
 
 from collections.abc import Callable, Sequence
+from typing import TypeVar
 
+from cli.messages import Language, MessageCatalogue
 from string_checker.failures.base import ValidationFailure
 from string_checker.rules.folder_name.failures import InvalidFolderNameFailure
 from string_checker.rules.folder_valid_chars.failures import (
@@ -27,62 +30,152 @@ MSG_FILES_WITH_ERRORS = "{n} fitxers amb errors."
 MSG_FOLDERS_VALIDATED = "Validades {n} carpetes."
 MSG_FOLDERS_WITH_ERRORS = "{n} carpetes amb errors."
 MSG_LOG_SAVED = "Log guardat a {path}."
+MSG_CACHE_STATS = (
+    "Memòria cau: {hits} carpetes reutilitzades, {misses} carpetes llistades."
+)
+MSG_REQUEST_STATS = (
+    "Google Drive: {retries} peticions repetides, "
+    "{waits} esperes pel límit de peticions."
+)
+MSG_REQUEST_TIMING = (
+    "Google Drive: {n} peticions en {seconds:.1f} s ({average:.0f} ms per petició)."
+)
+MSG_CATALOGUE_COMPILED = "Catàleg compilat: {n} instruments a {path}."
+MSG_CATALOGUE_ERROR = "No s'ha pogut carregar el catàleg d'instruments: {error}"
+MSG_INCREMENTAL_FULL = "Sense estat previ: s'ha llistat tota la carpeta."
+MSG_INCREMENTAL_CHANGES = "{n} fitxers nous o reanomenats des de l'última execució."
+MSG_INCREMENTAL_STATE_INVALID = (
+    "L'estat incremental {path} no és vàlid ({error}). "
+    "Esborreu-lo per a fer una execució completa."
+)
+
+MSG_CONNECTION_ERROR = "Error de connexió amb Google Drive: {error}"
+MSG_DRIVE_ERROR = "Error de Google Drive: {error}"
+MSG_LOCAL_SCANNING = "Explorant el directori local {path}…"
+MSG_LOCAL_ERROR = "Error de lectura local: {error}"
+MSG_MANIFEST_READING = "Llegint el manifest {path}…"
+MSG_SOURCE_REQUIRED = (
+    "Indiqueu una sola font: una carpeta de Google Drive (--folder-id), un "
+    "directori local (--path) o un manifest (--manifest)."
+)
+MSG_INCREMENTAL_REQUIRES_FOLDER = "--incremental només funciona amb --folder-id."
+MSG_INCREMENTAL_LISTING_OPTIONS = (
+    "--incremental no usa --strategy batched, --cache ni --refresh: llista amb "
+    "el canal de canvis de Drive."
+)
+MSG_RESUME_REQUIRES_FOLDER = (
+    "--resume només funciona amb --folder-id i sense --incremental."
+)
+MSG_ASYNC_REQUIRES_FOLDER = (
+    "--async només funciona amb --folder-id i sense --incremental ni --resume."
+)
+MSG_RESUME_CONTINUING = (
+    "Continuant l'execució interrompuda: {n} fitxers ja validats, "
+    "{folders} carpetes pendents."
+)
+MSG_RESUME_INVALID = (
+    "El punt de control {path} no és vàlid ({error}). "
+    "Esborreu-lo per a començar de nou."
+)
+
+_F = TypeVar("_F", bound=ValidationFailure)
 
 _FALLBACK_MESSAGE = "El nom del fitxer no compleix les regles de validació."
 
-_FormatterMap = list[tuple[type[ValidationFailure], Callable[[ValidationFailure], str]]]
-
-
-def _format_failure_message(failure: ValidationFailure) -> str | None:
-    """Return Valencian message for a known failure type, or None for fallback."""
-    formatters: _FormatterMap = [
-        (
-            InvalidFolderNameFailure,
-            lambda f: f"El nom de la carpeta no és vàlid: {f.message}",
-        ),
-        (
-            InvalidFolderCharacterFailure,
-            lambda f: (
-                f"Caràcter no permès al nom de la carpeta: «{f.char}» "
-                f"(posició {f.index + 1})."
-            ),
-        ),
-        (
-            InvalidCharacterFailure,
-            lambda f: f"Caràcter no permès: «{f.char}» (posició {f.index + 1}).",
-        ),
-        (
-            InvalidPrefixFailure,
-            lambda f: f"El prefix del nom no és vàlid: {f.message}",
-        ),
-        (
-            InstrumentNameMismatchFailure,
-            lambda f: (
-                f"El nom de l'instrument «{f.received_name}» no coincideix "
-                f"amb el del catàleg (s'esperava «{f.expected_name}»)."
-            ),
-        ),
-        (InvalidVoiceFailure, lambda f: f"La veu del bloc no és vàlida: {f.message}"),
-        (
-            NotPdfFailure,
-            lambda f: (
-                "El nom del fitxer ha d'acabar en .pdf."
-                if "empty" not in f.message.lower()
-                else "El nom del fitxer no pot estar buit; ha d'acabar en .pdf."
-            ),
-        ),
-    ]
-    for failure_type, formatter in formatters:
-        if isinstance(failure, failure_type):
-            return formatter(failure)
-    return None
+CATALOGUE = MessageCatalogue(
+    Language.CA,
+    {
+        "connected": MSG_CONNECTED,
+        "connection_error": MSG_CONNECTION_ERROR,
+        "drive_error": MSG_DRIVE_ERROR,
+        "local_scanning": MSG_LOCAL_SCANNING,
+        "local_error": MSG_LOCAL_ERROR,
+        "manifest_reading": MSG_MANIFEST_READING,
+        "source_required": MSG_SOURCE_REQUIRED,
+        "incremental_requires_folder": MSG_INCREMENTAL_REQUIRES_FOLDER,
+        "incremental_listing_options": MSG_INCREMENTAL_LISTING_OPTIONS,
+        "resume_requires_folder": MSG_RESUME_REQUIRES_FOLDER,
+        "resume_continuing": MSG_RESUME_CONTINUING,
+        "async_requires_folder": MSG_ASYNC_REQUIRES_FOLDER,
+        "resume_invalid": MSG_RESUME_INVALID,
+        "files_validated": MSG_FILES_VALIDATED,
+        "files_with_errors": MSG_FILES_WITH_ERRORS,
+        "folders_validated": MSG_FOLDERS_VALIDATED,
+        "folders_with_errors": MSG_FOLDERS_WITH_ERRORS,
+        "log_saved": MSG_LOG_SAVED,
+        "cache_stats": MSG_CACHE_STATS,
+        "request_stats": MSG_REQUEST_STATS,
+        "request_timing": MSG_REQUEST_TIMING,
+        "catalogue_compiled": MSG_CATALOGUE_COMPILED,
+        "catalogue_error": MSG_CATALOGUE_ERROR,
+        "incremental_full": MSG_INCREMENTAL_FULL,
+        "incremental_changes": MSG_INCREMENTAL_CHANGES,
+        "incremental_state_invalid": MSG_INCREMENTAL_STATE_INVALID,
+        "file_label": "Fitxer",
+        "folder_label": "Carpeta",
+    },
+    fallback=_FALLBACK_MESSAGE,
+)
+
+
+def register_message_ca(failure_type: type[_F], formatter: Callable[[_F], str]) -> None:
+    """Register the Valencian message formatter of a failure type.
+
+    Subclasses of failure_type without a formatter of their own use it too.
+    Registering a type again replaces its formatter. Rule packages call this
+    to give their failures a message in the log.
+
+    Args:
+        failure_type: Concrete (or base) failure class.
+        formatter: Returns the single-line Valencian message of a failure.
+
+    """
+    CATALOGUE.register(failure_type, formatter)
+
+
+def _format_not_pdf(failure: NotPdfFailure) -> str:
+    if "empty" in failure.message.lower():
+        return "El nom del fitxer no pot estar buit; ha d'acabar en .pdf."
+    return "El nom del fitxer ha d'acabar en .pdf."
+
+
+CATALOGUE.register(
+    InvalidFolderNameFailure,
+    lambda f: f"El nom de la carpeta no és vàlid: {f.message}",
+)
+CATALOGUE.register(
+    InvalidFolderCharacterFailure,
+    lambda f: (
+        f"Caràcter no permès al nom de la carpeta: «{f.char}» (posició {f.index + 1})."
+    ),
+)
+CATALOGUE.register(
+    InvalidCharacterFailure,
+    lambda f: f"Caràcter no permès: «{f.char}» (posició {f.index + 1}).",
+)
+CATALOGUE.register(
+    InvalidPrefixFailure,
+    lambda f: f"El prefix del nom no és vàlid: {f.message}",
+)
+CATALOGUE.register(
+    InstrumentNameMismatchFailure,
+    lambda f: (
+        f"El nom de l'instrument «{f.received_name}» no coincideix "
+        f"amb el del catàleg (s'esperava «{f.expected_name}»)."
+    ),
+)
+CATALOGUE.register(
+    InvalidVoiceFailure, lambda f: f"La veu del bloc no és vàlida: {f.message}"
+)
+CATALOGUE.register(NotPdfFailure, _format_not_pdf)
 
 
 def failure_to_message_ca(failure: ValidationFailure) -> str:
     """Return a short, clear message in Valencian for the given failure.
 
-    Dispatches on the concrete failure type and formats a non-technical
-    description. Unknown failure types get a generic fallback message.
+    Looks up the formatter registered for the failure's type (or its
+    nearest registered base class, see register_message_ca). Unknown
+    failure types get a generic fallback message.
 
     Args:
         failure: A validation failure from the checker.
@@ -91,8 +184,7 @@ def failure_to_message_ca(failure: ValidationFailure) -> str:
         A single-line message in Valencian.
 
     """
-    msg = _format_failure_message(failure)
-    return msg if msg is not None else _FALLBACK_MESSAGE
+    return CATALOGUE.failure_message(failure)
 
 
 def failures_to_lines_ca(failures: Sequence[ValidationFailure]) -> list[str]:
@@ -108,4 +200,20 @@ def failures_to_lines_ca(failures: Sequence[ValidationFailure]) -> list[str]:
         List of lines to write to the log (without trailing newlines).
 
     """
-    return [f"  - {failure_to_message_ca(f)}" for f in failures]
+    return CATALOGUE.failure_lines(failures)
+
+
+def format_failures_ca(failures: Sequence[ValidationFailure]) -> str:
+    """Render the log lines of a sequence of failures as one string.
+
+    Equivalent to joining failures_to_lines_ca(failures) with a newline
+    after each line.
+
+    Args:
+        failures: Sequence of validation failures for one file.
+
+    Returns:
+        The lines, each ending in a newline ("" for no failures).
+
+    """
+    return CATALOGUE.format_failures(failures)
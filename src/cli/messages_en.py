@@ -0,0 +1,114 @@
+"""Translate validation failures to human-readable messages in English.
+
+Same keys and failure types as messages_ca; loaded by cli.messages only
+when --lang en is used.
+"""
+
+from cli.messages import Language, MessageCatalogue
+from string_checker.rules.folder_name.failures import InvalidFolderNameFailure
+from string_checker.rules.folder_valid_chars.failures import (
+    InvalidFolderCharacterFailure,
+)
+from string_checker.rules.instrument_name_match.failures import (
+    InstrumentNameMismatchFailure,
+)
+from string_checker.rules.pdf_extension.failures import NotPdfFailure
+from string_checker.rules.prefix.failures import InvalidPrefixFailure
+from string_checker.rules.valid_chars.failures import InvalidCharacterFailure
+from string_checker.rules.voice.failures import InvalidVoiceFailure
+
+CATALOGUE = MessageCatalogue(
+    Language.EN,
+    {
+        "connected": "Connected to Google Drive. Exploring the folder…",
+        "connection_error": "Could not connect to Google Drive: {error}",
+        "drive_error": "Google Drive error: {error}",
+        "local_scanning": "Exploring the local directory {path}…",
+        "local_error": "Local read error: {error}",
+        "manifest_reading": "Reading the manifest {path}…",
+        "source_required": (
+            "Give exactly one source: a Google Drive folder (--folder-id), a "
+            "local directory (--path) or a manifest (--manifest)."
+        ),
+        "incremental_requires_folder": "--incremental only works with --folder-id.",
+        "incremental_listing_options": (
+            "--incremental does not use --strategy batched, --cache or --refresh: "
+            "it lists through the Drive changes feed."
+        ),
+        "resume_requires_folder": (
+            "--resume only works with --folder-id and without --incremental."
+        ),
+        "async_requires_folder": (
+            "--async only works with --folder-id and without --incremental or --resume."
+        ),
+        "resume_continuing": (
+            "Continuing the interrupted run: {n} files already validated, "
+            "{folders} folders pending."
+        ),
+        "resume_invalid": (
+            "The checkpoint {path} is not valid ({error}). Delete it to start over."
+        ),
+        "files_validated": "Validated {n} files.",
+        "files_with_errors": "{n} files with errors.",
+        "folders_validated": "Validated {n} folders.",
+        "folders_with_errors": "{n} folders with errors.",
+        "log_saved": "Log saved to {path}.",
+        "cache_stats": "Cache: {hits} folders reused, {misses} folders listed.",
+        "request_stats": (
+            "Google Drive: {retries} requests retried, {waits} rate-limit waits."
+        ),
+        "request_timing": (
+            "Google Drive: {n} requests in {seconds:.1f} s "
+            "({average:.0f} ms per request)."
+        ),
+        "catalogue_compiled": "Compiled catalogue: {n} instruments in {path}.",
+        "catalogue_error": "Could not load the instrument catalogue: {error}",
+        "incremental_full": "No previous state: the whole folder was listed.",
+        "incremental_changes": "{n} files new or renamed since the last run.",
+        "incremental_state_invalid": (
+            "The incremental state {path} is not valid ({error}). "
+            "Delete it to run a full validation."
+        ),
+        "file_label": "File",
+        "folder_label": "Folder",
+    },
+    fallback="The file name does not follow the validation rules.",
+)
+
+
+def _format_not_pdf(failure: NotPdfFailure) -> str:
+    if "empty" in failure.message.lower():
+        return "The file name cannot be empty; it must end in .pdf."
+    return "The file name must end in .pdf."
+
+
+CATALOGUE.register(
+    InvalidFolderNameFailure,
+    lambda f: f"The folder name is not valid: {f.message}",
+)
+CATALOGUE.register(
+    InvalidFolderCharacterFailure,
+    lambda f: (
+        f"Character not allowed in the folder name: «{f.char}» "
+        f"(position {f.index + 1})."
+    ),
+)
+CATALOGUE.register(
+    InvalidCharacterFailure,
+    lambda f: f"Character not allowed: «{f.char}» (position {f.index + 1}).",
+)
+CATALOGUE.register(
+    InvalidPrefixFailure,
+    lambda f: f"The name prefix is not valid: {f.message}",
+)
+CATALOGUE.register(
+    InstrumentNameMismatchFailure,
+    lambda f: (
+        f"The instrument name «{f.received_name}» does not match the "
+        f"catalogue (expected «{f.expected_name}»)."
+    ),
+)
+CATALOGUE.register(
+    InvalidVoiceFailure, lambda f: f"The block voice is not valid: {f.message}"
+)
+CATALOGUE.register(NotPdfFailure, _format_not_pdf)
@@ -0,0 +1,122 @@
+"""Translate validation failures to human-readable messages in Spanish.
+
+Same keys and failure types as messages_ca; loaded by cli.messages only
+when --lang es is used.
+"""
+
+from cli.messages import Language, MessageCatalogue
+from string_checker.rules.folder_name.failures import InvalidFolderNameFailure
+from string_checker.rules.folder_valid_chars.failures import (
+    InvalidFolderCharacterFailure,
+)
+from string_checker.rules.instrument_name_match.failures import (
+    InstrumentNameMismatchFailure,
+)
+from string_checker.rules.pdf_extension.failures import NotPdfFailure
+from string_checker.rules.prefix.failures import InvalidPrefixFailure
+from string_checker.rules.valid_chars.failures import InvalidCharacterFailure
+from string_checker.rules.voice.failures import InvalidVoiceFailure
+
+CATALOGUE = MessageCatalogue(
+    Language.ES,
+    {
+        "connected": "Conectado a Google Drive. Explorando la carpeta…",
+        "connection_error": "Error de conexión con Google Drive: {error}",
+        "drive_error": "Error de Google Drive: {error}",
+        "local_scanning": "Explorando el directorio local {path}…",
+        "local_error": "Error de lectura local: {error}",
+        "manifest_reading": "Leyendo el manifiesto {path}…",
+        "source_required": (
+            "Indique una sola fuente: una carpeta de Google Drive (--folder-id), "
+            "un directorio local (--path) o un manifiesto (--manifest)."
+        ),
+        "incremental_requires_folder": "--incremental solo funciona con --folder-id.",
+        "incremental_listing_options": (
+            "--incremental no usa --strategy batched, --cache ni --refresh: lista "
+            "con el feed de cambios de Drive."
+        ),
+        "resume_requires_folder": (
+            "--resume solo funciona con --folder-id y sin --incremental."
+        ),
+        "async_requires_folder": (
+            "--async solo funciona con --folder-id y sin --incremental ni --resume."
+        ),
+        "resume_continuing": (
+            "Continuando la ejecución interrumpida: {n} archivos ya validados, "
+            "{folders} carpetas pendientes."
+        ),
+        "resume_invalid": (
+            "El punto de control {path} no es válido ({error}). "
+            "Bórrelo para empezar de nuevo."
+        ),
+        "files_validated": "Validados {n} archivos.",
+        "files_with_errors": "{n} archivos con errores.",
+        "folders_validated": "Validadas {n} carpetas.",
+        "folders_with_errors": "{n} carpetas con errores.",
+        "log_saved": "Log guardado en {path}.",
+        "cache_stats": (
+            "Caché: {hits} carpetas reutilizadas, {misses} carpetas listadas."
+        ),
+        "request_stats": (
+            "Google Drive: {retries} peticiones repetidas, "
+            "{waits} esperas por el límite de peticiones."
+        ),
+        "request_timing": (
+            "Google Drive: {n} peticiones en {seconds:.1f} s "
+            "({average:.0f} ms por petición)."
+        ),
+        "catalogue_compiled": "Catálogo compilado: {n} instrumentos en {path}.",
+        "catalogue_error": (
+            "No se ha podido cargar el catálogo de instrumentos: {error}"
+        ),
+        "incremental_full": "Sin estado previo: se ha listado toda la carpeta.",
+        "incremental_changes": (
+            "{n} archivos nuevos o renombrados desde la última ejecución."
+        ),
+        "incremental_state_invalid": (
+            "El estado incremental {path} no es válido ({error}). "
+            "Bórrelo para hacer una ejecución completa."
+        ),
+        "file_label": "Archivo",
+        "folder_label": "Carpeta",
+    },
+    fallback="El nombre del archivo no cumple las reglas de validación.",
+)
+
+
+def _format_not_pdf(failure: NotPdfFailure) -> str:
+    if "empty" in failure.message.lower():
+        return "El nombre del archivo no puede estar vacío; debe terminar en .pdf."
+    return "El nombre del archivo debe terminar en .pdf."
+
+
+CATALOGUE.register(
+    InvalidFolderNameFailure,
+    lambda f: f"El nombre de la carpeta no es válido: {f.message}",
+)
+CATALOGUE.register(
+    InvalidFolderCharacterFailure,
+    lambda f: (
+        f"Carácter no permitido en el nombre de la carpeta: «{f.char}» "
+        f"(posición {f.index + 1})."
+    ),
+)
+CATALOGUE.register(
+    InvalidCharacterFailure,
+    lambda f: f"Carácter no permitido: «{f.char}» (posición {f.index + 1}).",
+)
+CATALOGUE.register(
+    InvalidPrefixFailure,
+    lambda f: f"El prefijo del nombre no es válido: {f.message}",
+)
+CATALOGUE.register(
+    InstrumentNameMismatchFailure,
+    lambda f: (
+        f"El nombre del instrumento «{f.received_name}» no coincide "
+        f"con el del catálogo (se esperaba «{f.expected_name}»)."
+    ),
+)
+CATALOGUE.register(
+    InvalidVoiceFailure, lambda f: f"La voz del bloque no es válida: {f.message}"
+)
+CATALOGUE.register(NotPdfFailure, _format_not_pdf)
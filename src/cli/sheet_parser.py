@@ -3,37 +3,47 @@
 Loads .env for credential paths, connects to Drive, runs the string_checker
 on each file name, and optionally writes a human-readable log in Valencian.
 The log file is only created when the run completes successfully (no
-credential or API errors).
+credential or API errors). With --incremental, only files added or renamed
+since the previous run (plus the ones that failed then) are validated.
+With --resume, the listing position is checkpointed so that a failed run
+can continue where it stopped. With --async, Drive is listed by the asyncio
+client (see drive_connection.aio) instead of threads.
+With --path or --manifest, a local directory or an exported listing is
+validated instead, without credentials (see cli.sources).
 """
 
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
-from returns.result import Failure
 from typer import Option, Typer, echo
 
-from cli.messages_ca import (
-    MSG_CONNECTED,
-    MSG_FILES_VALIDATED,
-    MSG_FILES_WITH_ERRORS,
-    MSG_LOG_SAVED,
-    failures_to_lines_ca,
-)
+from cli.log_writer import LogWriter, OutputFormat
+from cli.messages import DEFAULT_LANGUAGE, Language, MessageCatalogue, load_messages
 from drive_connection import (
+    DEFAULT_CACHE_MAX_AGE,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    CrawlCheckpoint,
     DriveConnectionError,
-    list_file_names,
-    load_credentials_and_build_service,
-)
-from string_checker import (
-    Checker,
-    InstrumentCatalogue,
-    InstrumentNameMatchRule,
-    PdfExtensionRule,
-    PrefixRule,
-    ValidCharsRule,
-    VoiceRule,
+    DriveMetadataCache,
+    DriveSnapshot,
+    ListingStrategy,
+    ServicePool,
+    apply_changes,
+    build_service,
+    build_snapshot,
+    get_cache_path,
+    get_request_executor,
+    load_credentials,
 )
 
+if TYPE_CHECKING:
+    from cli.sources import FileSource
+    from drive_connection.aio import AsyncDriveClient
+    from string_checker import Checker, InstrumentCatalogue
+
 app = Typer(
     help=(
         "Valida els noms dels fitxers d'una carpeta de Google Drive "
@@ -41,17 +51,172 @@ app = Typer(
     ),
 )
 
+_FOLDER_ID_OPTION = Option(
+    None,
+    "--folder-id",
+    help="ID de la carpeta de Google Drive a explorar.",
+)
+_PATH_OPTION = Option(
+    None,
+    "--path",
+    path_type=Path,
+    file_okay=False,
+    help=(
+        "Directori local a explorar en lloc d'una carpeta de Google Drive "
+        "(p. ex. una còpia de Google Drive per a ordinadors). No cal connexió."
+    ),
+)
+_MANIFEST_OPTION = Option(
+    None,
+    "--manifest",
+    path_type=Path,
+    dir_okay=False,
+    help=(
+        "Llistat exportat (.jsonl o .csv amb les columnes path i id, com els "
+        "logs jsonl i csv) amb els fitxers a validar. No cal connexió."
+    ),
+)
 _LOG_OPTION = Option(
     None,
     "--log",
     path_type=Path,
-    help="Fitxer del log (valencià). Es crea si no existeix.",
+    help="Fitxer del log (vegeu --format). Es crea si no existeix.",
+)
+_FORMAT_OPTION = Option(
+    OutputFormat.TEXT,
+    "--format",
+    help=(
+        "Format del log: text (valencià), jsonl (un objecte JSON per fitxer "
+        "amb errors) o csv (una fila per error)."
+    ),
+)
+_LANG_OPTION = Option(
+    DEFAULT_LANGUAGE,
+    "--lang",
+    help="Idioma dels missatges i del log: ca (valencià), es o en.",
+)
+_WORKERS_OPTION = Option(
+    1,
+    "--workers",
+    "-w",
+    min=1,
+    help="Nombre de processos per a validar els noms (1 = sense paral·lelisme).",
+)
+_CONCURRENCY_OPTION = Option(
+    1,
+    "--concurrency",
+    "-c",
+    min=1,
+    help=(
+        "Nombre màxim de carpetes (o directoris amb --path) llistats alhora "
+        "amb --recursive (1 = una darrere l'altra)."
+    ),
+)
+_PAGE_SIZE_OPTION = Option(
+    DEFAULT_PAGE_SIZE,
+    "--page-size",
+    min=1,
+    max=MAX_PAGE_SIZE,
+    help=(
+        "Fitxers per pàgina en cada consulta del llistat de Google Drive "
+        f"(màxim {MAX_PAGE_SIZE}). Amb menys, calen més peticions."
+    ),
+)
+_STRATEGY_OPTION = Option(
+    ListingStrategy.PER_FOLDER,
+    "--strategy",
+    help=(
+        "Estratègia de llistat amb --recursive: per-folder (una consulta per "
+        "carpeta) o batched (totes les carpetes primer i els fitxers en "
+        "consultes agrupades per lots de carpetes)."
+    ),
+)
+_CACHE_OPTION = Option(
+    False,
+    "--cache/--no-cache",
+    help=(
+        "Reutilitzar els llistats de carpetes no modificades des de l'última "
+        "execució (memòria cau local; vegeu FENTARXIU_CACHE_DB). Drive no "
+        "sempre marca la carpeta com a modificada quan s'hi afig o es "
+        "reanomena un fitxer: aquests canvis es perden com a molt durant "
+        "--cache-max-age hores."
+    ),
+)
+_REFRESH_OPTION = Option(
+    False,
+    "--refresh",
+    help="Tornar a llistar totes les carpetes i reconstruir la memòria cau.",
+)
+_CACHE_MAX_AGE_OPTION = Option(
+    DEFAULT_CACHE_MAX_AGE / 3600,
+    "--cache-max-age",
+    min=0,
+    help=(
+        "Hores que es reutilitza el llistat d'una carpeta de la memòria cau "
+        "encara que Drive no la marque com a modificada (0 = tornar a llistar-ho "
+        "tot)."
+    ),
+)
+_CATALOGUE_OPTION = Option(
+    None,
+    "--catalogue",
+    path_type=Path,
+    help=(
+        "Catàleg d'instruments (.csv, .json, .toml o compilat .fxcat) en lloc "
+        "del catàleg per defecte."
+    ),
+)
+_INCREMENTAL_OPTION = Option(
+    None,
+    "--incremental",
+    path_type=Path,
+    help=(
+        "Fitxer d'estat (JSON). Si existeix, només es validen els fitxers nous "
+        "o reanomenats des de l'última execució i els que tenien errors; "
+        "sempre inclou les subcarpetes. Si no existeix, es llista tot i es crea."
+    ),
+)
+_RESUME_OPTION = Option(
+    None,
+    "--resume",
+    path_type=Path,
+    dir_okay=False,
+    help=(
+        "Fitxer de punt de control (JSON). Es guarda la posició del llistat "
+        "mentre s'executa; si ja existeix d'una execució interrompuda de la "
+        "mateixa carpeta, es continua des d'allí. S'esborra en acabar."
+    ),
+)
+_ASYNC_OPTION = Option(
+    False,
+    "--async",
+    help=(
+        "Llistar Google Drive amb el client asíncron: --concurrency carpetes "
+        "alhora en un sol fil, sense memòria cau (p. ex. -c 100)."
+    ),
 )
 
 
-def _build_checker() -> Checker:
-    """Build a Checker with all five rules (including PdfExtensionRule)."""
-    catalogue = InstrumentCatalogue.default()
+def _build_checker(catalogue: "InstrumentCatalogue | None" = None) -> "Checker":
+    """Build a Checker with all five rules (including PdfExtensionRule).
+
+    Uses the default catalogue unless one is given. Part names repeat across
+    works, so results are memoized in a ResultCache. The checker and its
+    rules are imported here, so --help does not pay for them.
+    """
+    from string_checker import (
+        Checker,
+        InstrumentCatalogue,
+        InstrumentNameMatchRule,
+        PdfExtensionRule,
+        PrefixRule,
+        ResultCache,
+        ValidCharsRule,
+        VoiceRule,
+    )
+
+    if catalogue is None:
+        catalogue = InstrumentCatalogue.default()
     return Checker(
         rules=[
             ValidCharsRule(),
@@ -59,69 +224,352 @@ def _build_checker() -> Checker:
             InstrumentNameMatchRule(catalogue),
             VoiceRule(),
             PdfExtensionRule(),
-        ]
+        ],
+        cache=ResultCache(),
+    )
+
+
+def _open_cache(
+    *, use_cache: bool, refresh: bool, max_age_hours: float
+) -> AbstractContextManager[DriveMetadataCache | None]:
+    """Open the listing cache at get_cache_path(), or a no-op without it."""
+    if not use_cache:
+        return nullcontext()
+    return DriveMetadataCache(
+        get_cache_path(), refresh=refresh, max_age=max_age_hours * 3600
+    )
+
+
+def _connect(*, concurrency: int) -> object:
+    """Load credentials, build the Drive service and reset the request counters.
+
+    With concurrency > 1 each listing thread gets its own service and
+    connection from a ServicePool.
+    """
+    get_request_executor().reset_stats()
+    creds = load_credentials()
+    if concurrency > 1:
+        return ServicePool(creds)
+    return build_service(creds)
+
+
+def _connect_async(*, concurrency: int) -> "AsyncDriveClient":
+    """Load credentials, create the asyncio client and reset the request counters.
+
+    The client keeps up to concurrency connections open.
+    """
+    from drive_connection.aio import AsyncDriveClient
+
+    get_request_executor().reset_stats()
+    return AsyncDriveClient(load_credentials(), max_connections=concurrency)
+
+
+def _load_checkpoint(
+    folder_id: str, path: Path, *, recursive: bool, messages: MessageCatalogue
+) -> CrawlCheckpoint:
+    """Return the checkpoint at path if it is for this listing, else a new one."""
+    if path.is_file():
+        try:
+            checkpoint = CrawlCheckpoint.load(path)
+        except ValueError as e:
+            echo(messages.text("resume_invalid", path=path, error=e), err=True)
+            raise SystemExit(1) from e
+        if checkpoint.root_id == folder_id and checkpoint.recursive == recursive:
+            echo(
+                messages.text(
+                    "resume_continuing",
+                    n=checkpoint.total,
+                    folders=checkpoint.pending_folders,
+                )
+            )
+            return checkpoint
+    return CrawlCheckpoint.start(folder_id, recursive=recursive)
+
+
+def _file_source(
+    service: object,
+    folder_id: str | None,
+    *,
+    local_path: Path | None,
+    manifest_path: Path | None,
+    recursive: bool,
+    concurrency: int,
+    strategy: ListingStrategy,
+    cache: DriveMetadataCache | None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    checkpoint: CrawlCheckpoint | None = None,
+    resume_path: Path | None = None,
+    use_async: bool = False,
+) -> "FileSource":
+    """Return the source given on the command line: a manifest, a path or Drive."""
+    from cli.sources import (
+        AsyncDriveFileSource,
+        DriveFileSource,
+        LocalFileSource,
+        ManifestSource,
+        ResumableDriveSource,
+    )
+    from drive_connection import CheckpointedCrawl
+
+    if manifest_path is not None:
+        return ManifestSource(manifest_path)
+    if local_path is not None:
+        return LocalFileSource(local_path, recursive, concurrency)
+    if checkpoint is not None and resume_path is not None:
+        crawl = CheckpointedCrawl(
+            service,
+            checkpoint,
+            concurrency=concurrency,
+            cache=cache,
+            page_size=page_size,
+        )
+        return ResumableDriveSource(crawl, resume_path)
+    if use_async:
+        return AsyncDriveFileSource(
+            service, folder_id, recursive, concurrency, page_size
+        )
+    return DriveFileSource(
+        service, folder_id, recursive, concurrency, strategy, cache, page_size
     )
 
 
 def _run(
-    folder_id: str,
+    folder_id: str | None,
     *,
     recursive: bool,
     log_path: Path | None,
     verbose: bool,
+    workers: int = 1,
+    concurrency: int = 1,
+    strategy: ListingStrategy = ListingStrategy.PER_FOLDER,
+    use_cache: bool = False,
+    refresh: bool = False,
+    cache_max_age: float = DEFAULT_CACHE_MAX_AGE / 3600,
+    catalogue: "InstrumentCatalogue | None" = None,
+    output_format: OutputFormat = OutputFormat.TEXT,
+    messages: MessageCatalogue | None = None,
+    local_path: Path | None = None,
+    manifest_path: Path | None = None,
+    resume_path: Path | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    use_async: bool = False,
 ) -> None:
     """Connect to Drive, validate filenames, and optionally write the log.
 
-    On credential or API error, exits without creating or writing the log file.
+    With workers > 1, names are validated in batches across worker processes
+    while the listing continues; results keep the listing order. With
+    use_cache, unchanged folders are read from the local listing cache (not
+    used by the batched strategy).
+    With local_path or manifest_path, that directory or manifest is read
+    instead of folder_id, without connecting to Drive (strategy and the
+    cache do not apply).
+    With resume_path, the Drive listing is checkpointed to that file (the
+    per-folder strategy is used) and continued from it if it holds an
+    interrupted run of the same listing; it is removed once the run ends.
+    With use_async, Drive is listed by the asyncio client (per-folder
+    strategy, without the cache).
+    On credential, API or read error, exits without creating or writing the
+    log file.
     """
+    from cli.sources import echo_request_stats, validate_source
+
     load_dotenv()
+    messages = messages or load_messages()
+
+    service = None
+    if folder_id is not None:
+        try:
+            service = (
+                _connect_async(concurrency=concurrency)
+                if use_async
+                else _connect(concurrency=concurrency)
+            )
+        except DriveConnectionError as e:
+            echo(messages.text("connection_error", error=e), err=True)
+            raise SystemExit(1) from e
+        echo(messages.text("connected"))
+    elif manifest_path is not None:
+        echo(messages.text("manifest_reading", path=manifest_path))
+    else:
+        echo(messages.text("local_scanning", path=local_path))
+
+    checker = _build_checker(catalogue)
+    checkpoint = None
+    if resume_path is not None and folder_id is not None:
+        strategy = ListingStrategy.PER_FOLDER
+        checkpoint = _load_checkpoint(
+            folder_id, resume_path, recursive=recursive, messages=messages
+        )
+    use_cache = (
+        use_cache
+        and folder_id is not None
+        and strategy is ListingStrategy.PER_FOLDER
+        and not use_async
+    )
+
+    with (
+        _open_cache(
+            use_cache=use_cache, refresh=refresh, max_age_hours=cache_max_age
+        ) as cache,
+        LogWriter(
+            log_path, messages.text("file_label"), output_format, messages
+        ) as log,
+    ):
+        source = _file_source(
+            service,
+            folder_id,
+            local_path=local_path,
+            manifest_path=manifest_path,
+            recursive=recursive,
+            concurrency=concurrency,
+            strategy=strategy,
+            cache=cache,
+            page_size=page_size,
+            checkpoint=checkpoint,
+            resume_path=resume_path,
+            use_async=use_async,
+        )
+        total = validate_source(source, checker, log, workers=workers, verbose=verbose)
+        if cache is not None:
+            echo(messages.text("cache_stats", hits=cache.hits, misses=cache.misses))
+
+    if checkpoint is not None:
+        resume_path.unlink(missing_ok=True)
+    if service is not None:
+        echo_request_stats(messages)
+    echo(messages.text("files_validated", n=total))
+    if log.count:
+        echo(messages.text("files_with_errors", n=log.count))
+    if log_path is not None:
+        echo(messages.text("log_saved", path=log_path))
+
+
+def _load_catalogue(
+    path: Path | None, messages: MessageCatalogue
+) -> "InstrumentCatalogue | None":
+    """Load the catalogue file given with --catalogue, exiting on error."""
+    if path is None:
+        return None
+    from string_checker import CatalogueError, InstrumentCatalogue
 
     try:
-        service = load_credentials_and_build_service()
-    except DriveConnectionError as e:
-        echo(f"Error de connexió amb Google Drive: {e}", err=True)
+        return InstrumentCatalogue.from_file(path)
+    except CatalogueError as e:
+        echo(messages.text("catalogue_error", error=e), err=True)
         raise SystemExit(1) from e
 
-    echo(MSG_CONNECTED)
 
-    checker = _build_checker()
-    results: list[tuple[str, tuple]] = []  # (display_path, failures)
-    total = 0
+def _load_snapshot(
+    service: object,
+    folder_id: str,
+    state_path: Path,
+    messages: MessageCatalogue,
+    **listing: int,
+) -> tuple[DriveSnapshot, list[str]]:
+    """Return the up-to-date snapshot and the file IDs to validate.
+
+    Without a usable state for folder_id the whole tree is listed and every
+    file is validated; otherwise only changed and previously failing files.
+    listing (page_size, concurrency) is passed on to build_snapshot and
+    apply_changes.
+    """
+    if state_path.is_file():
+        snapshot = DriveSnapshot.load(state_path)
+        if snapshot.root_id == folder_id:
+            changed = apply_changes(service, snapshot, **listing)
+            echo(messages.text("incremental_changes", n=len(changed)))
+            to_check = set(changed).union(snapshot.failing)
+            return snapshot, [f for f in snapshot.files if f in to_check]
+    snapshot = build_snapshot(service, folder_id, **listing)
+    echo(messages.text("incremental_full"))
+    return snapshot, list(snapshot.files)
+
+
+def _run_incremental(
+    folder_id: str,
+    *,
+    state_path: Path,
+    log_path: Path | None,
+    verbose: bool,
+    workers: int = 1,
+    concurrency: int = 1,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    catalogue: "InstrumentCatalogue | None" = None,
+    output_format: OutputFormat = OutputFormat.TEXT,
+    messages: MessageCatalogue | None = None,
+) -> None:
+    """Validate only what changed since the run that wrote state_path.
+
+    The log lists every file that currently fails: previously failing files
+    are validated again with the changed ones. The state is only written
+    when the run completes, like the log. Folders that have to be listed
+    (all of them on the first run) are listed concurrency at a time, with
+    page_size files per page.
+    """
+    from returns.result import Failure
+
+    from cli.sources import echo_request_stats
+
+    load_dotenv()
+    messages = messages or load_messages()
 
     try:
-        for name, display_path in list_file_names(
-            service, folder_id, recursive=recursive
-        ):
+        service = _connect(concurrency=concurrency)
+    except DriveConnectionError as e:
+        echo(messages.text("connection_error", error=e), err=True)
+        raise SystemExit(1) from e
+
+    echo(messages.text("connected"))
+
+    try:
+        snapshot, file_ids = _load_snapshot(
+            service,
+            folder_id,
+            state_path,
+            messages,
+            page_size=page_size,
+            concurrency=concurrency,
+        )
+    except DriveConnectionError as e:
+        echo(messages.text("drive_error", error=e), err=True)
+        raise SystemExit(1) from e
+    except ValueError as e:
+        echo(
+            messages.text("incremental_state_invalid", path=state_path, error=e),
+            err=True,
+        )
+        raise SystemExit(1) from e
+
+    checker = _build_checker(catalogue)
+    failing: list[str] = []
+    names = (snapshot.files[file_id][0] for file_id in file_ids)
+    checked = zip(file_ids, checker.check_many(names, workers=workers), strict=True)
+    with LogWriter(
+        log_path, messages.text("file_label"), output_format, messages
+    ) as log:
+        for file_id, (_name, result) in checked:
+            display_path = snapshot.display_path(file_id)
             if verbose:
                 echo(display_path)
-            result = checker.check(name)
-            total += 1
             if isinstance(result, Failure):
-                results.append((display_path, result.failure()))
-    except DriveConnectionError as e:
-        echo(f"Error de Google Drive: {e}", err=True)
-        raise SystemExit(1) from e
+                failing.append(file_id)
+                log.write(display_path, result.failure(), file_id)
+        snapshot.failing = failing
+        snapshot.save(state_path)
 
-    echo(MSG_FILES_VALIDATED.format(n=total))
-    if results:
-        echo(MSG_FILES_WITH_ERRORS.format(n=len(results)))
+    echo_request_stats(messages)
+    echo(messages.text("files_validated", n=len(file_ids)))
+    if log.count:
+        echo(messages.text("files_with_errors", n=log.count))
     if log_path is not None:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("w", encoding="utf-8") as f:
-            for display_path, failures in results:
-                f.write(f"Fitxer: {display_path}\n")
-                f.writelines(line + "\n" for line in failures_to_lines_ca(failures))
-                f.write("\n")
-        echo(MSG_LOG_SAVED.format(path=log_path))
+        echo(messages.text("log_saved", path=log_path))
 
 
 @app.callback(invoke_without_command=True)
 def main(
-    folder_id: str = Option(
-        ...,
-        "--folder-id",
-        help="ID de la carpeta de Google Drive a explorar.",
-    ),
+    folder_id: str | None = _FOLDER_ID_OPTION,
+    path: Path | None = _PATH_OPTION,
+    manifest: Path | None = _MANIFEST_OPTION,
     recursive: bool = Option(
         False,
         "--recursive",
@@ -129,12 +577,80 @@ def main(
         help="Explorar les subcarpetes recursivament.",
     ),
     log: Path | None = _LOG_OPTION,
+    output_format: OutputFormat = _FORMAT_OPTION,
     verbose: bool = Option(
         False,
         "--verbose",
         "-v",
         help="Mostrar cada fitxer a mesura que es valida.",
     ),
+    workers: int = _WORKERS_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    strategy: ListingStrategy = _STRATEGY_OPTION,
+    page_size: int = _PAGE_SIZE_OPTION,
+    cache: bool = _CACHE_OPTION,
+    refresh: bool = _REFRESH_OPTION,
+    cache_max_age: float = _CACHE_MAX_AGE_OPTION,
+    incremental: Path | None = _INCREMENTAL_OPTION,
+    resume: Path | None = _RESUME_OPTION,
+    use_async: bool = _ASYNC_OPTION,
+    catalogue: Path | None = _CATALOGUE_OPTION,
+    lang: Language = _LANG_OPTION,
 ) -> None:
     """Valida els noms dels fitxers d'una carpeta de Google Drive."""
-    _run(folder_id, recursive=recursive, log_path=log, verbose=verbose)
+    messages = load_messages(lang)
+    sources = [folder_id, path, manifest]
+    if sum(source is not None for source in sources) != 1:
+        echo(messages.text("source_required"), err=True)
+        raise SystemExit(1)
+    if incremental is not None and folder_id is None:
+        echo(messages.text("incremental_requires_folder"), err=True)
+        raise SystemExit(1)
+    if incremental is not None and (
+        strategy is not ListingStrategy.PER_FOLDER or cache or refresh
+    ):
+        echo(messages.text("incremental_listing_options"), err=True)
+        raise SystemExit(1)
+    if resume is not None and (folder_id is None or incremental is not None):
+        echo(messages.text("resume_requires_folder"), err=True)
+        raise SystemExit(1)
+    if use_async and (
+        folder_id is None or incremental is not None or resume is not None
+    ):
+        echo(messages.text("async_requires_folder"), err=True)
+        raise SystemExit(1)
+    instrument_catalogue = _load_catalogue(catalogue, messages)
+    if incremental is not None and folder_id is not None:
+        _run_incremental(
+            folder_id,
+            state_path=incremental,
+            log_path=log,
+            verbose=verbose,
+            workers=workers,
+            concurrency=concurrency,
+            page_size=page_size,
+            catalogue=instrument_catalogue,
+            output_format=output_format,
+            messages=messages,
+        )
+        return
+    _run(
+        folder_id,
+        recursive=recursive,
+        log_path=log,
+        verbose=verbose,
+        workers=workers,
+        concurrency=concurrency,
+        strategy=strategy,
+        use_cache=cache,
+        refresh=refresh,
+        cache_max_age=cache_max_age,
+        catalogue=instrument_catalogue,
+        output_format=output_format,
+        messages=messages,
+        local_path=path,
+        manifest_path=manifest,
+        resume_path=resume,
+        page_size=page_size,
+        use_async=use_async,
+    )
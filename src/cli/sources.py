@@ -0,0 +1,376 @@
+"""Listing backends of the CLIs and the validation loop that consumes them.
+
+A FileSource yields the entries to validate (name, display path and ID)
+lazily and in log order. The CLIs build one from their options (a Drive
+folder, a local directory with --path, a manifest with --manifest) and
+pass it to validate_source, so the validation engine does not depend on
+the backend and can be driven from an exported listing without network
+access, e.g. in benchmarks. With --resume, a Drive listing is checkpointed
+(see ResumableDriveSource); with --async, it runs on an event loop (see
+AsyncDriveFileSource).
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import aclosing
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+from returns.result import Failure
+from typer import echo
+
+from cli.log_writer import LogWriter
+from drive_connection import (
+    DEFAULT_PAGE_SIZE,
+    CheckpointedCrawl,
+    DriveConnectionError,
+    DriveEntry,
+    DriveMetadataCache,
+    ListingStrategy,
+    get_request_executor,
+    list_file_entries,
+    list_subfolder_entries,
+)
+from local_connection import (
+    LocalConnectionError,
+    LocalEntry,
+    list_local_file_entries,
+    list_local_subfolder_entries,
+    read_manifest_entries,
+)
+
+if TYPE_CHECKING:
+    from cli.messages import MessageCatalogue
+    from drive_connection.aio import AsyncDriveClient
+    from string_checker import Checker
+
+SourceEntry = DriveEntry | LocalEntry
+
+# Seconds between checkpoint writes of a resumable listing.
+CHECKPOINT_INTERVAL = 10.0
+
+
+class FileSource(ABC):
+    """Abstract base for a backend that yields the entries to validate.
+
+    Subclasses implement ``entries``. ``errors`` are the exceptions it
+    raises when the backend fails; the CLIs report them with the
+    ``error_key`` message of their catalogue and exit without a log.
+    ``resumed`` counts entries validated by an earlier run that are not
+    yielded again.
+    """
+
+    errors: tuple[type[Exception], ...] = ()
+    error_key: str = "local_error"
+    resumed: int = 0
+
+    @abstractmethod
+    def entries(self) -> Iterator[SourceEntry]:
+        """Yield the entries to validate, in log order."""
+        ...
+
+    def validated(self, entry: SourceEntry, *, failed: bool) -> None:  # noqa: B027
+        """Record that entry was validated (called in log order); no-op here."""
+
+    def interrupted(self) -> None:  # noqa: B027
+        """Handle the user stopping the run (Ctrl+C); no-op here."""
+
+
+@attrs.define
+class DriveFileSource(FileSource):
+    """Files under a Drive folder (see list_file_entries)."""
+
+    service: object
+    folder_id: str
+    recursive: bool = False
+    concurrency: int = 1
+    strategy: ListingStrategy = ListingStrategy.PER_FOLDER
+    cache: DriveMetadataCache | None = None
+    page_size: int = DEFAULT_PAGE_SIZE
+    errors = (DriveConnectionError,)
+    error_key = "drive_error"
+
+    def entries(self) -> Iterator[DriveEntry]:
+        """Yield the files of folder_id, and of its subfolders if recursive."""
+        return list_file_entries(
+            self.service,
+            self.folder_id,
+            recursive=self.recursive,
+            concurrency=self.concurrency,
+            strategy=self.strategy,
+            cache=self.cache,
+            page_size=self.page_size,
+        )
+
+
+@attrs.define
+class DriveFolderSource(FileSource):
+    """Direct subfolders of Drive folders (see list_subfolder_entries)."""
+
+    service: object
+    folder_ids: list[str]
+    cache: DriveMetadataCache | None = None
+    page_size: int = DEFAULT_PAGE_SIZE
+    errors = (DriveConnectionError,)
+    error_key = "drive_error"
+
+    def entries(self) -> Iterator[DriveEntry]:
+        """Yield the subfolders of each folder, folder after folder."""
+        for folder_id in self.folder_ids:
+            yield from list_subfolder_entries(
+                self.service, folder_id, cache=self.cache, page_size=self.page_size
+            )
+
+
+@attrs.define
+class AsyncDriveFileSource(FileSource):
+    """Files under a Drive folder, listed by the asyncio client.
+
+    See alist_file_entries; the client is closed when the listing ends.
+    """
+
+    client: "AsyncDriveClient"
+    folder_id: str
+    recursive: bool = False
+    concurrency: int = 1
+    page_size: int = DEFAULT_PAGE_SIZE
+    errors = (DriveConnectionError,)
+    error_key = "drive_error"
+
+    def entries(self) -> Iterator[DriveEntry]:
+        """Yield the files of folder_id, and of its subfolders if recursive."""
+        from drive_connection.aio import alist_file_entries, iter_blocking
+
+        async def listing() -> AsyncIterator[DriveEntry]:
+            async with (
+                self.client,
+                aclosing(
+                    alist_file_entries(
+                        self.client,
+                        self.folder_id,
+                        recursive=self.recursive,
+                        concurrency=self.concurrency,
+                        page_size=self.page_size,
+                    )
+                ) as entries,
+            ):
+                async for entry in entries:
+                    yield entry
+
+        return iter_blocking(listing)
+
+
+@attrs.define
+class AsyncDriveFolderSource(FileSource):
+    """Direct subfolders of Drive folders, listed by the asyncio client.
+
+    See alist_subfolder_entries_many: up to concurrency folders are
+    listed at once. The client is closed when the listing ends.
+    """
+
+    client: "AsyncDriveClient"
+    folder_ids: list[str]
+    concurrency: int = 1
+    page_size: int = DEFAULT_PAGE_SIZE
+    errors = (DriveConnectionError,)
+    error_key = "drive_error"
+
+    def entries(self) -> Iterator[DriveEntry]:
+        """Yield the subfolders of each folder, folder after folder."""
+        from drive_connection.aio import alist_subfolder_entries_many, iter_blocking
+
+        async def listing() -> AsyncIterator[DriveEntry]:
+            async with (
+                self.client,
+                aclosing(
+                    alist_subfolder_entries_many(
+                        self.client,
+                        self.folder_ids,
+                        concurrency=self.concurrency,
+                        page_size=self.page_size,
+                    )
+                ) as entries,
+            ):
+                async for entry in entries:
+                    yield entry
+
+        return iter_blocking(listing)
+
+
+@attrs.define
+class ResumableDriveSource(FileSource):
+    """Files under a Drive folder, listed with a checkpoint file.
+
+    The crawl position (see CheckpointedCrawl) is written to path every
+    interval seconds, when the listing fails and when the user stops the
+    run, so a later run can pass the loaded checkpoint to continue. The
+    caller removes path once the run completes.
+    """
+
+    crawl: CheckpointedCrawl
+    path: Path
+    interval: float = CHECKPOINT_INTERVAL
+    errors = (DriveConnectionError,)
+    error_key = "drive_error"
+    _saved_at: float = attrs.field(init=False, factory=time.monotonic)
+
+    @property
+    def resumed(self) -> int:
+        """Return the files validated by the runs before the checkpoint."""
+        return self.crawl.resumed
+
+    def entries(self) -> Iterator[DriveEntry]:
+        """Yield the files of the crawl, saving the checkpoint on failure."""
+        try:
+            yield from self.crawl.entries()
+        except DriveConnectionError:
+            self.save()
+            raise
+
+    def validated(self, entry: SourceEntry, *, failed: bool) -> None:
+        """Record the entry in the crawl and save when interval has passed."""
+        self.crawl.validated(entry, failed=failed)
+        if time.monotonic() - self._saved_at >= self.interval:
+            self.save()
+
+    def interrupted(self) -> None:
+        """Save the checkpoint, so the run continues from where it stopped."""
+        self.save()
+
+    def save(self) -> None:
+        """Write the checkpoint of the entries validated so far to path."""
+        self.crawl.checkpoint().save(self.path)
+        self._saved_at = time.monotonic()
+
+
+@attrs.define
+class LocalFileSource(FileSource):
+    """Files under a local directory (see list_local_file_entries)."""
+
+    root: Path
+    recursive: bool = False
+    concurrency: int = 1
+    errors = (LocalConnectionError,)
+
+    def entries(self) -> Iterator[LocalEntry]:
+        """Yield the files of root, and of its subdirectories if recursive."""
+        return list_local_file_entries(
+            self.root, recursive=self.recursive, concurrency=self.concurrency
+        )
+
+
+@attrs.define
+class LocalFolderSource(FileSource):
+    """Direct subdirectories of local directories."""
+
+    roots: list[Path]
+    errors = (LocalConnectionError,)
+
+    def entries(self) -> Iterator[LocalEntry]:
+        """Yield the subdirectories of each root, root after root."""
+        for root in self.roots:
+            yield from list_local_subfolder_entries(root)
+
+
+@attrs.define
+class ManifestSource(FileSource):
+    """Records of a JSONL or CSV manifest (see read_manifest_entries).
+
+    The records are validated as files or folders depending on the CLI.
+    """
+
+    path: Path
+    errors = (LocalConnectionError,)
+
+    def entries(self) -> Iterator[LocalEntry]:
+        """Yield the manifest records in file order."""
+        return read_manifest_entries(self.path)
+
+
+def validate_source(
+    source: FileSource,
+    checker: "Checker",
+    log: LogWriter,
+    *,
+    workers: int = 1,
+    verbose: bool = False,
+) -> int:
+    """Validate the name of every entry of source, logging the failing ones.
+
+    Entries are listed as the checker consumes them, so listing and
+    validation overlap; with workers > 1, names are validated in batches
+    across worker processes and results keep the listing order. A backend
+    error is reported with the source's error_key message (in the log's
+    language) and ends the run with SystemExit(1), so the log is not
+    published. A KeyboardInterrupt is passed on after source.interrupted().
+
+    Args:
+        source: Backend listing the entries.
+        checker: Checker for the names.
+        log: Open writer receiving the failing entries.
+        workers: Worker processes for check_many.
+        verbose: Print each display path as it is listed.
+
+    Returns:
+        The number of entries validated, plus source.resumed.
+
+    Raises:
+        SystemExit: If the source raises one of its errors.
+
+    """
+    # check_many yields results in input order: one entry is queued per
+    # name and popped per result.
+    pending: deque[SourceEntry] = deque()
+
+    def names() -> Iterator[str]:
+        for entry in source.entries():
+            if verbose:
+                echo(entry.display_path)
+            pending.append(entry)
+            yield entry.name
+
+    total = source.resumed
+    try:
+        for _name, result in checker.check_many(names(), workers=workers):
+            entry = pending.popleft()
+            total += 1
+            failed = isinstance(result, Failure)
+            if failed:
+                log.write(entry.display_path, result.failure(), entry.file_id)
+            source.validated(entry, failed=failed)
+    except source.errors as e:
+        echo(log.messages.text(source.error_key, error=e), err=True)
+        raise SystemExit(1) from e
+    except KeyboardInterrupt:
+        source.interrupted()
+        raise
+    return total
+
+
+def echo_request_stats(messages: "MessageCatalogue") -> None:
+    """Report the count, time, retries and rate-limit waits of Drive requests.
+
+    Both CLIs call it after a run that connected to Drive; the figures are
+    those of the shared RequestExecutor since its last reset_stats.
+    """
+    executor = get_request_executor()
+    if executor.requests:
+        echo(
+            messages.text(
+                "request_timing",
+                n=executor.requests,
+                seconds=executor.request_seconds,
+                average=1000 * executor.request_seconds / executor.requests,
+            )
+        )
+    if executor.retries or executor.throttle_waits:
+        echo(
+            messages.text(
+                "request_stats",
+                retries=executor.retries,
+                waits=executor.throttle_waits,
+            )
+        )
@@ -2,28 +2,38 @@
 
 Accepts a list of Drive folder IDs, lists direct child folders (no recursion),
 validates each folder name against WorkName_Author+..._Arranger+..., and
-optionally writes a human-readable log in Valencian.
+optionally writes a human-readable log in Valencian. With --path, the
+subdirectories of local directories are validated instead, and with
+--manifest the folders of an exported listing, without credentials (see
+cli.sources). With --async, Drive is listed by the asyncio client (see
+drive_connection.aio).
 """
 
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
-from returns.result import Failure
 from typer import Option, Typer, echo
 
-from cli.messages_ca import (
-    MSG_CONNECTED,
-    MSG_FOLDERS_VALIDATED,
-    MSG_FOLDERS_WITH_ERRORS,
-    MSG_LOG_SAVED,
-    failures_to_lines_ca,
-)
+from cli.log_writer import LogWriter, OutputFormat
+from cli.messages import DEFAULT_LANGUAGE, Language, MessageCatalogue, load_messages
 from drive_connection import (
+    DEFAULT_CACHE_MAX_AGE,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
     DriveConnectionError,
-    list_subfolder_names,
+    DriveMetadataCache,
+    get_cache_path,
+    get_request_executor,
+    load_credentials,
     load_credentials_and_build_service,
 )
-from string_checker import Checker, FolderNameRule, FolderValidCharsRule
+
+if TYPE_CHECKING:
+    from cli.sources import FileSource
+    from drive_connection.aio import AsyncDriveClient
+    from string_checker import Checker
 
 app = Typer(
     help=(
@@ -36,22 +46,118 @@ _LOG_OPTION = Option(
     None,
     "--log",
     path_type=Path,
-    help="Fitxer del log (valencià). Es crea si no existeix.",
+    help="Fitxer del log (vegeu --format). Es crea si no existeix.",
+)
+_FORMAT_OPTION = Option(
+    OutputFormat.TEXT,
+    "--format",
+    help=(
+        "Format del log: text (valencià), jsonl (un objecte JSON per carpeta "
+        "amb errors) o csv (una fila per error)."
+    ),
+)
+_LANG_OPTION = Option(
+    DEFAULT_LANGUAGE,
+    "--lang",
+    help="Idioma dels missatges i del log: ca (valencià), es o en.",
 )
 _FOLDER_ID_OPTION = Option(
-    ...,
+    None,
     "--folder-id",
     help="ID de la carpeta de Google Drive. Es pot repetir per diverses carpetes.",
 )
+_PATH_OPTION = Option(
+    None,
+    "--path",
+    path_type=Path,
+    file_okay=False,
+    help=(
+        "Directori local en lloc d'una carpeta de Google Drive; es validen "
+        "els seus subdirectoris. Es pot repetir. No cal connexió."
+    ),
+)
+_MANIFEST_OPTION = Option(
+    None,
+    "--manifest",
+    path_type=Path,
+    dir_okay=False,
+    help=(
+        "Llistat exportat (.jsonl o .csv amb les columnes path i id, com els "
+        "logs jsonl i csv) amb les carpetes a validar. No cal connexió."
+    ),
+)
 _VERBOSE_OPTION = Option(
     False,
     "--verbose",
     "-v",
     help="Mostrar cada carpeta a mesura que es valida.",
 )
+_WORKERS_OPTION = Option(
+    1,
+    "--workers",
+    "-w",
+    min=1,
+    help="Nombre de processos per a validar els noms (1 = sense paral·lelisme).",
+)
+_CONCURRENCY_OPTION = Option(
+    1,
+    "--concurrency",
+    "-c",
+    min=1,
+    help=(
+        "Nombre màxim de carpetes de --folder-id llistades alhora amb --async "
+        "(1 = una darrere l'altra)."
+    ),
+)
+_PAGE_SIZE_OPTION = Option(
+    DEFAULT_PAGE_SIZE,
+    "--page-size",
+    min=1,
+    max=MAX_PAGE_SIZE,
+    help=(
+        "Carpetes per pàgina en cada consulta a Google Drive "
+        f"(màxim {MAX_PAGE_SIZE}). Amb menys, calen més peticions."
+    ),
+)
+_CACHE_OPTION = Option(
+    False,
+    "--cache/--no-cache",
+    help=(
+        "Reutilitzar els llistats de carpetes no modificades des de l'última "
+        "execució (memòria cau local; vegeu FENTARXIU_CACHE_DB). Drive no "
+        "sempre marca la carpeta com a modificada quan s'hi afig o es "
+        "reanomena un fitxer: aquests canvis es perden com a molt durant "
+        "--cache-max-age hores."
+    ),
+)
+_REFRESH_OPTION = Option(
+    False,
+    "--refresh",
+    help="Tornar a llistar totes les carpetes i reconstruir la memòria cau.",
+)
+_CACHE_MAX_AGE_OPTION = Option(
+    DEFAULT_CACHE_MAX_AGE / 3600,
+    "--cache-max-age",
+    min=0,
+    help=(
+        "Hores que es reutilitza el llistat d'una carpeta de la memòria cau "
+        "encara que Drive no la marque com a modificada (0 = tornar a llistar-ho "
+        "tot)."
+    ),
+)
+_ASYNC_OPTION = Option(
+    False,
+    "--async",
+    help=(
+        "Llistar Google Drive amb el client asíncron: --concurrency carpetes "
+        "alhora en un sol fil, sense memòria cau. Només amb --folder-id."
+    ),
+)
 
 
-def _build_checker() -> Checker:
+def _build_checker() -> "Checker":
+    from string_checker import Checker, FolderNameRule, FolderValidCharsRule
+
     return Checker(
         rules=[
             FolderValidCharsRule(),
@@ -60,57 +166,167 @@ def _build_checker() -> Checker:
     )
 
 
+def _open_cache(
+    *, use_cache: bool, refresh: bool, max_age_hours: float
+) -> AbstractContextManager[DriveMetadataCache | None]:
+    """Open the listing cache at get_cache_path(), or a no-op without it."""
+    if not use_cache:
+        return nullcontext()
+    return DriveMetadataCache(
+        get_cache_path(), refresh=refresh, max_age=max_age_hours * 3600
+    )
+
+
+def _connect(*, use_async: bool, concurrency: int = 1) -> "object | AsyncDriveClient":
+    """Load credentials, build the Drive service or the asyncio client.
+
+    The asyncio client keeps up to concurrency connections open.
+    """
+    if not use_async:
+        return load_credentials_and_build_service()
+    from drive_connection.aio import AsyncDriveClient
+
+    return AsyncDriveClient(load_credentials(), max_connections=concurrency)
+
+
+def _folder_source(
+    service: object,
+    folder_ids: list[str],
+    *,
+    local_paths: list[Path],
+    manifest_path: Path | None,
+    cache: DriveMetadataCache | None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    use_async: bool = False,
+    concurrency: int = 1,
+) -> "FileSource":
+    """Return the source given on the command line: a manifest, paths or Drive."""
+    from cli.sources import (
+        AsyncDriveFolderSource,
+        DriveFolderSource,
+        LocalFolderSource,
+        ManifestSource,
+    )
+
+    if manifest_path is not None:
+        return ManifestSource(manifest_path)
+    if local_paths:
+        return LocalFolderSource(local_paths)
+    if use_async:
+        return AsyncDriveFolderSource(service, folder_ids, concurrency, page_size)
+    return DriveFolderSource(service, folder_ids, cache, page_size)
+
+
 def _run(
     folder_ids: list[str],
     *,
     log_path: Path | None,
     verbose: bool,
+    workers: int = 1,
+    use_cache: bool = False,
+    refresh: bool = False,
+    cache_max_age: float = DEFAULT_CACHE_MAX_AGE / 3600,
+    output_format: OutputFormat = OutputFormat.TEXT,
+    messages: MessageCatalogue | None = None,
+    local_paths: list[Path] | None = None,
+    manifest_path: Path | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    use_async: bool = False,
+    concurrency: int = 1,
 ) -> None:
-    load_dotenv()
+    from cli.sources import echo_request_stats, validate_source
 
-    try:
-        service = load_credentials_and_build_service()
-    except DriveConnectionError as e:
-        echo(f"Error de connexió amb Google Drive: {e}", err=True)
-        raise SystemExit(1) from e
+    load_dotenv()
+    messages = messages or load_messages()
+    local_paths = local_paths or []
 
-    echo(MSG_CONNECTED)
+    service = None
+    if folder_ids:
+        get_request_executor().reset_stats()
+        try:
+            service = _connect(use_async=use_async, concurrency=concurrency)
+        except DriveConnectionError as e:
+            echo(messages.text("connection_error", error=e), err=True)
+            raise SystemExit(1) from e
+        echo(messages.text("connected"))
+    elif manifest_path is not None:
+        echo(messages.text("manifest_reading", path=manifest_path))
+    else:
+        paths = ", ".join(str(path) for path in local_paths)
+        echo(messages.text("local_scanning", path=paths))
+    use_cache = use_cache and bool(folder_ids) and not use_async
 
     checker = _build_checker()
-    results: list[tuple[str, tuple]] = []
-    total = 0
-
-    try:
-        for folder_id in folder_ids:
-            for name, display_path in list_subfolder_names(service, folder_id):
-                if verbose:
-                    echo(display_path)
-                result = checker.check(name)
-                total += 1
-                if isinstance(result, Failure):
-                    results.append((display_path, result.failure()))
-    except DriveConnectionError as e:
-        echo(f"Error de Google Drive: {e}", err=True)
-        raise SystemExit(1) from e
-
-    echo(MSG_FOLDERS_VALIDATED.format(n=total))
-    if results:
-        echo(MSG_FOLDERS_WITH_ERRORS.format(n=len(results)))
+
+    with (
+        _open_cache(
+            use_cache=use_cache, refresh=refresh, max_age_hours=cache_max_age
+        ) as cache,
+        LogWriter(
+            log_path, messages.text("folder_label"), output_format, messages
+        ) as log,
+    ):
+        source = _folder_source(
+            service,
+            folder_ids,
+            local_paths=local_paths,
+            manifest_path=manifest_path,
+            cache=cache,
+            page_size=page_size,
+            use_async=use_async,
+            concurrency=concurrency,
+        )
+        total = validate_source(source, checker, log, workers=workers, verbose=verbose)
+        if cache is not None:
+            echo(messages.text("cache_stats", hits=cache.hits, misses=cache.misses))
+
+    if service is not None:
+        echo_request_stats(messages)
+    echo(messages.text("folders_validated", n=total))
+    if log.count:
+        echo(messages.text("folders_with_errors", n=log.count))
     if log_path is not None:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("w", encoding="utf-8") as f:
-            for display_path, failures in results:
-                f.write(f"Carpeta: {display_path}\n")
-                f.writelines(line + "\n" for line in failures_to_lines_ca(failures))
-                f.write("\n")
-        echo(MSG_LOG_SAVED.format(path=log_path))
+        echo(messages.text("log_saved", path=log_path))
 
 
 @app.callback(invoke_without_command=True)
 def main(
-    folder_id: list[str] = _FOLDER_ID_OPTION,
+    folder_id: list[str] | None = _FOLDER_ID_OPTION,
+    path: list[Path] | None = _PATH_OPTION,
+    manifest: Path | None = _MANIFEST_OPTION,
     log: Path | None = _LOG_OPTION,
+    output_format: OutputFormat = _FORMAT_OPTION,
     verbose: bool = _VERBOSE_OPTION,
+    workers: int = _WORKERS_OPTION,
+    page_size: int = _PAGE_SIZE_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    cache: bool = _CACHE_OPTION,
+    refresh: bool = _REFRESH_OPTION,
+    cache_max_age: float = _CACHE_MAX_AGE_OPTION,
+    use_async: bool = _ASYNC_OPTION,
+    lang: Language = _LANG_OPTION,
 ) -> None:
     """Valida els noms de les carpetes fills directes de les carpetes indicades."""
-    _run(folder_id, log_path=log, verbose=verbose)
+    messages = load_messages(lang)
+    if sum(bool(source) for source in (folder_id, path, manifest)) != 1:
+        echo(messages.text("source_required"), err=True)
+        raise SystemExit(1)
+    if use_async and not folder_id:
+        echo(messages.text("async_requires_folder"), err=True)
+        raise SystemExit(1)
+    _run(
+        folder_id or [],
+        log_path=log,
+        verbose=verbose,
+        workers=workers,
+        use_cache=cache,
+        refresh=refresh,
+        cache_max_age=cache_max_age,
+        output_format=output_format,
+        messages=messages,
+        local_paths=path,
+        manifest_path=manifest,
+        page_size=page_size,
+        use_async=use_async,
+        concurrency=concurrency,
+    )
@@ -2,28 +2,172 @@
 
 Loads OAuth credentials from env-configured paths and provides iterators
 over files in a folder (optionally recursive), plus creation of folders
-and shortcuts. Folders are never yielded as files; they are only traversed
-when recursive=True.
+and shortcuts, one at a time or in batch requests. Folders are never
+yielded as files; they are only traversed when recursive=True, optionally
+with several folder listings in flight. Every request goes through a
+shared executor that rate-limits it and retries transient failures; a
+ServicePool gives each listing thread its own connection.
+Folder listings can be kept in an on-disk cache between runs, and a
+snapshot of a folder tree can be kept up to date from the changes feed.
+A recursive listing can be checkpointed and resumed after a failure, or
+run on an event loop by the asyncio client (drive_connection.aio).
 """
 
-from drive_connection.drive import (
-    FOLDER_MIMETYPE,
-    SHORTCUT_MIMETYPE,
-    DriveConnectionError,
-    create_folder,
-    create_shortcut,
-    list_file_names,
-    list_subfolder_names,
-    load_credentials_and_build_service,
-)
+from typing import TYPE_CHECKING
+
+from lazy_exports import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from drive_connection.aio import (
+        DEFAULT_ASYNC_CONCURRENCY,
+        AsyncDriveClient,
+        alist_file_entries,
+        alist_file_names,
+        alist_subfolder_entries,
+        alist_subfolder_entries_many,
+        alist_subfolder_names,
+        iter_blocking,
+    )
+    from drive_connection.batch import (
+        MAX_BATCH_SIZE,
+        FolderSpec,
+        ShortcutSpec,
+        create_folders,
+        create_shortcuts,
+    )
+    from drive_connection.cache import (
+        DEFAULT_CACHE_MAX_AGE,
+        DriveMetadataCache,
+        get_cache_path,
+    )
+    from drive_connection.changes import (
+        DriveSnapshot,
+        apply_changes,
+        build_snapshot,
+        get_start_page_token,
+    )
+    from drive_connection.checkpoint import CheckpointedCrawl, CrawlCheckpoint
+    from drive_connection.drive import (
+        DEFAULT_PAGE_SIZE,
+        FOLDER_MIMETYPE,
+        MAX_PAGE_SIZE,
+        SHORTCUT_MIMETYPE,
+        DriveConnectionError,
+        DriveEntry,
+        ListingStrategy,
+        ServicePool,
+        ThreadLocalService,
+        build_service,
+        create_folder,
+        create_shortcut,
+        list_file_entries,
+        list_file_names,
+        list_subfolder_entries,
+        list_subfolder_names,
+        load_credentials,
+        load_credentials_and_build_service,
+    )
+    from drive_connection.executor import (
+        RequestExecutor,
+        TokenBucket,
+        get_request_executor,
+        set_request_executor,
+    )
+
+# Public name -> defining module, imported on first access (see
+# lazy_exports).
+_LAZY_ATTRS = {
+    "DEFAULT_ASYNC_CONCURRENCY": "drive_connection.aio",
+    "DEFAULT_CACHE_MAX_AGE": "drive_connection.cache",
+    "DEFAULT_PAGE_SIZE": "drive_connection.drive",
+    "FOLDER_MIMETYPE": "drive_connection.drive",
+    "MAX_BATCH_SIZE": "drive_connection.batch",
+    "MAX_PAGE_SIZE": "drive_connection.drive",
+    "SHORTCUT_MIMETYPE": "drive_connection.drive",
+    "AsyncDriveClient": "drive_connection.aio",
+    "CheckpointedCrawl": "drive_connection.checkpoint",
+    "CrawlCheckpoint": "drive_connection.checkpoint",
+    "DriveConnectionError": "drive_connection.drive",
+    "DriveEntry": "drive_connection.drive",
+    "DriveMetadataCache": "drive_connection.cache",
+    "DriveSnapshot": "drive_connection.changes",
+    "FolderSpec": "drive_connection.batch",
+    "ListingStrategy": "drive_connection.drive",
+    "RequestExecutor": "drive_connection.executor",
+    "ServicePool": "drive_connection.drive",
+    "ShortcutSpec": "drive_connection.batch",
+    "ThreadLocalService": "drive_connection.drive",
+    "TokenBucket": "drive_connection.executor",
+    "alist_file_entries": "drive_connection.aio",
+    "alist_file_names": "drive_connection.aio",
+    "alist_subfolder_entries": "drive_connection.aio",
+    "alist_subfolder_entries_many": "drive_connection.aio",
+    "alist_subfolder_names": "drive_connection.aio",
+    "apply_changes": "drive_connection.changes",
+    "build_service": "drive_connection.drive",
+    "build_snapshot": "drive_connection.changes",
+    "create_folder": "drive_connection.drive",
+    "create_folders": "drive_connection.batch",
+    "create_shortcut": "drive_connection.drive",
+    "create_shortcuts": "drive_connection.batch",
+    "get_cache_path": "drive_connection.cache",
+    "get_request_executor": "drive_connection.executor",
+    "get_start_page_token": "drive_connection.changes",
+    "iter_blocking": "drive_connection.aio",
+    "list_file_entries": "drive_connection.drive",
+    "list_file_names": "drive_connection.drive",
+    "list_subfolder_entries": "drive_connection.drive",
+    "list_subfolder_names": "drive_connection.drive",
+    "load_credentials": "drive_connection.drive",
+    "load_credentials_and_build_service": "drive_connection.drive",
+    "set_request_executor": "drive_connection.executor",
+}
 
 __all__ = [
+    "DEFAULT_ASYNC_CONCURRENCY",
+    "DEFAULT_CACHE_MAX_AGE",
+    "DEFAULT_PAGE_SIZE",
     "FOLDER_MIMETYPE",
+    "MAX_BATCH_SIZE",
+    "MAX_PAGE_SIZE",
     "SHORTCUT_MIMETYPE",
+    "AsyncDriveClient",
+    "CheckpointedCrawl",
+    "CrawlCheckpoint",
     "DriveConnectionError",
+    "DriveEntry",
+    "DriveMetadataCache",
+    "DriveSnapshot",
+    "FolderSpec",
+    "ListingStrategy",
+    "RequestExecutor",
+    "ServicePool",
+    "ShortcutSpec",
+    "ThreadLocalService",
+    "TokenBucket",
+    "alist_file_entries",
+    "alist_file_names",
+    "alist_subfolder_entries",
+    "alist_subfolder_entries_many",
+    "alist_subfolder_names",
+    "apply_changes",
+    "build_service",
+    "build_snapshot",
     "create_folder",
+    "create_folders",
     "create_shortcut",
+    "create_shortcuts",
+    "get_cache_path",
+    "get_request_executor",
+    "get_start_page_token",
+    "iter_blocking",
+    "list_file_entries",
     "list_file_names",
+    "list_subfolder_entries",
     "list_subfolder_names",
+    "load_credentials",
     "load_credentials_and_build_service",
+    "set_request_executor",
 ]
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
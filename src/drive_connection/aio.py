@@ -0,0 +1,638 @@
+"""Asyncio Drive listing: an httpx client and async generator listings.
+
+AsyncDriveClient sends files.list requests on an httpx.AsyncClient, so a
+single thread can keep hundreds of folder listings in flight, where the
+threaded listing (list_file_entries with concurrency) needs one thread
+and one connection per listing. Requests go through the shared
+RequestExecutor (rate limit, retries, counters) like the synchronous ones.
+
+alist_file_entries, alist_file_names, alist_subfolder_entries and
+alist_subfolder_names are async generator counterparts of the functions
+in drive_connection.drive, yielding the same items in the same order;
+alist_subfolder_entries_many lists the subfolders of several folders
+concurrently.
+iter_blocking runs one of them on an event loop in a background thread
+and yields its items to synchronous code such as the CLIs.
+
+httpx is imported when a client is created, not with this module.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import aclosing
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING, Self
+
+from drive_connection.drive import (
+    CHILD_FIELDS,
+    DEFAULT_HTTP_TIMEOUT,
+    DEFAULT_PAGE_SIZE,
+    FOLDER_MIMETYPE,
+    LOOKAHEAD_PER_THREAD,
+    DriveConnectionError,
+    DriveEntry,
+    check_page_size,
+    field_mask,
+    join_display_path,
+)
+from drive_connection.executor import get_request_executor
+
+if TYPE_CHECKING:
+    import httpx
+    from google.oauth2.credentials import Credentials
+
+# Endpoint of files.list in the Drive v3 REST API.
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+
+# Folder listings in flight at once, and open connections, by default.
+DEFAULT_ASYNC_CONCURRENCY = 100
+
+# Items iter_blocking lets the event loop list ahead of the caller.
+DEFAULT_BLOCKING_BUFFER = 1000
+
+_FolderKey = tuple[str, tuple[str, ...]]
+
+
+class AsyncDriveClient:
+    """Sends Drive v3 files.list requests with httpx, from one event loop.
+
+    Connections are pooled and kept alive by httpx. An expired access
+    token is refreshed once, in a worker thread, while the other requests
+    wait. Use as an async context manager, or call aclose() when done.
+    """
+
+    def __init__(
+        self,
+        creds: "Credentials",
+        *,
+        max_connections: int = DEFAULT_ASYNC_CONCURRENCY,
+        timeout: float = DEFAULT_HTTP_TIMEOUT,
+        transport: "httpx.AsyncBaseTransport | None" = None,
+    ) -> None:
+        """Create a client; no connection is opened until the first request.
+
+        Args:
+            creds: Credentials from load_credentials.
+            max_connections: Maximum open connections to Drive.
+            timeout: Seconds before a request is abandoned.
+            transport: httpx transport to send requests through instead of
+                the network (e.g. httpx.MockTransport in tests).
+
+        """
+        import httpx
+
+        self._creds = creds
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+        self._refresh_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> Self:
+        """Return the client."""
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Close the client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the client's connections."""
+        await self._client.aclose()
+
+    async def list_page(
+        self,
+        *,
+        q: str,
+        fields: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        page_token: str | None = None,
+    ) -> dict:
+        """Return one page of files.list (the parsed JSON response).
+
+        Raises:
+            DriveConnectionError: If the request fails after the executor's
+                retries, or cannot be sent.
+
+        """
+        import httpx
+        from googleapiclient.errors import HttpError
+
+        params = {
+            "q": q,
+            "pageSize": str(page_size),
+            "fields": fields,
+            "supportsAllDrives": "true",
+        }
+        if page_token is not None:
+            params["pageToken"] = page_token
+        try:
+            return await get_request_executor().execute_async(lambda: self._get(params))
+        except HttpError as e:
+            msg = f"Drive API error: {e}"
+            raise DriveConnectionError(msg) from e
+        except httpx.TransportError as e:
+            msg = f"Drive connection error: {e!r}"
+            raise DriveConnectionError(msg) from e
+
+    async def _get(self, params: dict[str, str]) -> dict:
+        """Send one files.list request; raise HttpError on an error status."""
+        headers: dict[str, str] = {}
+        await self._authorize(headers)
+        response = await self._client.get(
+            DRIVE_FILES_URL, params=params, headers=headers
+        )
+        if response.is_error:
+            raise _http_error(response)
+        return response.json()
+
+    async def _authorize(self, headers: dict[str, str]) -> None:
+        """Add the Authorization header, refreshing the token if needed."""
+        if not self._creds.valid:
+            async with self._refresh_lock:
+                if not self._creds.valid:
+                    from google.auth.transport.requests import Request
+
+                    await asyncio.to_thread(self._creds.refresh, Request())
+        self._creds.apply(headers)
+
+
+def _http_error(response: "httpx.Response") -> Exception:
+    """Return the googleapiclient HttpError for an error response.
+
+    The executor decides on retries from HttpError's status and error
+    details, for the synchronous and the asyncio client alike.
+    """
+    import httplib2
+    from googleapiclient.errors import HttpError
+
+    resp = httplib2.Response({"status": str(response.status_code)})
+    resp.reason = response.reason_phrase
+    return HttpError(resp, response.content, uri=str(response.url))
+
+
+async def _aiter_list_pages(
+    client: AsyncDriveClient, *, q: str, fields: str, page_size: int
+) -> AsyncIterator[dict]:
+    """Yield every file resource matching q, following nextPageToken."""
+    page_token: str | None = None
+    while True:
+        response = await client.list_page(
+            q=q, fields=fields, page_size=page_size, page_token=page_token
+        )
+        for item in response.get("files", []):
+            yield item
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+
+
+async def _alist_children(
+    client: AsyncDriveClient, folder_id: str, page_size: int
+) -> list[dict]:
+    """Return the CHILD_FIELDS of every direct child of folder_id."""
+    return [
+        item
+        async for item in _aiter_list_pages(
+            client,
+            q=f"'{folder_id}' in parents",
+            fields=field_mask(CHILD_FIELDS),
+            page_size=page_size,
+        )
+    ]
+
+
+async def alist_file_names(
+    client: AsyncDriveClient,
+    folder_id: str,
+    *,
+    recursive: bool,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[tuple[str, str]]:
+    """Yield (file_name, display_path) for each file under the given folder.
+
+    Same listing as alist_file_entries, without the Drive IDs.
+    """
+    async with aclosing(
+        alist_file_entries(
+            client,
+            folder_id,
+            recursive=recursive,
+            concurrency=concurrency,
+            page_size=page_size,
+        )
+    ) as entries:
+        async for entry in entries:
+            yield (entry.name, entry.display_path)
+
+
+async def alist_file_entries(
+    client: AsyncDriveClient,
+    folder_id: str,
+    *,
+    recursive: bool,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[DriveEntry]:
+    """Yield a DriveEntry for each file under the given folder.
+
+    Async counterpart of list_file_entries with the per-folder strategy:
+    the same entries in the same depth-first order. With recursive, up to
+    concurrency folders are listed at once by as many tasks, and
+    subfolders are queued as their parents' listings arrive, up to
+    concurrency * LOOKAHEAD_PER_THREAD listings ahead of the consumer.
+
+    Args:
+        client: The client to send the requests with.
+        folder_id: The Drive folder ID to list.
+        recursive: If True, descend into subfolders and prefix paths.
+        concurrency: Maximum number of folder listings in flight at once.
+        page_size: Files per files.list page, up to MAX_PAGE_SIZE.
+
+    Yields:
+        DriveEntry(name, display_path, file_id) for each non-folder item.
+
+    Raises:
+        ValueError: If page_size is not between 1 and MAX_PAGE_SIZE.
+        DriveConnectionError: If a listing fails.
+
+    """
+    check_page_size(page_size)
+    if not recursive:
+        async for item in _aiter_list_pages(
+            client,
+            q=f"'{folder_id}' in parents",
+            fields=field_mask(CHILD_FIELDS),
+            page_size=page_size,
+        ):
+            if item.get("mimeType", "") != FOLDER_MIMETYPE:
+                name = item.get("name", "")
+                yield DriveEntry(name, name, item.get("id", ""))
+        return
+    walk = _AsyncWalk(
+        lambda child_id: _alist_children(client, child_id, page_size),
+        concurrency,
+        max_ahead=concurrency * LOOKAHEAD_PER_THREAD,
+    )
+    try:
+        async for item, prefix_parts in walk.iter_ordered(folder_id):
+            name = item.get("name", "")
+            yield DriveEntry(
+                name, join_display_path(prefix_parts, name), item.get("id", "")
+            )
+    finally:
+        await walk.aclose()
+
+
+async def alist_subfolder_names(
+    client: AsyncDriveClient,
+    folder_id: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[tuple[str, str]]:
+    """Yield (folder_name, display_path) for each direct child folder.
+
+    Same listing as alist_subfolder_entries, without the Drive IDs.
+    """
+    async with aclosing(
+        alist_subfolder_entries(client, folder_id, page_size=page_size)
+    ) as entries:
+        async for entry in entries:
+            yield (entry.name, entry.display_path)
+
+
+async def alist_subfolder_entries(
+    client: AsyncDriveClient,
+    folder_id: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[DriveEntry]:
+    """Yield a DriveEntry for each direct child folder.
+
+    Async counterpart of list_subfolder_entries (without the cache).
+
+    Args:
+        client: The client to send the requests with.
+        folder_id: The Drive folder ID to list.
+        page_size: Folders per files.list page, up to MAX_PAGE_SIZE.
+
+    Yields:
+        DriveEntry(name, display_path, file_id) for each direct subfolder.
+
+    Raises:
+        ValueError: If page_size is not between 1 and MAX_PAGE_SIZE.
+        DriveConnectionError: If the listing fails.
+
+    """
+    check_page_size(page_size)
+    async for item in _aiter_list_pages(
+        client,
+        q=f"'{folder_id}' in parents and mimeType = '{FOLDER_MIMETYPE}'",
+        fields=field_mask(("id", "name")),
+        page_size=page_size,
+    ):
+        name = item.get("name", "")
+        yield DriveEntry(name, name, item.get("id", ""))
+
+
+async def alist_subfolder_entries_many(
+    client: AsyncDriveClient,
+    folder_ids: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[DriveEntry]:
+    """Yield a DriveEntry for each direct child folder of several folders.
+
+    The entries of alist_subfolder_entries for each folder ID, folder
+    after folder, while up to concurrency folders are listed at once:
+    each folder is listed into memory, and the next one is started as
+    soon as a listing is taken.
+
+    Args:
+        client: The client to send the requests with.
+        folder_ids: The Drive folder IDs to list, in output order.
+        concurrency: Maximum number of folder listings in flight at once.
+        page_size: Folders per files.list page, up to MAX_PAGE_SIZE.
+
+    Yields:
+        DriveEntry(name, display_path, file_id) for each direct subfolder.
+
+    Raises:
+        ValueError: If page_size is not between 1 and MAX_PAGE_SIZE.
+        DriveConnectionError: If a listing fails.
+
+    """
+    check_page_size(page_size)
+
+    async def collect(folder_id: str) -> list[DriveEntry]:
+        listing = alist_subfolder_entries(client, folder_id, page_size=page_size)
+        return [entry async for entry in listing]
+
+    remaining = iter(folder_ids)
+    pending: deque[asyncio.Task[list[DriveEntry]]] = deque(
+        asyncio.create_task(collect(folder_id))
+        for folder_id in itertools.islice(remaining, concurrency)
+    )
+    try:
+        while pending:
+            entries = await pending.popleft()
+            next_id = next(remaining, None)
+            if next_id is not None:
+                pending.append(asyncio.create_task(collect(next_id)))
+            for entry in entries:
+                yield entry
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+class _AsyncWalk:
+    """Lists a folder tree with a fixed number of tasks, queueing subfolders.
+
+    Counterpart of drive.ConcurrentWalk for one event loop. A folder
+    waiting to be listed costs a queue entry and a future, not a task, so
+    an archive with tens of thousands of folders does not hold tens of
+    thousands of suspended coroutines. At most max_ahead listings are
+    queued, in flight or held for the consumer; further folders wait in
+    depth-first order (by their position in the tree), and a listing is
+    released once the consumer takes it.
+    """
+
+    def __init__(
+        self,
+        list_children: Callable[[str], Awaitable[list[dict]]],
+        concurrency: int,
+        *,
+        max_ahead: int,
+    ) -> None:
+        self._list_children = list_children
+        self._concurrency = concurrency
+        self._max_ahead = max_ahead
+        self._queue: asyncio.Queue[tuple[_FolderKey, tuple[int, ...]]]
+        self._queue = asyncio.Queue()
+        # Listings scheduled and not yet taken, at most max_ahead.
+        self._futures: dict[_FolderKey, asyncio.Future[list[dict]]] = {}
+        # (position, key) heap; a key taken meanwhile is dropped from
+        # _waiting_keys and skipped when popped.
+        self._waiting: list[tuple[tuple[int, ...], _FolderKey]] = []
+        self._waiting_keys: set[_FolderKey] = set()
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def iter_ordered(
+        self, folder_id: str
+    ) -> AsyncIterator[tuple[dict, tuple[str, ...]]]:
+        """Yield files depth-first, in the same order as the sequential walk."""
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self._concurrency)
+        ]
+        stack = [(iter(await self._take((folder_id, ()))), ())]
+        while stack:
+            items, prefix_parts = stack[-1]
+            item = next(items, None)
+            if item is None:
+                stack.pop()
+            elif item.get("mimeType", "") == FOLDER_MIMETYPE:
+                child_prefix = (*prefix_parts, item.get("name", ""))
+                children = await self._take((item.get("id"), child_prefix))
+                stack.append((iter(children), child_prefix))
+            else:
+                yield (item, prefix_parts)
+
+    async def aclose(self) -> None:
+        """Stop the workers and drop the listings not consumed."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        for future in self._futures.values():
+            if future.done() and not future.cancelled():
+                future.exception()  # Retrieved: not reported as unhandled.
+            future.cancel()
+        self._futures.clear()
+        self._waiting.clear()
+        self._waiting_keys.clear()
+
+    def _prefetch(self, keys: Iterable[_FolderKey], position: tuple[int, ...]) -> None:
+        """Schedule folders the consumer will take, in the order it takes them."""
+        for index, key in enumerate(keys):
+            if key not in self._futures and key not in self._waiting_keys:
+                heapq.heappush(self._waiting, ((*position, index), key))
+                self._waiting_keys.add(key)
+        self._fill()
+
+    def _submit(
+        self, key: _FolderKey, position: tuple[int, ...]
+    ) -> asyncio.Future[list[dict]]:
+        """Queue the listing of key for the workers."""
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        self._queue.put_nowait((key, position))
+        return future
+
+    def _fill(self) -> None:
+        """Queue waiting folders while fewer than max_ahead are untaken."""
+        while self._waiting and len(self._futures) < self._max_ahead:
+            position, key = heapq.heappop(self._waiting)
+            if key in self._waiting_keys:
+                self._waiting_keys.discard(key)
+                self._submit(key, position)
+
+    async def _take(self, key: _FolderKey) -> list[dict]:
+        """Wait for a folder's listing (queueing it now if needed) and release it."""
+        future = self._futures.get(key)
+        if future is None:
+            self._waiting_keys.discard(key)
+            future = self._submit(key, ())
+        try:
+            return await future
+        finally:
+            del self._futures[key]
+            self._fill()
+
+    async def _work(self) -> None:
+        """List queued folders one at a time, scheduling their subfolders."""
+        while True:
+            key, position = await self._queue.get()
+            future = self._futures.get(key)
+            if future is None or future.done():
+                continue
+            folder_id, prefix_parts = key
+            try:
+                items = await self._list_children(folder_id)
+            except Exception as e:  # noqa: BLE001 - raised to the consumer
+                future.set_exception(e)
+                continue
+            self._prefetch(
+                (
+                    (item.get("id"), (*prefix_parts, item.get("name", "")))
+                    for item in items
+                    if item.get("mimeType", "") == FOLDER_MIMETYPE
+                ),
+                position,
+            )
+            future.set_result(items)
+
+
+def iter_blocking(
+    make_iterator: Callable[[], AsyncIterator[DriveEntry]],
+    *,
+    buffer: int = DEFAULT_BLOCKING_BUFFER,
+) -> Iterator[DriveEntry]:
+    """Yield the entries of an async listing to synchronous code.
+
+    make_iterator is called on a new event loop running in a background
+    thread, and its items are handed over through a queue as they come,
+    so the listing goes on while the caller processes them. At most
+    buffer items wait in the queue: a slower caller holds the listing
+    back instead of letting it run ahead without bound. Stopping the
+    iteration early cancels the async iterator.
+
+    Args:
+        make_iterator: Returns the async iterator, e.g.
+            ``lambda: alist_file_entries(client, folder_id, recursive=True)``.
+        buffer: Items the listing may get ahead of the caller.
+
+    Yields:
+        The items of the async iterator, in order.
+
+    Raises:
+        Exception: Whatever the async iterator raises.
+
+    """
+    loop = asyncio.new_event_loop()
+    handoff = _Handoff(loop, buffer)
+
+    async def produce() -> None:
+        try:
+            async with aclosing(make_iterator()) as iterator:
+                async for item in iterator:
+                    await handoff.put(item)
+        except Exception as e:  # noqa: BLE001 - raised in the caller's thread
+            handoff.finish(e)
+        else:
+            handoff.finish(None)
+
+    def run() -> None:
+        with contextlib.suppress(asyncio.CancelledError):
+            loop.run_until_complete(task)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+
+    task = loop.create_task(produce())
+    thread = threading.Thread(target=run, name="drive-asyncio", daemon=True)
+    thread.start()
+    try:
+        while True:
+            is_item, value = handoff.get()
+            if not is_item:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join()
+        loop.close()
+
+
+class _Handoff:
+    """Queue from an event loop to a thread, holding at most buffer items.
+
+    put (on the loop) waits while buffer items are unacknowledged; get
+    (in the thread) acknowledges them in chunks, one wake-up of the loop
+    per chunk rather than per item, and always before it blocks.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, buffer: int) -> None:
+        self._loop = loop
+        self._buffer = buffer
+        self._chunk = max(1, buffer // 4)
+        self._items: SimpleQueue[tuple[bool, object]] = SimpleQueue()
+        self._queued = 0  # Loop side: items put and not acknowledged.
+        self._has_room = asyncio.Event()
+        self._taken = 0  # Thread side: items got and not acknowledged.
+
+    async def put(self, item: object) -> None:
+        """Queue item, first waiting for room."""
+        while self._queued >= self._buffer:
+            self._has_room.clear()
+            await self._has_room.wait()
+        self._queued += 1
+        self._items.put((True, item))
+
+    def finish(self, error: Exception | None) -> None:
+        """Queue the end of the items, or the error that ended them."""
+        self._items.put((False, error))
+
+    def get(self) -> tuple[bool, object]:
+        """Return (True, item), or (False, error or None) at the end."""
+        try:
+            entry = self._items.get_nowait()
+        except Empty:
+            # put may be waiting for room: acknowledge before blocking.
+            self._acknowledge()
+            entry = self._items.get()
+        if entry[0]:
+            self._taken += 1
+            if self._taken >= self._chunk:
+                self._acknowledge()
+        return entry
+
+    def _acknowledge(self) -> None:
+        if self._taken:
+            self._loop.call_soon_threadsafe(self._free, self._taken)
+            self._taken = 0
+
+    def _free(self, n: int) -> None:
+        self._queued -= n
+        self._has_room.set()
@@ -0,0 +1,173 @@
+"""Batched folder and shortcut creation through the Drive batch endpoint.
+
+create_folder and create_shortcut cost one HTTP round trip each. The
+functions here send up to MAX_BATCH_SIZE create calls per batch request
+(the Drive limit) and return one Result per item, in input order:
+Success(file resource) or Failure(DriveConnectionError). An item that
+fails does not fail the others, and neither does a batch request that
+fails as a whole: each item it left unanswered is a Failure, and the
+remaining batches are still sent.
+
+Batches go through the shared RequestExecutor (see executor): every call
+in a batch counts against its rate limiter, and items rejected for rate
+limiting are sent again in a later batch after its backoff, up to its
+max_retries; other item errors are returned as they are. Creating is not
+idempotent, so neither an item nor a batch request failing with a server
+error is sent again: the item may have been created.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+from returns.result import Failure, Result, Success
+
+from drive_connection.drive import (
+    DriveConnectionError,
+    create_request,
+    execute_request,
+    folder_body,
+    shortcut_body,
+)
+from drive_connection.executor import get_request_executor, is_retryable
+
+# Calls per batch request accepted by the Drive API.
+MAX_BATCH_SIZE = 100
+
+CreateResult = Result[dict, DriveConnectionError]
+
+
+class FolderSpec(NamedTuple):
+    """A folder to create: name and parent folder ID (None = Drive root)."""
+
+    name: str
+    parent_id: str | None = None
+
+
+class ShortcutSpec(NamedTuple):
+    """A shortcut to create; the fields are those of create_shortcut."""
+
+    target_id: str
+    name: str | None = None
+    parent_id: str | None = None
+    target_mime_type: str | None = None
+
+
+def create_folders(
+    service: object,
+    folders: Iterable[FolderSpec],
+    *,
+    batch_size: int = MAX_BATCH_SIZE,
+) -> list[CreateResult]:
+    """Create folders with batch requests.
+
+    Args:
+        service: The Drive v3 service from load_credentials_and_build_service.
+        folders: Folders to create.
+        batch_size: Create calls per batch request (1 to MAX_BATCH_SIZE).
+
+    Returns:
+        One Result per folder, in input order: Success(file resource) or
+        Failure(DriveConnectionError).
+
+    Raises:
+        ValueError: If batch_size is out of range.
+
+    """
+    bodies = [folder_body(f.name, f.parent_id) for f in folders]
+    return _create_batched(service, bodies, batch_size=batch_size)
+
+
+def create_shortcuts(
+    service: object,
+    shortcuts: Iterable[ShortcutSpec],
+    *,
+    batch_size: int = MAX_BATCH_SIZE,
+) -> list[CreateResult]:
+    """Create shortcuts with batch requests.
+
+    Args:
+        service: The Drive v3 service from load_credentials_and_build_service.
+        shortcuts: Shortcuts to create.
+        batch_size: Create calls per batch request (1 to MAX_BATCH_SIZE).
+
+    Returns:
+        One Result per shortcut, in input order: Success(file resource) or
+        Failure(DriveConnectionError).
+
+    Raises:
+        ValueError: If batch_size is out of range.
+
+    """
+    bodies = [
+        shortcut_body(s.target_id, s.name, s.parent_id, s.target_mime_type)
+        for s in shortcuts
+    ]
+    return _create_batched(service, bodies, batch_size=batch_size)
+
+
+def _create_batched(
+    service: object,
+    bodies: Sequence[dict],
+    *,
+    batch_size: int,
+) -> list[CreateResult]:
+    """Send the create calls of bodies in batches, retrying retryable items."""
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        msg = f"batch_size must be between 1 and {MAX_BATCH_SIZE}, got {batch_size}"
+        raise ValueError(msg)
+    results: list[CreateResult | None] = [None] * len(bodies)
+    pending = list(range(len(bodies)))
+    executor = get_request_executor()
+    for attempt in range(executor.max_retries + 1):
+        if attempt:
+            executor.wait_before_retry(attempt - 1)
+        retry: dict[int, Exception] = {}
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            retry.update(_send_batch(service, bodies, chunk, results))
+        pending = sorted(retry)
+        if not pending:
+            break
+    for i, error in retry.items():
+        results[i] = _failure(error)
+    return results
+
+
+def _send_batch(
+    service: object,
+    bodies: Sequence[dict],
+    indices: list[int],
+    results: list[CreateResult | None],
+) -> dict[int, Exception]:
+    """Send one batch, storing results; return the retryable items' errors.
+
+    If the batch request itself fails, the items without an answer get
+    its DriveConnectionError as their Failure.
+    """
+    retry: dict[int, Exception] = {}
+
+    def callback(request_id: str, response: dict, exception: Exception) -> None:
+        i = int(request_id)
+        if exception is None:
+            results[i] = Success(response)
+        elif is_retryable(exception, idempotent=False):
+            retry[i] = exception
+        else:
+            results[i] = _failure(exception)
+
+    batch = service.new_batch_http_request(callback=callback)
+    for i in indices:
+        batch.add(create_request(service, bodies[i]), request_id=str(i))
+    try:
+        execute_request(batch, cost=len(indices), idempotent=False)
+    except DriveConnectionError as e:
+        for i in indices:
+            if results[i] is None and i not in retry:
+                results[i] = Failure(e)
+    return retry
+
+
+def _failure(error: Exception) -> Failure[DriveConnectionError]:
+    wrapped = DriveConnectionError(f"Drive API error: {error}")
+    wrapped.__cause__ = error
+    return Failure(wrapped)
@@ -0,0 +1,202 @@
+"""On-disk SQLite cache of Drive folder listings.
+
+Stores the children of each listed folder (id, name, mimeType and parent
+links) together with the folder's modifiedTime and the time it was listed.
+A later run that sees the same modifiedTime for a folder reuses the stored
+children instead of calling files().list again, as long as the listing is
+not older than max_age.
+
+Drive does not always bump a folder's modifiedTime when files inside it are
+added or renamed, so a cached listing can be stale; max_age bounds how long
+such a change can go unseen, and refresh=True re-lists everything at once.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+# Default path relative to current working directory.
+DEFAULT_CACHE_PATH = "fentarxiu_cache.sqlite3"
+
+# Seconds a stored listing is served before the folder is listed again.
+DEFAULT_CACHE_MAX_AGE = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    mime_type TEXT NOT NULL,
+    modified_time TEXT
+);
+CREATE TABLE IF NOT EXISTS parents (
+    parent_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    child_id TEXT NOT NULL,
+    PRIMARY KEY (parent_id, position)
+);
+CREATE TABLE IF NOT EXISTS listings (
+    folder_id TEXT PRIMARY KEY,
+    modified_time TEXT NOT NULL,
+    listed_at REAL
+);
+"""
+
+
+def get_cache_path() -> Path:
+    """Return the cache database path (FENTARXIU_CACHE_DB or the default)."""
+    path = os.environ.get("FENTARXIU_CACHE_DB", DEFAULT_CACHE_PATH)
+    return Path(path).expanduser()
+
+
+class DriveMetadataCache:
+    """Folder listings keyed by Drive folder ID and modifiedTime.
+
+    Safe to share between the threads of a concurrent listing. Counts a
+    hit for each folder served from the cache and a miss for each folder
+    that had to be listed through the API.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        refresh: bool = False,
+        max_age: float | None = DEFAULT_CACHE_MAX_AGE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open (or create) the cache database at path.
+
+        Args:
+            path: SQLite database file; parent directories are created.
+            refresh: If True, never serve cached listings (every folder is a
+                miss) but still store fresh ones, rebuilding the cache.
+            max_age: Seconds a stored listing is served for, whatever the
+                folder's modifiedTime (0 never serves one); None serves it
+                until the folder's modifiedTime changes.
+            clock: Wall clock in seconds since the epoch; listing times are
+                stored in the database, so they must survive a restart.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        columns = {
+            row[1] for row in self._connection.execute("PRAGMA table_info(listings)")
+        }
+        if "listed_at" not in columns:
+            # Caches written before max_age: their listings count as expired.
+            self._connection.execute("ALTER TABLE listings ADD COLUMN listed_at REAL")
+        self._lock = threading.Lock()
+        self._refresh = refresh
+        self._max_age = max_age
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> Self:
+        """Return the cache itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def get_children(self, folder_id: str, modified_time: str) -> list[dict] | None:
+        """Return the cached children of a folder, or None on a miss.
+
+        Args:
+            folder_id: Drive folder ID.
+            modified_time: The folder's current modifiedTime; the cached
+                listing is only used if it was stored for this same value
+                less than max_age seconds ago.
+
+        Returns:
+            File resources (id, name, mimeType, and modifiedTime if it was
+            stored) in listing order, or None if the folder must be listed
+            through the API.
+
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT modified_time, listed_at FROM listings WHERE folder_id = ?",
+                (folder_id,),
+            ).fetchone()
+            if (
+                self._refresh
+                or row is None
+                or row[0] != modified_time
+                or self._expired(row[1])
+            ):
+                self.misses += 1
+                return None
+            rows = self._connection.execute(
+                "SELECT e.id, e.name, e.mime_type, e.modified_time "
+                "FROM parents p JOIN entries e ON e.id = p.child_id "
+                "WHERE p.parent_id = ? ORDER BY p.position",
+                (folder_id,),
+            ).fetchall()
+            self.hits += 1
+        return [
+            {"id": id_, "name": name, "mimeType": mime, "modifiedTime": modified}
+            for id_, name, mime, modified in rows
+        ]
+
+    def put_children(
+        self, folder_id: str, modified_time: str, items: list[dict]
+    ) -> None:
+        """Store the full listing of a folder, replacing any previous one.
+
+        Args:
+            folder_id: Drive folder ID.
+            modified_time: The folder's modifiedTime when it was listed.
+            items: File resources with id, name, mimeType and optionally
+                modifiedTime.
+
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM parents WHERE parent_id = ?", (folder_id,)
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entries (id, name, mime_type, modified_time) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        item.get("id"),
+                        item.get("name", ""),
+                        item.get("mimeType", ""),
+                        item.get("modifiedTime"),
+                    )
+                    for item in items
+                ],
+            )
+            self._connection.executemany(
+                "INSERT INTO parents (parent_id, position, child_id) VALUES (?, ?, ?)",
+                [(folder_id, i, item.get("id")) for i, item in enumerate(items)],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO listings (folder_id, modified_time, listed_at) "
+                "VALUES (?, ?, ?)",
+                (folder_id, modified_time, self._clock()),
+            )
+
+    def _expired(self, listed_at: float | None) -> bool:
+        """Return True if a listing stored at listed_at is max_age old or older."""
+        if self._max_age is None:
+            return False
+        return listed_at is None or self._clock() - listed_at >= self._max_age
@@ -0,0 +1,327 @@
+"""Resumable listings: a crawl position that is saved and restored.
+
+A CrawlCheckpoint records where a depth-first walk of a folder tree
+stands: the frontier (each folder still being walked with the children
+not visited yet, or not listed yet) and the results so far (files
+validated and the failing ones). The folders already walked are not
+recorded: the frontier alone says what is left.
+CheckpointedCrawl walks the tree from a checkpoint, listing only the
+frontier, and yields files in the same order as list_file_entries.
+
+The consumer reports each file back with validated() once it has been
+handled; checkpoint() returns the position of the last folder boundary
+the consumer has passed, so files listed ahead of the consumer are listed
+again on resume rather than lost.
+"""
+
+import json
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
+
+from drive_connection.cache import DriveMetadataCache
+from drive_connection.drive import (
+    CHILD_FIELDS,
+    DEFAULT_PAGE_SIZE,
+    FOLDER_MIMETYPE,
+    LOOKAHEAD_PER_THREAD,
+    ConcurrentWalk,
+    DriveEntry,
+    check_page_size,
+    children_lister,
+    join_display_path,
+)
+
+# Version of the JSON layout written by CrawlCheckpoint.save.
+_CHECKPOINT_VERSION = 1
+
+
+class CrawlFrame(NamedTuple):
+    """A folder of the frontier: its path and its children not visited yet.
+
+    items is None if the folder has not been listed yet.
+    """
+
+    folder_id: str
+    prefix_parts: tuple[str, ...]
+    items: list[dict] | None
+
+
+@dataclass
+class CrawlCheckpoint:
+    """Position and results of an interrupted listing of root_id.
+
+    frontier is the walk's stack, outermost folder first. total counts
+    the files validated so far and failing holds the ones that failed.
+    """
+
+    root_id: str
+    recursive: bool
+    frontier: list[CrawlFrame] = field(default_factory=list)
+    total: int = 0
+    failing: list[DriveEntry] = field(default_factory=list)
+
+    @classmethod
+    def start(cls, root_id: str, *, recursive: bool) -> "CrawlCheckpoint":
+        """Return the checkpoint of a listing of root_id that has not begun."""
+        return cls(root_id, recursive, frontier=[CrawlFrame(root_id, (), None)])
+
+    @classmethod
+    def load(cls, path: Path) -> "CrawlCheckpoint":
+        """Read a checkpoint written by save.
+
+        Args:
+            path: JSON file written by save.
+
+        Returns:
+            The stored checkpoint.
+
+        Raises:
+            ValueError: If the file is not a valid checkpoint.
+
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data["version"] != _CHECKPOINT_VERSION:
+                msg = f"unsupported checkpoint version {data['version']!r}"
+                raise ValueError(msg)
+            return cls(
+                root_id=data["root_id"],
+                recursive=bool(data["recursive"]),
+                frontier=[
+                    CrawlFrame(f["folder_id"], tuple(f["path"]), f["items"])
+                    for f in data["frontier"]
+                ],
+                total=int(data["total"]),
+                failing=[DriveEntry(*entry) for entry in data["failing"]],
+            )
+        except (KeyError, TypeError, IndexError, AttributeError) as e:
+            msg = f"invalid checkpoint {path}: {e!r}"
+            raise ValueError(msg) from e
+
+    def save(self, path: Path) -> None:
+        """Write the checkpoint as JSON, replacing path atomically.
+
+        Args:
+            path: Destination file; parent directories are created.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": _CHECKPOINT_VERSION,
+            "root_id": self.root_id,
+            "recursive": self.recursive,
+            "frontier": [
+                {"folder_id": f.folder_id, "path": f.prefix_parts, "items": f.items}
+                for f in self.frontier
+            ],
+            "total": self.total,
+            "failing": self.failing,
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+
+    @property
+    def pending_folders(self) -> int:
+        """Return the number of frontier folders not listed yet."""
+        return sum(
+            1
+            if frame.items is None
+            else sum(
+                1 for item in frame.items if item.get("mimeType") == FOLDER_MIMETYPE
+            )
+            for frame in self.frontier
+        )
+
+
+@dataclass(slots=True)
+class _Frame:
+    """A folder being walked: its listing and the next child to visit."""
+
+    folder_id: str
+    prefix_parts: tuple[str, ...]
+    items: list[dict] | None
+    index: int = 0
+
+
+class _Mark(NamedTuple):
+    """Walk position after `count` files: the frames on the stack."""
+
+    count: int
+    frames: tuple[tuple[str, tuple[str, ...], list[dict] | None, int], ...]
+
+
+class CheckpointedCrawl:
+    """Depth-first listing of a folder tree that can be checkpointed.
+
+    entries() first yields the failing files of the checkpoint again (so
+    they are validated and logged again), then walks the frontier. The
+    consumer calls validated() for every yielded file, in order.
+    """
+
+    def __init__(
+        self,
+        service: object,
+        checkpoint: CrawlCheckpoint,
+        *,
+        concurrency: int = 1,
+        cache: DriveMetadataCache | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> None:
+        """Prepare a crawl continuing from checkpoint.
+
+        Args:
+            service: The Drive v3 service (see list_file_entries).
+            checkpoint: Where to start; CrawlCheckpoint.start for a new run.
+            concurrency: Maximum number of folder listings in flight at once.
+            cache: Optional on-disk cache of folder listings.
+            page_size: Files per files().list page, up to MAX_PAGE_SIZE.
+
+        Raises:
+            ValueError: If page_size is not between 1 and MAX_PAGE_SIZE.
+
+        """
+        check_page_size(page_size)
+        self._service = service
+        self._start = checkpoint
+        self._concurrency = concurrency
+        self._cache = cache
+        self._page_size = page_size
+        self._marks: deque[_Mark] = deque()
+        self._position = _Mark(
+            0,
+            tuple(
+                (f.folder_id, f.prefix_parts, f.items, 0) for f in checkpoint.frontier
+            ),
+        )
+        self._listed = 0
+        self._validated = 0
+        self._restored = len(checkpoint.failing)
+        self._failing: list[tuple[int, DriveEntry]] = []
+
+    @property
+    def resumed(self) -> int:
+        """Return the files validated by earlier runs and not yielded again."""
+        return self._start.total - len(self._start.failing)
+
+    def entries(self) -> Iterator[DriveEntry]:
+        """Yield the checkpoint's failing files, then the rest of the tree.
+
+        With concurrency > 1 (and a recursive checkpoint), the frontier
+        folders are scheduled on a thread pool in the order the walk takes
+        them, and subfolders as soon as their parent is listed, with the
+        same bounded lookahead as list_file_entries.
+        """
+        yield from self._start.failing
+        list_children = children_lister(
+            self._service,
+            self._cache,
+            self._start.root_id,
+            page_size=self._page_size,
+        )
+        stack = [_Frame(*frame) for frame in self._start.frontier]
+        if not (self._start.recursive and self._concurrency > 1):
+            yield from self._walk(
+                stack, lambda folder_id, _: list(list_children(folder_id))
+            )
+            return
+        executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        try:
+            walk = ConcurrentWalk(
+                list_children,
+                executor,
+                max_ahead=self._concurrency * LOOKAHEAD_PER_THREAD,
+            )
+            walk.prefetch(_frontier_folders(stack))
+            yield from self._walk(stack, walk.take)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def validated(self, entry: DriveEntry, *, failed: bool) -> None:
+        """Record that the next yielded entry was validated."""
+        index = self._validated - self._restored
+        self._validated += 1
+        if failed:
+            self._failing.append((index, entry))
+        while self._marks and self._marks[0].count <= index + 1:
+            self._position = self._marks.popleft()
+
+    def checkpoint(self) -> CrawlCheckpoint:
+        """Return the position of the last folder boundary validated past."""
+        position = self._position
+        return CrawlCheckpoint(
+            root_id=self._start.root_id,
+            recursive=self._start.recursive,
+            frontier=[
+                CrawlFrame(
+                    folder_id,
+                    prefix_parts,
+                    None
+                    if items is None
+                    else [
+                        {k: item.get(k) for k in CHILD_FIELDS} for item in items[index:]
+                    ],
+                )
+                for folder_id, prefix_parts, items, index in position.frames
+            ],
+            total=self._start.total + position.count,
+            failing=[entry for i, entry in self._failing if i < position.count],
+        )
+
+    def _walk(
+        self,
+        stack: list[_Frame],
+        list_folder: Callable[[str, tuple[str, ...]], list[dict]],
+    ) -> Iterator[DriveEntry]:
+        """Yield the files of the frames on stack, depth-first, marking boundaries."""
+        recursive = self._start.recursive
+        while stack:
+            frame = stack[-1]
+            if frame.items is None:
+                frame.items = list_folder(frame.folder_id, frame.prefix_parts)
+                self._mark(stack)
+            if frame.index == len(frame.items):
+                stack.pop()
+                self._mark(stack)
+                continue
+            item = frame.items[frame.index]
+            frame.index += 1
+            name = item.get("name", "")
+            if item.get("mimeType", "") == FOLDER_MIMETYPE:
+                if recursive:
+                    child_prefix = (*frame.prefix_parts, name)
+                    stack.append(_Frame(item.get("id"), child_prefix, None))
+                continue
+            self._listed += 1
+            yield DriveEntry(
+                name, join_display_path(frame.prefix_parts, name), item.get("id", "")
+            )
+
+    def _mark(self, stack: list[_Frame]) -> None:
+        """Record the walk position after the files listed so far."""
+        mark = _Mark(
+            self._listed,
+            tuple((f.folder_id, f.prefix_parts, f.items, f.index) for f in stack),
+        )
+        if self._validated - self._restored >= mark.count:
+            self._marks.clear()
+            self._position = mark
+        elif self._marks and self._marks[-1].count == mark.count:
+            self._marks[-1] = mark
+        else:
+            self._marks.append(mark)
+
+
+def _frontier_folders(stack: list[_Frame]) -> Iterator[tuple[str, tuple[str, ...]]]:
+    """Yield the frontier folders not listed yet, in the order the walk takes them."""
+    for frame in reversed(stack):
+        if frame.items is None:
+            yield (frame.folder_id, frame.prefix_parts)
+            continue
+        for item in frame.items[frame.index :]:
+            if item.get("mimeType", "") == FOLDER_MIMETYPE:
+                yield (item.get("id"), (*frame.prefix_parts, item.get("name", "")))
@@ -2,17 +2,36 @@
 
 Uses OAuth 2.0 Desktop app flow. Credential and token paths are read from
 environment variables (e.g. after loading .env with python-dotenv).
+
+The Google client libraries take a few hundred milliseconds to import, so
+they are imported inside the functions that need them: importing this
+module (for the constants, the cache or the listing helpers) stays cheap.
+
+The request helpers (execute_request, create_request, the create bodies,
+iter_list_pages, field_mask, check_page_size, join_display_path) and the
+walk machinery (children_lister, ConcurrentWalk) are public to the other
+drive_connection modules, which build on them; the package does not
+export them.
 """
 
+import heapq
 import os
-from collections.abc import Iterator
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from enum import Enum
+from functools import cache, partial
 from pathlib import Path
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, NamedTuple
+
+from drive_connection.cache import DriveMetadataCache
+from drive_connection.executor import get_request_executor
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+    from google_auth_httplib2 import AuthorizedHttp
 
 # Scopes: metadata read for listing; full drive for creating folders and shortcuts.
 SCOPES = [
@@ -28,11 +47,48 @@ DEFAULT_TOKEN_PATH = "token.json"
 FOLDER_MIMETYPE = "application/vnd.google-apps.folder"
 SHORTCUT_MIMETYPE = "application/vnd.google-apps.shortcut"
 
+# Page sizes for files().list: the Drive maximum, also the default, so that
+# a folder with thousands of files takes a few round trips instead of dozens.
+MAX_PAGE_SIZE = 1000
+DEFAULT_PAGE_SIZE = MAX_PAGE_SIZE
+
+# Fields requested for each child of a listed folder: only what the walk
+# and the log need. Smaller responses are faster to send and to parse.
+CHILD_FIELDS = ("id", "name", "mimeType")
+
+# Seconds an HTTP request may take before the transport gives up; the
+# googleapiclient default.
+DEFAULT_HTTP_TIMEOUT = 60
+
+# Folder IDs OR-ed into one "'a' in parents or 'b' in parents" query, kept
+# small enough for the query string to stay well under URL length limits.
+DEFAULT_PARENTS_BATCH_SIZE = 50
+
+
+class ListingStrategy(Enum):
+    """How list_file_names walks a recursive folder tree.
+
+    PER_FOLDER issues one parents query per folder (optionally concurrent).
+    BATCHED lists every folder up front, then fetches files for many
+    folders per query.
+    """
+
+    PER_FOLDER = "per-folder"
+    BATCHED = "batched"
+
 
 class DriveConnectionError(Exception):
     """Raised when credentials are missing, invalid, or the API call fails."""
 
 
+class DriveEntry(NamedTuple):
+    """A listed Drive file or folder: name, log display path and Drive ID."""
+
+    name: str
+    display_path: str
+    file_id: str
+
+
 def _get_credentials_path() -> Path:
     """Return the path to the OAuth client credentials JSON."""
     path = os.environ.get("FENTARXIU_CREDENTIALS_JSON", DEFAULT_CREDENTIALS_PATH)
@@ -45,28 +101,30 @@ def _get_token_path() -> Path:
     return Path(path).expanduser()
 
 
-def load_credentials_and_build_service(
+def load_credentials(
     credentials_path: Path | None = None,
     token_path: Path | None = None,
-) -> object:
-    """Load OAuth credentials and build the Drive v3 service.
+) -> "Credentials":
+    """Load OAuth credentials, running the browser flow if needed.
 
     Uses token_path if it exists and is valid; otherwise runs the
     installed app flow (browser) and saves the token to token_path.
-    Callers should catch DriveConnectionError for missing/invalid
-    credentials or HttpError for API failures.
 
     Args:
         credentials_path: Override for the client secrets JSON path.
         token_path: Override for the stored token JSON path.
 
     Returns:
-        The Google Drive API v3 service object (build('drive', 'v3', ...)).
+        Valid OAuth credentials for the Drive scopes.
 
     Raises:
         DriveConnectionError: If credentials file is missing or auth fails.
 
     """
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     creds_path = credentials_path or _get_credentials_path()
     tok_path = token_path or _get_token_path()
 
@@ -107,83 +165,356 @@ def load_credentials_and_build_service(
         # Save token for next run.
         tok_path.parent.mkdir(parents=True, exist_ok=True)
         tok_path.write_text(creds.to_json())
+    return creds
+
+
+def build_service(
+    creds: "Credentials", *, http: "AuthorizedHttp | None" = None
+) -> object:
+    """Build the Drive v3 service for the given credentials.
+
+    The service is built from the discovery document bundled with
+    googleapiclient, so building never fetches it over the network. The
+    file is read once per process (see _discovery_document), but every
+    build parses the text again.
+
+    Args:
+        creds: Credentials from load_credentials.
+        http: Authorized transport to send the requests through; by
+            default the service gets a new one for creds.
+
+    Returns:
+        The Google Drive API v3 service object (build('drive', 'v3', ...)).
+
+    Raises:
+        DriveConnectionError: If the service cannot be built.
+
+    """
+    from googleapiclient.discovery import build_from_document
 
     try:
-        service = build("drive", "v3", credentials=creds)
+        if http is None:
+            service = build_from_document(_discovery_document(), credentials=creds)
+        else:
+            service = build_from_document(_discovery_document(), http=http)
     except Exception as e:
         msg = f"Failed to build Drive service: {e}"
         raise DriveConnectionError(msg) from e
     return service
 
 
+@cache
+def _discovery_document() -> str:
+    """Return the text of the Drive v3 discovery document of googleapiclient.
+
+    Only the file read is saved: build_from_document parses the text for
+    each service, and the parsed document cannot be shared because
+    building a service adds entries to it in place.
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+
+    document = get_static_doc("drive", "v3")
+    if document is None:
+        msg = "googleapiclient does not ship the Drive v3 discovery document"
+        raise DriveConnectionError(msg)
+    return document
+
+
+def load_credentials_and_build_service(
+    credentials_path: Path | None = None,
+    token_path: Path | None = None,
+) -> object:
+    """Load OAuth credentials and build the Drive v3 service.
+
+    Uses token_path if it exists and is valid; otherwise runs the
+    installed app flow (browser) and saves the token to token_path.
+    Callers should catch DriveConnectionError for missing/invalid
+    credentials or HttpError for API failures.
+
+    Args:
+        credentials_path: Override for the client secrets JSON path.
+        token_path: Override for the stored token JSON path.
+
+    Returns:
+        The Google Drive API v3 service object (build('drive', 'v3', ...)).
+
+    Raises:
+        DriveConnectionError: If credentials file is missing or auth fails.
+
+    """
+    return build_service(load_credentials(credentials_path, token_path))
+
+
+class ThreadLocalService:
+    """Drive service proxy that builds one service per thread.
+
+    Services from build() share an httplib2 transport that is not
+    thread-safe. This proxy exposes ``files()`` and
+    ``new_batch_http_request()`` like a service but delegates to a service
+    built lazily for the calling thread, so it can be passed to
+    list_file_names with concurrency > 1.
+    """
+
+    def __init__(self, factory: Callable[[], object]) -> None:
+        """Build a proxy that calls factory once per thread.
+
+        Args:
+            factory: Zero-argument callable returning a new Drive service,
+                e.g. ``lambda: build_service(creds)``.
+
+        """
+        self._factory = factory
+        self._local = threading.local()
+
+    def files(self) -> object:
+        """Return the Drive files resource of the calling thread's service."""
+        return self._service().files()
+
+    def new_batch_http_request(self, **kwargs: object) -> object:
+        """Return a batch request on the calling thread's service."""
+        return self._service().new_batch_http_request(**kwargs)
+
+    def _service(self) -> object:
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = self._factory()
+            self._local.service = service
+        return service
+
+
+class ServicePool(ThreadLocalService):
+    """Drive services for worker threads, sharing one set of credentials.
+
+    Each thread that uses the pool gets its own service on its own
+    authorized httplib2 transport, so requests from different threads
+    never share a connection, while each thread keeps its connection to
+    Drive open between requests. The credentials are shared: a token
+    refreshed by one transport is used by all of them.
+    """
+
+    def __init__(
+        self, creds: "Credentials", *, timeout: float = DEFAULT_HTTP_TIMEOUT
+    ) -> None:
+        """Build an empty pool; services are created on first use per thread.
+
+        Args:
+            creds: Credentials from load_credentials.
+            timeout: Seconds before a request is abandoned.
+
+        """
+        super().__init__(self._build)
+        self._creds = creds
+        self._timeout = timeout
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Return the number of services (threads) created so far."""
+        with self._lock:
+            return self._size
+
+    def _build(self) -> object:
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+
+        transport = AuthorizedHttp(
+            self._creds, http=httplib2.Http(timeout=self._timeout)
+        )
+        with self._lock:
+            self._size += 1
+        return build_service(self._creds, http=transport)
+
+
 def list_file_names(
     service: object,
     folder_id: str,
     *,
     recursive: bool,
+    concurrency: int = 1,
+    ordered: bool = True,
+    strategy: ListingStrategy = ListingStrategy.PER_FOLDER,
+    batch_size: int = DEFAULT_PARENTS_BATCH_SIZE,
+    cache: DriveMetadataCache | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
 ) -> Iterator[tuple[str, str]]:
     """Yield (file_name, display_path) for each file under the given folder.
 
+    Same listing as list_file_entries (see there for the arguments),
+    without the Drive IDs.
+
+    Yields:
+        (file_name, display_path) for each non-folder item.
+
+    """
+    for entry in list_file_entries(
+        service,
+        folder_id,
+        recursive=recursive,
+        concurrency=concurrency,
+        ordered=ordered,
+        strategy=strategy,
+        batch_size=batch_size,
+        cache=cache,
+        page_size=page_size,
+    ):
+        yield (entry.name, entry.display_path)
+
+
+def list_file_entries(
+    service: object,
+    folder_id: str,
+    *,
+    recursive: bool,
+    concurrency: int = 1,
+    ordered: bool = True,
+    strategy: ListingStrategy = ListingStrategy.PER_FOLDER,
+    batch_size: int = DEFAULT_PARENTS_BATCH_SIZE,
+    cache: DriveMetadataCache | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[DriveEntry]:
+    """Yield a DriveEntry for each file under the given folder.
+
     Folders are never yielded; they are only entered when recursive is True.
     display_path is the file name alone at top level, or "Parent/Child/name"
     when recursive, for use in the log.
 
+    With recursive and concurrency > 1, folders are listed on a pool of
+    that many threads: every subfolder is scheduled as soon as its parent's
+    listing arrives, so round trips overlap instead of running one after
+    another. Only a few listings per thread are kept ahead of the
+    consumer, and each is released once consumed, so memory does not grow
+    with the tree. The
+    service must then be usable from several threads (see ServicePool).
+
+    With recursive and strategy BATCHED, all folders visible to the user
+    are listed first, the subtree under folder_id
+    is rebuilt locally, and files are fetched with one query per
+    batch_size folders. This replaces O(folders) round trips with
+    O(folders / batch_size), at the cost of listing folders outside the
+    subtree. Files come out grouped by batch rather than depth-first, and
+    a folder with several parents in the subtree is only visited under
+    the first path found. concurrency, ordered and cache do not apply.
+
+    With a cache, each folder whose modifiedTime matches its cached
+    listing is served from disk instead of being listed again. The times
+    come with the parent's listing (or one folders-only query per cached
+    parent), so only the folders walked are looked up. Drive does not
+    always update a folder's modifiedTime when a file in it is added or
+    renamed, so a cached listing can miss such changes.
+
     Args:
         service: The Drive v3 service from load_credentials_and_build_service.
         folder_id: The Drive folder ID to list.
         recursive: If True, descend into subfolders and prefix paths.
+        concurrency: Maximum number of folder listings in flight at once.
+        ordered: With concurrency > 1, yield in the same depth-first order
+            as the sequential listing (True) or folder by folder as listings
+            complete (False).
+        strategy: Recursive listing strategy (see ListingStrategy).
+        batch_size: Folders per files query with the BATCHED strategy.
+        cache: Optional on-disk cache of folder listings.
+        page_size: Files per files().list page, up to MAX_PAGE_SIZE.
 
     Yields:
-        (file_name, display_path) for each non-folder item.
+        DriveEntry(name, display_path, file_id) for each non-folder item.
+
+    Raises:
+        ValueError: If page_size is not between 1 and MAX_PAGE_SIZE.
 
     """
-    yield from _list_file_names_impl(
-        service, folder_id, recursive=recursive, prefix_parts=()
-    )
+    check_page_size(page_size)
+    if recursive and strategy is ListingStrategy.BATCHED:
+        items = _list_file_names_batched(
+            service, folder_id, batch_size=batch_size, page_size=page_size
+        )
+    else:
+        list_children = children_lister(service, cache, folder_id, page_size=page_size)
+        if recursive and concurrency > 1:
+            items = _list_file_names_concurrent(
+                list_children, folder_id, concurrency=concurrency, ordered=ordered
+            )
+        else:
+            items = _list_file_names_impl(
+                list_children, folder_id, recursive=recursive, prefix_parts=()
+            )
+    for item, prefix_parts in items:
+        name = item.get("name", "")
+        yield DriveEntry(
+            name, join_display_path(prefix_parts, name), item.get("id", "")
+        )
 
 
 def list_subfolder_names(
     service: object,
     folder_id: str,
+    *,
+    cache: DriveMetadataCache | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
 ) -> Iterator[tuple[str, str]]:
     """Yield (folder_name, display_path) for each direct child folder.
 
-    Only direct children are listed; no recursion. display_path is the
-    folder name (no path prefix).
+    Same listing as list_subfolder_entries, without the Drive IDs.
 
     Args:
         service: The Drive v3 service from load_credentials_and_build_service.
         folder_id: The Drive folder ID to list.
+        cache: Optional on-disk cache of folder listings.
+        page_size: Folders per files().list page, up to MAX_PAGE_SIZE.
 
     Yields:
         (folder_name, display_path) for each direct subfolder.
 
     """
-    page_token: str | None = None
-    while True:
-        try:
-            response = (
-                service.files()
-                .list(
-                    q=f"'{folder_id}' in parents and mimeType = '{FOLDER_MIMETYPE}'",
-                    pageSize=100,
-                    fields="nextPageToken, files(name)",
-                    pageToken=page_token or "",
-                    supportsAllDrives=True,
-                )
-                .execute()
-            )
-        except HttpError as e:
-            msg = f"Drive API error: {e}"
-            raise DriveConnectionError(msg) from e
+    for entry in list_subfolder_entries(
+        service, folder_id, cache=cache, page_size=page_size
+    ):
+        yield (entry.name, entry.display_path)
 
-        for item in response.get("files", []):
-            name = item.get("name", "")
-            yield (name, name)
 
-        page_token = response.get("nextPageToken")
-        if not page_token:
-            break
+def list_subfolder_entries(
+    service: object,
+    folder_id: str,
+    *,
+    cache: DriveMetadataCache | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[DriveEntry]:
+    """Yield a DriveEntry for each direct child folder.
+
+    Only direct children are listed; no recursion. display_path is the
+    folder name (no path prefix).
+
+    Args:
+        service: The Drive v3 service from load_credentials_and_build_service.
+        folder_id: The Drive folder ID to list.
+        cache: Optional on-disk cache of folder listings; the full listing
+            of folder_id is reused while its modifiedTime is unchanged.
+        page_size: Folders per files().list page, up to MAX_PAGE_SIZE.
+
+    Yields:
+        DriveEntry(name, display_path, file_id) for each direct subfolder.
+
+    Raises:
+        ValueError: If page_size is not between 1 and MAX_PAGE_SIZE.
+
+    """
+    check_page_size(page_size)
+    if cache is not None:
+        modified_time = _get_modified_time(service, folder_id)
+        items = _list_children_cached(
+            service, cache, folder_id, modified_time, page_size=page_size
+        )
+        folders = (i for i in items if i.get("mimeType", "") == FOLDER_MIMETYPE)
+    else:
+        folders = iter_list_pages(
+            service,
+            q=f"'{folder_id}' in parents and mimeType = '{FOLDER_MIMETYPE}'",
+            fields=field_mask(("id", "name")),
+            page_size=page_size,
+        )
+    for item in folders:
+        name = item.get("name", "")
+        yield DriveEntry(name, name, item.get("id", ""))
 
 
 def create_folder(
@@ -206,24 +537,9 @@ def create_folder(
         DriveConnectionError: If the API call fails.
 
     """
-    body: dict = {
-        "name": name,
-        "mimeType": FOLDER_MIMETYPE,
-    }
-    if parent_id is not None:
-        body["parents"] = [parent_id]
-    else:
-        body["parents"] = ["root"]
-    try:
-        result = (
-            service.files()
-            .create(body=body, fields="id, name, mimeType", supportsAllDrives=True)
-            .execute()
-        )
-    except HttpError as e:
-        msg = f"Drive API error: {e}"
-        raise DriveConnectionError(msg) from e
-    return result
+    return execute_request(
+        create_request(service, folder_body(name, parent_id)), idempotent=False
+    )
 
 
 def create_shortcut(
@@ -251,6 +567,26 @@ def create_shortcut(
         DriveConnectionError: If the API call fails.
 
     """
+    body = shortcut_body(target_id, name, parent_id, target_mime_type)
+    return execute_request(create_request(service, body), idempotent=False)
+
+
+def folder_body(name: str, parent_id: str | None) -> dict:
+    """Return the files().create body of a folder (in the root without parent)."""
+    return {
+        "name": name,
+        "mimeType": FOLDER_MIMETYPE,
+        "parents": [parent_id] if parent_id is not None else ["root"],
+    }
+
+
+def shortcut_body(
+    target_id: str,
+    name: str | None,
+    parent_id: str | None,
+    target_mime_type: str | None,
+) -> dict:
+    """Return the files().create body of a shortcut to target_id."""
     shortcut_details: dict = {"targetId": target_id}
     if target_mime_type is not None:
         shortcut_details["targetMimeType"] = target_mime_type
@@ -261,60 +597,438 @@ def create_shortcut(
     }
     if name is not None:
         body["name"] = name
+    return body
+
+
+def create_request(service: object, body: dict) -> object:
+    """Return the (unexecuted) files().create request for body."""
+    return service.files().create(
+        body=body, fields="id, name, mimeType", supportsAllDrives=True
+    )
+
+
+def execute_request(request: object, *, cost: int = 1, idempotent: bool = True) -> dict:
+    """Execute a Drive API request through the shared RequestExecutor.
+
+    Rate limiting and retries are the executor's (server errors are only
+    retried for idempotent requests); an HttpError that outlasts them is
+    wrapped in DriveConnectionError.
+    """
+    from googleapiclient.errors import HttpError
+
     try:
-        result = (
-            service.files()
-            .create(body=body, fields="id, name, mimeType", supportsAllDrives=True)
-            .execute()
-        )
+        return get_request_executor().execute(request, cost=cost, idempotent=idempotent)
     except HttpError as e:
         msg = f"Drive API error: {e}"
         raise DriveConnectionError(msg) from e
-    return result
 
 
-def _list_file_names_impl(
+def check_page_size(page_size: int) -> None:
+    """Raise ValueError unless 1 <= page_size <= MAX_PAGE_SIZE."""
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        msg = f"page_size must be between 1 and {MAX_PAGE_SIZE}, got {page_size}"
+        raise ValueError(msg)
+
+
+def field_mask(fields: Iterable[str]) -> str:
+    """Return the files().list field mask selecting fields of each file."""
+    return f"nextPageToken, files({', '.join(fields)})"
+
+
+def iter_list_pages(
+    service: object,
+    *,
+    q: str,
+    fields: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[dict]:
+    """Yield every file resource matching q, following nextPageToken."""
+    page_token: str | None = None
+    while True:
+        response = execute_request(
+            service.files().list(
+                q=q,
+                pageSize=page_size,
+                fields=fields,
+                pageToken=page_token,
+                supportsAllDrives=True,
+            )
+        )
+        yield from response.get("files", [])
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+
+
+def _iter_folder_children(
+    service: object, folder_id: str, *, page_size: int = DEFAULT_PAGE_SIZE
+) -> Iterator[dict]:
+    """Yield the CHILD_FIELDS of every direct child of folder_id."""
+    return iter_list_pages(
+        service,
+        q=f"'{folder_id}' in parents",
+        fields=field_mask(CHILD_FIELDS),
+        page_size=page_size,
+    )
+
+
+def _get_modified_time(service: object, file_id: str) -> str | None:
+    """Return the modifiedTime of a Drive file or folder."""
+    resource = execute_request(
+        service.files().get(
+            fileId=file_id, fields="modifiedTime", supportsAllDrives=True
+        )
+    )
+    return resource.get("modifiedTime")
+
+
+def _subfolder_modified_times(service: object, folder_id: str) -> dict[str, str]:
+    """Return the current modifiedTime of every direct subfolder of folder_id."""
+    return {
+        folder.get("id"): folder.get("modifiedTime")
+        for folder in iter_list_pages(
+            service,
+            q=f"'{folder_id}' in parents and mimeType = '{FOLDER_MIMETYPE}'",
+            fields=field_mask(("id", "modifiedTime")),
+            page_size=MAX_PAGE_SIZE,
+        )
+    }
+
+
+def _list_children_cached(
     service: object,
+    cache: DriveMetadataCache,
+    folder_id: str,
+    modified_time: str | None,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    folder_times: dict[str, str | None] | None = None,
+) -> list[dict]:
+    """Return the direct children of a folder from the cache or the API.
+
+    The cached listing is used if it was stored for modified_time; otherwise
+    the folder is listed in full and stored. With folder_times, the current
+    modifiedTime of each subfolder is recorded there: from the listing
+    itself, or with one folders-only query if the cached listing was used.
+    """
+    if modified_time is not None:
+        cached = cache.get_children(folder_id, modified_time)
+        if cached is not None:
+            if folder_times is not None and any(
+                item.get("mimeType") == FOLDER_MIMETYPE for item in cached
+            ):
+                folder_times.update(_subfolder_modified_times(service, folder_id))
+            return cached
+    items = list(
+        iter_list_pages(
+            service,
+            q=f"'{folder_id}' in parents",
+            fields=field_mask((*CHILD_FIELDS, "modifiedTime")),
+            page_size=page_size,
+        )
+    )
+    if folder_times is not None:
+        folder_times.update(
+            (item.get("id"), item.get("modifiedTime"))
+            for item in items
+            if item.get("mimeType") == FOLDER_MIMETYPE
+        )
+    if modified_time is not None:
+        cache.put_children(folder_id, modified_time, items)
+    return items
+
+
+def children_lister(
+    service: object,
+    cache: DriveMetadataCache | None,
+    root_id: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Callable[[str], Iterable[dict]]:
+    """Return a function listing the direct children of a folder ID.
+
+    Without a cache, children are streamed page by page. With a cache,
+    each folder is served from the cache while its modifiedTime is
+    unchanged. Only the folders walked are looked up: root_id with one
+    files().get, and every subfolder from its parent's listing (see
+    _list_children_cached).
+    """
+    if cache is None:
+        return partial(_iter_folder_children, service, page_size=page_size)
+    modified_times = {root_id: _get_modified_time(service, root_id)}
+
+    def list_children(folder_id: str) -> list[dict]:
+        return _list_children_cached(
+            service,
+            cache,
+            folder_id,
+            modified_times.get(folder_id),
+            page_size=page_size,
+            folder_times=modified_times,
+        )
+
+    return list_children
+
+
+def join_display_path(prefix_parts: tuple[str, ...], name: str) -> str:
+    """Join folder names and the file name into a log display path."""
+    return "/".join(prefix_parts) + "/" + name if prefix_parts else name
+
+
+def _list_file_names_impl(
+    list_children: Callable[[str], Iterable[dict]],
     folder_id: str,
     *,
     recursive: bool,
     prefix_parts: tuple[str, ...],
-) -> Iterator[tuple[str, str]]:
-    """Recursively list file names with path prefix."""
-    page_token: str | None = None
-    while True:
-        try:
-            response = (
-                service.files()
-                .list(
-                    q=f"'{folder_id}' in parents",
-                    pageSize=100,
-                    fields="nextPageToken, files(id, name, mimeType)",
-                    pageToken=page_token or "",
-                    supportsAllDrives=True,
+) -> Iterator[tuple[dict, tuple[str, ...]]]:
+    """Recursively yield (file resource, folder path parts), depth-first."""
+    for item in list_children(folder_id):
+        if item.get("mimeType", "") == FOLDER_MIMETYPE:
+            if recursive:
+                new_prefix = (*prefix_parts, item.get("name", ""))
+                yield from _list_file_names_impl(
+                    list_children,
+                    item.get("id"),
+                    recursive=recursive,
+                    prefix_parts=new_prefix,
                 )
-                .execute()
+            continue
+        yield (item, prefix_parts)
+
+
+_FolderKey = tuple[str, tuple[str, ...]]
+_FolderListing = tuple[_FolderKey, list[dict]]
+
+# Folder listings a concurrent walk keeps in flight or waiting for the
+# consumer, per thread; subfolders found beyond that wait their turn.
+LOOKAHEAD_PER_THREAD = 8
+
+
+class ConcurrentWalk:
+    """Lists a folder tree on a thread pool, scheduling subfolders ahead.
+
+    Each folder is listed (all pages) by one task, which schedules its
+    subfolders before it completes, so the frontier is listed at full
+    concurrency no matter how the consumer iterates. At most max_ahead
+    listings are in flight or held for the consumer; further folders wait
+    in depth-first order (by their position in the tree), so the ones
+    listed next are the ones a depth-first consumer takes next. A listing
+    is released once taken. Tasks are keyed by (folder_id, path parts) so
+    that a folder reachable through two parents is listed under both
+    paths, like the sequential walk does.
+    """
+
+    def __init__(
+        self,
+        list_children: Callable[[str], Iterable[dict]],
+        executor: ThreadPoolExecutor,
+        *,
+        max_ahead: int,
+        ordered: bool = True,
+    ) -> None:
+        """Create a walk; nothing is listed until prefetch or take.
+
+        Args:
+            list_children: Returns every child of a folder ID (all pages).
+            executor: Pool the listings run on.
+            max_ahead: Listings in flight or held for the consumer at most.
+            ordered: If False, completed listings are also queued for
+                iter_as_completed.
+
+        """
+        self._list_children = list_children
+        self._executor = executor
+        self._max_ahead = max_ahead
+        self._ordered = ordered
+        self._lock = threading.RLock()
+        self._futures: dict[_FolderKey, Future[_FolderListing]] = {}
+        # (position, key) heap; a key taken meanwhile is dropped from
+        # _waiting_keys and skipped when popped.
+        self._waiting: list[tuple[tuple[int, ...], _FolderKey]] = []
+        self._waiting_keys: set[_FolderKey] = set()
+        self._completed: SimpleQueue[Future[_FolderListing]] = SimpleQueue()
+        self._unconsumed = 0
+
+    def prefetch(
+        self, keys: Iterable[_FolderKey], position: tuple[int, ...] = ()
+    ) -> None:
+        """Schedule folders the consumer will take, in the order it takes them.
+
+        position is the tree position of their parent; folders beyond
+        max_ahead are scheduled as earlier listings are taken.
+        """
+        with self._lock:
+            for index, key in enumerate(keys):
+                if key not in self._futures and key not in self._waiting_keys:
+                    heapq.heappush(self._waiting, ((*position, index), key))
+                    self._waiting_keys.add(key)
+            self._fill()
+
+    def take(self, folder_id: str, prefix_parts: tuple[str, ...]) -> list[dict]:
+        """Wait for a folder's listing (scheduling it now if needed) and release it."""
+        key = (folder_id, prefix_parts)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                self._waiting_keys.discard(key)
+                future = self._submit(key, ())
+        try:
+            return future.result()[1]
+        finally:
+            self._release(key)
+
+    def iter_ordered(
+        self, folder_id: str, prefix_parts: tuple[str, ...]
+    ) -> Iterator[tuple[dict, tuple[str, ...]]]:
+        """Yield files depth-first, in the same order as the sequential walk."""
+        for item in self.take(folder_id, prefix_parts):
+            if item.get("mimeType", "") == FOLDER_MIMETYPE:
+                child_prefix = (*prefix_parts, item.get("name", ""))
+                yield from self.iter_ordered(item.get("id"), child_prefix)
+            else:
+                yield (item, prefix_parts)
+
+    def iter_as_completed(
+        self, folder_id: str
+    ) -> Iterator[tuple[dict, tuple[str, ...]]]:
+        """Yield files folder by folder, as each folder listing completes.
+
+        The walk must have been created with ordered=False.
+        """
+        self.prefetch([(folder_id, ())])
+        while True:
+            with self._lock:
+                if self._unconsumed == 0:
+                    return
+            key, items = self._completed.get().result()
+            self._release(key)
+            _, prefix_parts = key
+            for item in items:
+                if item.get("mimeType", "") != FOLDER_MIMETYPE:
+                    yield (item, prefix_parts)
+
+    def _submit(
+        self, key: _FolderKey, position: tuple[int, ...]
+    ) -> Future[_FolderListing]:
+        """Submit the listing task of key; the caller holds the lock."""
+        future = self._executor.submit(self._list, key, position)
+        self._futures[key] = future
+        self._unconsumed += 1
+        if not self._ordered:
+            future.add_done_callback(self._completed.put)
+        return future
+
+    def _fill(self) -> None:
+        """Submit waiting folders while fewer than max_ahead are unconsumed."""
+        with self._lock:
+            while self._waiting and self._unconsumed < self._max_ahead:
+                position, key = heapq.heappop(self._waiting)
+                if key in self._waiting_keys:
+                    self._waiting_keys.discard(key)
+                    self._submit(key, position)
+
+    def _release(self, key: _FolderKey) -> None:
+        """Forget a taken listing and schedule the next waiting folders."""
+        with self._lock:
+            if self._futures.pop(key, None) is not None:
+                self._unconsumed -= 1
+            # RuntimeError: executor shut down, the consumer stopped iterating.
+            with suppress(RuntimeError):
+                self._fill()
+
+    def _list(self, key: _FolderKey, position: tuple[int, ...]) -> _FolderListing:
+        folder_id, prefix_parts = key
+        items = list(self._list_children(folder_id))
+        # Subfolders are scheduled before this listing completes, so
+        # _unconsumed cannot reach zero while part of the tree is unlisted.
+        with suppress(RuntimeError):
+            self.prefetch(
+                (
+                    (item.get("id"), (*prefix_parts, item.get("name", "")))
+                    for item in items
+                    if item.get("mimeType", "") == FOLDER_MIMETYPE
+                ),
+                position,
             )
-        except HttpError as e:
-            msg = f"Drive API error: {e}"
-            raise DriveConnectionError(msg) from e
+        return key, items
 
-        for item in response.get("files", []):
-            file_id = item.get("id")
-            name = item.get("name", "")
-            mime = item.get("mimeType", "")
 
-            if mime == FOLDER_MIMETYPE:
-                if recursive:
-                    new_prefix = (*prefix_parts, name)
-                    yield from _list_file_names_impl(
-                        service, file_id, recursive=recursive, prefix_parts=new_prefix
-                    )
-                continue
+def _list_file_names_concurrent(
+    list_children: Callable[[str], Iterable[dict]],
+    folder_id: str,
+    *,
+    concurrency: int,
+    ordered: bool,
+) -> Iterator[tuple[dict, tuple[str, ...]]]:
+    """Recursively yield (file resource, folder path parts) using a thread pool."""
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        walk = ConcurrentWalk(
+            list_children,
+            executor,
+            max_ahead=concurrency * LOOKAHEAD_PER_THREAD,
+            ordered=ordered,
+        )
+        if ordered:
+            yield from walk.iter_ordered(folder_id, ())
+        else:
+            yield from walk.iter_as_completed(folder_id)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-            display_path = "/".join(prefix_parts) + "/" + name if prefix_parts else name
-            yield (name, display_path)
 
-        page_token = response.get("nextPageToken")
-        if not page_token:
-            break
+def _subtree_prefixes(
+    children: dict[str, list[tuple[str, str]]], folder_id: str
+) -> dict[str, tuple[str, ...]]:
+    """Map each folder under folder_id (included) to its path parts.
+
+    Walks the parent -> [(child_id, name)] index depth-first; a folder seen
+    twice (several parents, or a cycle) keeps its first path.
+    """
+    prefixes: dict[str, tuple[str, ...]] = {folder_id: ()}
+    stack = [folder_id]
+    while stack:
+        parent_id = stack.pop()
+        for child_id, name in reversed(children.get(parent_id, [])):
+            if child_id not in prefixes:
+                prefixes[child_id] = (*prefixes[parent_id], name)
+                stack.append(child_id)
+    return prefixes
+
+
+def _list_file_names_batched(
+    service: object,
+    folder_id: str,
+    *,
+    batch_size: int,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[tuple[dict, tuple[str, ...]]]:
+    """Yield (file resource, folder path parts) using parent-batched queries."""
+    children: dict[str, list[tuple[str, str]]] = {}
+    for folder in iter_list_pages(
+        service,
+        q=f"mimeType = '{FOLDER_MIMETYPE}'",
+        fields=field_mask(("id", "name", "parents")),
+        page_size=page_size,
+    ):
+        for parent_id in folder.get("parents", []):
+            children.setdefault(parent_id, []).append(
+                (folder.get("id"), folder.get("name", ""))
+            )
+    prefixes = _subtree_prefixes(children, folder_id)
+
+    folder_ids = list(prefixes)
+    for start in range(0, len(folder_ids), batch_size):
+        batch = folder_ids[start : start + batch_size]
+        parents_clause = " or ".join(f"'{fid}' in parents" for fid in batch)
+        batch_set = set(batch)
+        for item in iter_list_pages(
+            service,
+            q=f"({parents_clause}) and mimeType != '{FOLDER_MIMETYPE}'",
+            fields=field_mask((*CHILD_FIELDS, "parents")),
+            page_size=page_size,
+        ):
+            for parent_id in item.get("parents", []):
+                if parent_id in batch_set:
+                    yield (item, prefixes[parent_id])
@@ -0,0 +1,325 @@
+"""Shared execution of Drive API requests: retries and client-side rate limit.
+
+Every request drive_connection sends goes through the RequestExecutor
+returned by get_request_executor. Before each attempt it takes a token
+from a token bucket sized to the Drive per-user quota, so concurrent
+listings slow down instead of being rejected. A request rejected anyway
+for rate limiting (429, or 403 with a rate-limit reason) or failing with a
+transient server error (500, 502, 503, 504) is retried after a jittered
+exponential backoff; other errors, and errors that outlast the retries,
+are raised to the caller (drive.execute_request wraps them in
+DriveConnectionError). A server error does not tell whether the request
+took effect, so requests that are not idempotent (files().create) are
+executed with idempotent=False and retried on rate limiting only: sending
+them again after a 5xx could create a duplicate.
+
+The executor counts requests, retries and throttle waits, and times every
+attempt; the CLIs reset the counters at the start of a run and report them
+at the end. execute_async does the same for the asyncio client (see
+drive_connection.aio) without blocking its event loop.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+# Drive per-user quota: 12,000 queries per 60 seconds.
+DEFAULT_RATE = 12_000 / 60
+
+# Retries of a failing request, and the backoff before the first one
+# (seconds, doubled on each retry up to MAX_BACKOFF).
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF = 1.0
+MAX_BACKOFF = 32.0
+
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RATE_LIMIT_STATUS = 429
+_RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Return True if error is a Drive rate-limit rejection.
+
+    That is an HTTP 429, or a 403 whose error details carry the
+    rateLimitExceeded or userRateLimitExceeded reason.
+    """
+    if _status(error) == _RATE_LIMIT_STATUS:
+        return True
+    details = getattr(error, "error_details", None)
+    return isinstance(details, list) and any(
+        isinstance(d, dict) and d.get("reason") in _RATE_LIMIT_REASONS for d in details
+    )
+
+
+def is_retryable(error: Exception, *, idempotent: bool = True) -> bool:
+    """Return True if a request failing with error is worth sending again.
+
+    A rate-limit rejection is always retryable: the request was not
+    carried out. A transient server error is only for idempotent requests.
+    """
+    if is_rate_limited(error):
+        return True
+    return idempotent and _status(error) in _RETRY_STATUSES
+
+
+def _status(error: Exception) -> int | None:
+    return getattr(getattr(error, "resp", None), "status", None)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: rate tokens per second, up to capacity.
+
+    reserve() always succeeds and returns how long the caller must wait
+    before sending; waiting callers queue up because the balance can go
+    negative.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum tokens (burst size); defaults to rate.
+            clock: Monotonic clock in seconds.
+
+        Raises:
+            ValueError: If rate or capacity is not positive.
+
+        """
+        capacity = rate if capacity is None else capacity
+        if rate <= 0 or capacity <= 0:
+            msg = f"rate and capacity must be positive, got {rate} and {capacity}"
+            raise ValueError(msg)
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens and return the seconds to wait before using them."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RequestExecutor:
+    """Executes Drive API requests with rate limiting and retries.
+
+    Safe to share between the threads of a concurrent listing: they draw
+    from the same token bucket. Counts every attempt in requests, every
+    backoff in retries and every wait for the rate limiter in
+    throttle_waits. request_seconds adds up the time spent in the attempts
+    themselves (not in waits), so request_seconds / requests is the mean
+    round trip.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = MAX_BACKOFF,
+        rate: float | None = DEFAULT_RATE,
+        burst: float | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        jitter: Callable[[], float] = random.random,
+        async_sleep: Callable[[float], Awaitable[None]] | None = None,
+    ) -> None:
+        """Create an executor.
+
+        Args:
+            max_retries: Times a retryable request is sent again.
+            backoff: Seconds before the first retry; doubled on each one.
+            max_backoff: Upper bound of a single backoff.
+            rate: Requests per second allowed by the token bucket, or None
+                for no client-side rate limit.
+            burst: Token bucket capacity; defaults to rate.
+            sleep: Called with the seconds to wait.
+            clock: Monotonic clock for the token bucket and the timings.
+            jitter: Returns a float in [0, 1) scaling the random half of
+                each backoff.
+            async_sleep: Awaited with the seconds to wait by execute_async;
+                defaults to asyncio.sleep.
+
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.limiter = None if rate is None else TokenBucket(rate, burst, clock=clock)
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._clock = clock
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.throttle_waits = 0
+        self.request_seconds = 0.0
+
+    def execute(
+        self, request: object, *, cost: int = 1, idempotent: bool = True
+    ) -> dict:
+        """Execute request, retrying transient and rate-limit errors.
+
+        Args:
+            request: An unexecuted googleapiclient request (or batch).
+            cost: Quota units it consumes, e.g. the calls in a batch.
+            idempotent: If False, retry rate-limit errors only.
+
+        Returns:
+            The response of the first successful attempt.
+
+        Raises:
+            HttpError: If the request fails with a non-retryable error or
+                still fails after max_retries retries.
+
+        """
+        attempt = 0
+        while True:
+            self.throttle(cost)
+            start = self._clock()
+            try:
+                return request.execute()
+            except Exception as e:
+                if self._gives_up(e, attempt, idempotent=idempotent):
+                    raise
+            finally:
+                self._record(self._clock() - start)
+            self.wait_before_retry(attempt)
+            attempt += 1
+
+    async def execute_async(
+        self,
+        send: Callable[[], Awaitable[dict]],
+        *,
+        cost: int = 1,
+        idempotent: bool = True,
+    ) -> dict:
+        """Await send() with the rate limit and retries of execute.
+
+        The waits are awaited with async_sleep, so other coroutines run
+        meanwhile.
+
+        Args:
+            send: Sends the request once and returns its response; raises
+                HttpError on an error response.
+            cost: Quota units the request consumes.
+            idempotent: If False, retry rate-limit errors only.
+
+        Returns:
+            The response of the first successful attempt.
+
+        Raises:
+            HttpError: If the request fails with a non-retryable error or
+                still fails after max_retries retries.
+
+        """
+        if self._async_sleep is None:
+            import asyncio
+
+            self._async_sleep = asyncio.sleep
+        attempt = 0
+        while True:
+            delay = self._reserve(cost)
+            if delay > 0:
+                await self._async_sleep(delay)
+            start = self._clock()
+            try:
+                return await send()
+            except Exception as e:
+                if self._gives_up(e, attempt, idempotent=idempotent):
+                    raise
+            finally:
+                self._record(self._clock() - start)
+            await self._async_sleep(self._count_retry(attempt))
+            attempt += 1
+
+    def throttle(self, cost: int = 1) -> None:
+        """Wait until the token bucket allows cost more requests."""
+        delay = self._reserve(cost)
+        if delay > 0:
+            self._sleep(delay)
+
+    def wait_before_retry(self, attempt: int) -> None:
+        """Count a retry and sleep the backoff of the given attempt (from 0)."""
+        self._sleep(self._count_retry(attempt))
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Return the backoff before retry number attempt + 1.
+
+        Half of the exponential delay is fixed and half is random, so
+        clients rejected together do not retry together.
+        """
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        return delay / 2 + self._jitter() * delay / 2
+
+    def reset_stats(self) -> None:
+        """Set the request, retry and throttle-wait counters to zero."""
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.throttle_waits = 0
+            self.request_seconds = 0.0
+
+    def _gives_up(self, error: Exception, attempt: int, *, idempotent: bool) -> bool:
+        """Return True unless a request failing with error is sent again."""
+        # Imported on failure only: this is every request's hot path.
+        from googleapiclient.errors import HttpError
+
+        retry = isinstance(error, HttpError) and is_retryable(
+            error, idempotent=idempotent
+        )
+        return not retry or attempt >= self.max_retries
+
+    def _reserve(self, cost: int) -> float:
+        """Take cost tokens; return (and count) the wait before sending."""
+        if self.limiter is None:
+            return 0.0
+        delay = self.limiter.reserve(cost)
+        if delay > 0:
+            with self._lock:
+                self.throttle_waits += 1
+        return delay
+
+    def _count_retry(self, attempt: int) -> float:
+        """Count a retry and return the backoff of the given attempt."""
+        with self._lock:
+            self.retries += 1
+        return self.backoff_delay(attempt)
+
+    def _record(self, seconds: float) -> None:
+        """Count one attempt that took seconds."""
+        with self._lock:
+            self.requests += 1
+            self.request_seconds += seconds
+
+
+_executor = RequestExecutor()
+
+
+def get_request_executor() -> RequestExecutor:
+    """Return the executor used by every drive_connection request."""
+    return _executor
+
+
+def set_request_executor(executor: RequestExecutor) -> RequestExecutor:
+    """Use executor for every drive_connection request; return the previous one."""
+    global _executor
+    previous, _executor = _executor, executor
+    return previous
@@ -0,0 +1,49 @@
+"""Lazy package exports (PEP 562) shared by the Fentarxiu packages.
+
+Kept in its own package so that cli, drive_connection and string_checker
+can use it without importing one another.
+
+A package lists each public name with its defining module and gets a
+module __getattr__ that imports the module on first access, so importing
+the package (or one of its submodules) does not load every module.
+"""
+
+import sys
+from collections.abc import Callable, Mapping
+from importlib import import_module
+
+
+def lazy_module_attrs(
+    module_name: str, attrs: Mapping[str, str]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Return the __getattr__ and __dir__ of a package with lazy exports.
+
+    Use as ``__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)``.
+
+    Args:
+        module_name: The package's __name__; it must be in sys.modules.
+        attrs: Public name -> name of the module defining it.
+
+    Returns:
+        __getattr__, which imports a public name from its module and
+        stores it on the package, and __dir__, which lists the public
+        names, loaded or not.
+
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> object:  # noqa: N807
+        """Import a public name from its module on first access."""
+        defining_module = attrs.get(name)
+        if defining_module is None:
+            msg = f"module {module_name!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(import_module(defining_module), name)
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        """List the public names, loaded or not."""
+        return sorted({*vars(module), *attrs})
+
+    return __getattr__, __dir__
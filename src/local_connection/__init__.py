@@ -0,0 +1,23 @@
+"""Local sources: the files and work folders of a directory tree, manifests.
+
+Offline counterpart of drive_connection for archives on disk (a Drive for
+Desktop mirror, a USB copy...) and for exported listings: needs no
+credentials, so validation runs at disk speed and in CI.
+"""
+
+from local_connection.local import (
+    LocalConnectionError,
+    LocalEntry,
+    list_local_file_entries,
+    list_local_subfolder_entries,
+)
+from local_connection.manifest import MANIFEST_SUFFIXES, read_manifest_entries
+
+__all__ = [
+    "MANIFEST_SUFFIXES",
+    "LocalConnectionError",
+    "LocalEntry",
+    "list_local_file_entries",
+    "list_local_subfolder_entries",
+    "read_manifest_entries",
+]
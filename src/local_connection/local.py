@@ -0,0 +1,155 @@
+"""Local directory listing: files and work folders of a directory tree.
+
+Walks a directory with os.scandir, e.g. a Google Drive for Desktop mirror
+or an archive copied to a USB drive, and yields the same kind of entries
+as the Drive listings so the CLIs can validate either source. Hidden
+entries (names starting with ".", like .DS_Store) and symbolic links to
+directories are skipped: a link is neither followed nor listed as a file.
+"""
+
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from drive_connection.drive import (
+    FOLDER_MIMETYPE,
+    LOOKAHEAD_PER_THREAD,
+    ConcurrentWalk,
+    join_display_path,
+)
+
+
+class LocalConnectionError(Exception):
+    """Raised when a directory or a manifest cannot be read."""
+
+
+class LocalEntry(NamedTuple):
+    """A listed local file or folder: name, log display path and ID.
+
+    file_id identifies the entry in the JSONL and CSV logs like the Drive
+    ID does for Drive entries: the absolute path for directory listings,
+    the id column for manifests.
+    """
+
+    name: str
+    display_path: str
+    file_id: str
+
+
+def list_local_file_entries(
+    root: Path,
+    *,
+    recursive: bool,
+    concurrency: int = 1,
+) -> Iterator[LocalEntry]:
+    """Yield a LocalEntry for each file under root.
+
+    Directories are never yielded; they are only entered when recursive is
+    True. display_path is the file name alone at top level, or
+    "Parent/Child/name" when recursive, like the Drive listings. Entries
+    of each directory come out sorted by name, depth-first, so the output
+    does not depend on the file system.
+
+    With recursive and concurrency > 1, directories are read on a pool of
+    that many threads by the walk of the Drive listings (ConcurrentWalk):
+    subdirectories are read ahead of the output, up to concurrency *
+    LOOKAHEAD_PER_THREAD listings, while the output keeps the sequential
+    order.
+
+    Args:
+        root: Directory to list.
+        recursive: If True, descend into subdirectories and prefix paths.
+        concurrency: Maximum number of directories read at once.
+
+    Yields:
+        LocalEntry(name, display_path, file_id) for each file.
+
+    Raises:
+        LocalConnectionError: If root or a subdirectory cannot be read.
+
+    """
+    root = root.expanduser().absolute()
+    if recursive and concurrency > 1:
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            walk = ConcurrentWalk(
+                _scan_items, executor, max_ahead=concurrency * LOOKAHEAD_PER_THREAD
+            )
+            for item, prefix_parts in walk.iter_ordered(str(root), ()):
+                name = item["name"]
+                yield LocalEntry(
+                    name, join_display_path(prefix_parts, name), item["id"]
+                )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return
+    yield from _walk(str(root), (), recursive=recursive)
+
+
+def list_local_subfolder_entries(root: Path) -> Iterator[LocalEntry]:
+    """Yield a LocalEntry for each direct subdirectory of root, sorted by name.
+
+    Only direct children are listed; no recursion. display_path is the
+    folder name (no path prefix).
+
+    Args:
+        root: Directory to list.
+
+    Yields:
+        LocalEntry(name, display_path, file_id) for each direct subdirectory.
+
+    Raises:
+        LocalConnectionError: If root cannot be read.
+
+    """
+    root = root.expanduser().absolute()
+    for name, path, is_dir in _scan(str(root)):
+        if is_dir:
+            yield LocalEntry(name, name, path)
+
+
+def _scan(path: str) -> list[tuple[str, str, bool]]:
+    """Return (name, path, is_dir) for the visible entries of a directory.
+
+    Symbolic links to directories are left out: following them could loop
+    or list a folder twice, and they are not files either.
+    """
+    try:
+        with os.scandir(path) as entries:
+            children = [
+                (entry.name, entry.path, entry.is_dir(follow_symlinks=False))
+                for entry in entries
+                if not entry.name.startswith(".")
+                and not (entry.is_symlink() and entry.is_dir())
+            ]
+    except OSError as e:
+        msg = f"Cannot read directory {path}: {e}"
+        raise LocalConnectionError(msg) from e
+    children.sort()
+    return children
+
+
+def _walk(
+    path: str, prefix_parts: tuple[str, ...], *, recursive: bool
+) -> Iterator[LocalEntry]:
+    """Recursively yield the files under path, depth-first."""
+    for name, child_path, is_dir in _scan(path):
+        if is_dir:
+            if recursive:
+                yield from _walk(child_path, (*prefix_parts, name), recursive=True)
+            continue
+        yield LocalEntry(name, join_display_path(prefix_parts, name), child_path)
+
+
+def _scan_items(path: str) -> list[dict]:
+    """Return the entries of a directory as ConcurrentWalk items.
+
+    id is the path, and directories get the Drive folder MIME type that
+    the walk descends into.
+    """
+    return [
+        {"id": child_path, "name": name, "mimeType": FOLDER_MIMETYPE if is_dir else ""}
+        for name, child_path, is_dir in _scan(path)
+    ]
@@ -0,0 +1,80 @@
+"""Manifest files: exported listings of the entries to validate.
+
+A manifest has one entry per JSON line (.jsonl) or CSV row (.csv), with a
+"path" (the display path; the name is its last component) and an optional
+"id". A JSONL export of a Drive listing works, and so do the JSONL and CSV
+logs written by the CLIs, so the entries that failed in one run can be
+validated again without listing the archive.
+"""
+
+import csv
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+from local_connection.local import LocalConnectionError, LocalEntry
+
+MANIFEST_SUFFIXES = (".jsonl", ".csv")
+
+
+def read_manifest_entries(path: Path) -> Iterator[LocalEntry]:
+    """Yield a LocalEntry for each record of a manifest, in file order.
+
+    The file is read as it is iterated. A record equal to the one before is
+    skipped, so a CSV log (one row per failure) yields each entry once.
+
+    Args:
+        path: Manifest file, .jsonl or .csv.
+
+    Yields:
+        LocalEntry(name, display_path, file_id) with the record's path and id.
+
+    Raises:
+        LocalConnectionError: If the file cannot be read or is not UTF-8,
+            has an unknown suffix, malformed CSV, or a record has no path.
+
+    """
+    suffix = path.suffix.lower()
+    if suffix not in MANIFEST_SUFFIXES:
+        msg = f"{path}: unknown manifest format (expected .jsonl or .csv)"
+        raise LocalConnectionError(msg)
+    previous = None
+    try:
+        with path.open(encoding="utf-8", newline="") as f:
+            records = _jsonl_records(f, path) if suffix == ".jsonl" else _csv_records(f)
+            for line, record in records:
+                display_path = record.get("path")
+                if not isinstance(display_path, str) or not display_path:
+                    msg = f"{path}:{line}: record without a path"
+                    raise LocalConnectionError(msg)
+                entry = LocalEntry(
+                    display_path.rsplit("/", 1)[-1],
+                    display_path,
+                    str(record.get("id") or ""),
+                )
+                if entry != previous:
+                    yield entry
+                previous = entry
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        msg = f"Cannot read manifest {path}: {e}"
+        raise LocalConnectionError(msg) from e
+
+
+def _jsonl_records(lines: Iterator[str], path: Path) -> Iterator[tuple[int, dict]]:
+    """Yield (line number, object) for each non-blank line."""
+    for line, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except json.JSONDecodeError as e:
+            msg = f"{path}:{line}: invalid JSON: {e}"
+            raise LocalConnectionError(msg) from e
+        yield line, record if isinstance(record, dict) else {}
+
+
+def _csv_records(lines: Iterator[str]) -> Iterator[tuple[int, dict]]:
+    """Yield (line number, row) for each CSV row after the header."""
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, row
@@ -16,29 +16,74 @@ Example:
 
 """
 
-from string_checker.checker import Checker
-from string_checker.data import (
-    InstrumentCatalogue,
-    ParsedFolderName,
-    parse_filename,
-    parse_folder_name,
-)
-from string_checker.failures import FailureKind, ValidationFailure
-from string_checker.rules.folder_name import FolderNameRule, InvalidFolderNameFailure
-from string_checker.rules.folder_valid_chars import (
-    FolderValidCharsRule,
-    InvalidFolderCharacterFailure,
-)
-from string_checker.rules.instrument_name_match import (
-    InstrumentNameMatchRule,
-    InstrumentNameMismatchFailure,
-)
-from string_checker.rules.pdf_extension import NotPdfFailure, PdfExtensionRule
-from string_checker.rules.prefix import InvalidPrefixFailure, PrefixRule
-from string_checker.rules.valid_chars import InvalidCharacterFailure, ValidCharsRule
-from string_checker.rules.voice import InvalidVoiceFailure, VoiceRule
+from typing import TYPE_CHECKING
+
+from lazy_exports import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from string_checker.checker import Checker
+    from string_checker.context import CheckContext
+    from string_checker.data import (
+        CatalogueError,
+        CatalogueIndex,
+        InstrumentCatalogue,
+        ParsedFolderName,
+        parse_filename,
+        parse_folder_name,
+    )
+    from string_checker.failures import FailureKind, ValidationFailure
+    from string_checker.result_cache import ResultCache
+    from string_checker.rules.folder_name import (
+        FolderNameRule,
+        InvalidFolderNameFailure,
+    )
+    from string_checker.rules.folder_valid_chars import (
+        FolderValidCharsRule,
+        InvalidFolderCharacterFailure,
+    )
+    from string_checker.rules.instrument_name_match import (
+        InstrumentNameMatchRule,
+        InstrumentNameMismatchFailure,
+    )
+    from string_checker.rules.pdf_extension import NotPdfFailure, PdfExtensionRule
+    from string_checker.rules.prefix import InvalidPrefixFailure, PrefixRule
+    from string_checker.rules.valid_chars import InvalidCharacterFailure, ValidCharsRule
+    from string_checker.rules.voice import InvalidVoiceFailure, VoiceRule
+
+# Public name -> defining module, imported on first access (PEP 562), so
+# importing one submodule does not load the checker and every rule.
+_LAZY_ATTRS = {
+    "CatalogueError": "string_checker.data",
+    "CatalogueIndex": "string_checker.data",
+    "CheckContext": "string_checker.context",
+    "Checker": "string_checker.checker",
+    "FailureKind": "string_checker.failures",
+    "FolderNameRule": "string_checker.rules.folder_name",
+    "FolderValidCharsRule": "string_checker.rules.folder_valid_chars",
+    "InstrumentCatalogue": "string_checker.data",
+    "InstrumentNameMatchRule": "string_checker.rules.instrument_name_match",
+    "InstrumentNameMismatchFailure": "string_checker.rules.instrument_name_match",
+    "InvalidCharacterFailure": "string_checker.rules.valid_chars",
+    "InvalidFolderCharacterFailure": "string_checker.rules.folder_valid_chars",
+    "InvalidFolderNameFailure": "string_checker.rules.folder_name",
+    "InvalidPrefixFailure": "string_checker.rules.prefix",
+    "InvalidVoiceFailure": "string_checker.rules.voice",
+    "NotPdfFailure": "string_checker.rules.pdf_extension",
+    "ParsedFolderName": "string_checker.data",
+    "PdfExtensionRule": "string_checker.rules.pdf_extension",
+    "PrefixRule": "string_checker.rules.prefix",
+    "ResultCache": "string_checker.result_cache",
+    "ValidCharsRule": "string_checker.rules.valid_chars",
+    "ValidationFailure": "string_checker.failures",
+    "VoiceRule": "string_checker.rules.voice",
+    "parse_filename": "string_checker.data",
+    "parse_folder_name": "string_checker.data",
+}
 
 __all__ = [
+    "CatalogueError",
+    "CatalogueIndex",
+    "CheckContext",
     "Checker",
     "FailureKind",
     "FolderNameRule",
@@ -55,9 +100,12 @@ __all__ = [
     "ParsedFolderName",
     "PdfExtensionRule",
     "PrefixRule",
+    "ResultCache",
     "ValidCharsRule",
     "ValidationFailure",
     "VoiceRule",
     "parse_filename",
     "parse_folder_name",
 ]
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
@@ -2,15 +2,31 @@
 
 Compose several RuleCheckers and run them on a string; the result is
 either Success(None) when all rules pass or Failure(sequence of failures).
+check_many validates many strings, optionally across worker processes.
+An optional ResultCache memoizes results for strings seen before.
 """
 
-from collections.abc import Sequence
+import hashlib
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
 
 from returns.result import Failure, Result, Success
 
+from string_checker.context import CheckContext
 from string_checker.failures.base import ValidationFailure
+from string_checker.result_cache import ResultCache
 from string_checker.rules import RuleChecker
 
+# Names sent to a worker process per task in check_many.
+DEFAULT_CHUNK_SIZE = 1000
+
+CheckResult = Result[None, Sequence[ValidationFailure]]
+
+# Checker installed in each worker process by _init_worker.
+_WORKER_STATE: dict[str, "Checker"] = {}
+
 
 class Checker:
     """Runs a list of rule checkers and aggregates all validation failures.
@@ -18,18 +34,49 @@ class Checker:
     Pass a list of RuleChecker instances (e.g. ValidCharsRule). check(text)
     runs every rule and returns a Result: Success(None) if there are no
     failures, or Failure with a sequence of all failures from every rule.
+
+    The string is wrapped once in a CheckContext shared by all rules, so
+    parsing and normalization happen once per string rather than per rule.
+
+    With a ResultCache, results are memoized by (text, fingerprint()), so
+    a name repeated across the archive is validated once. Rules must not
+    be changed after the checker is built.
     """
 
-    def __init__(self, rules: list[RuleChecker]) -> None:
+    def __init__(
+        self, rules: list[RuleChecker], *, cache: ResultCache | None = None
+    ) -> None:
         """Build a checker that runs the given rules in order.
 
         Args:
             rules: List of rule checkers to run on each validated string.
+            cache: Optional result cache, possibly shared with other checkers.
 
         """
         self._rules = rules
+        self._cache = cache
+        self._fingerprint: str | None = None
+
+    @property
+    def cache(self) -> ResultCache | None:
+        """Return the result cache (for its hit/miss statistics), if any."""
+        return self._cache
+
+    def fingerprint(self) -> str:
+        """Return a SHA-256 hex digest identifying the rule set.
 
-    def check(self, text: str) -> Result[None, Sequence[ValidationFailure]]:
+        Covers each rule's class and configuration, including catalogue
+        contents (see RuleChecker.fingerprint), in order. Computed once.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for rule in self._rules:
+                digest.update(rule.fingerprint().encode())
+                digest.update(b"\x1e")
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def check(self, text: str) -> CheckResult:
         """Validate the string with all rules and return a Result.
 
         Args:
@@ -40,9 +87,119 @@ class Checker:
             aggregated sequence of validation failures otherwise.
 
         """
+        if self._cache is None:
+            return self._check_uncached(text)
+        key = (text, self.fingerprint())
+        result = self._cache.get(key)
+        if result is None:
+            result = self._check_uncached(text)
+            self._cache.put(key, result)
+        return result
+
+    def _check_uncached(self, text: str) -> CheckResult:
+        """Run every rule on text."""
+        context = CheckContext(text)
         failures: list[ValidationFailure] = []
         for rule in self._rules:
-            failures.extend(rule.check(text))
+            failures.extend(rule.check_context(context))
         if not failures:
             return Success(None)
         return Failure(tuple(failures))
+
+    def check_many(
+        self,
+        texts: Iterable[str],
+        *,
+        workers: int = 1,
+        ordered: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[tuple[str, CheckResult]]:
+        """Validate many strings, optionally in parallel worker processes.
+
+        With workers <= 1 the strings are checked in this process, one by
+        one. Otherwise they are split into chunks of chunk_size and checked
+        in a ProcessPoolExecutor; the checker (and so its rules) must be
+        picklable. texts is consumed lazily and at most two chunks per
+        worker are in flight, so memory stays bounded for large inputs.
+        Each worker gets its own empty copy of the result cache, whose
+        statistics are not reported back.
+
+        Args:
+            texts: Strings to validate.
+            workers: Number of worker processes; 1 or less checks in-process.
+            ordered: If True, yield in input order; otherwise yield each
+                chunk as soon as it completes.
+            chunk_size: Number of strings sent to a worker per task.
+
+        Yields:
+            (text, result) for each input string.
+
+        """
+        if workers <= 1:
+            for text in texts:
+                yield text, self.check(text)
+            return
+
+        chunks = _chunked(texts, chunk_size)
+        max_in_flight = workers * 2
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self,)
+        )
+        try:
+            if ordered:
+                yield from _drain_ordered(executor, chunks, max_in_flight)
+            else:
+                yield from _drain_as_completed(executor, chunks, max_in_flight)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def _chunked(texts: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Yield lists of up to size strings from texts."""
+    iterator = iter(texts)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _init_worker(checker: Checker) -> None:
+    """Install the checker in a worker process (ProcessPoolExecutor initializer)."""
+    _WORKER_STATE["checker"] = checker
+
+
+def _check_chunk(chunk: list[str]) -> list[tuple[str, CheckResult]]:
+    """Check a chunk of strings with the worker's checker."""
+    checker = _WORKER_STATE["checker"]
+    return [(text, checker.check(text)) for text in chunk]
+
+
+def _drain_ordered(
+    executor: ProcessPoolExecutor,
+    chunks: Iterator[list[str]],
+    max_in_flight: int,
+) -> Iterator[tuple[str, CheckResult]]:
+    """Submit chunks with bounded look-ahead and yield results in input order."""
+    in_flight: deque[Future[list[tuple[str, CheckResult]]]] = deque(
+        executor.submit(_check_chunk, chunk) for chunk in islice(chunks, max_in_flight)
+    )
+    while in_flight:
+        results = in_flight.popleft().result()
+        for chunk in islice(chunks, 1):
+            in_flight.append(executor.submit(_check_chunk, chunk))
+        yield from results
+
+
+def _drain_as_completed(
+    executor: ProcessPoolExecutor,
+    chunks: Iterator[list[str]],
+    max_in_flight: int,
+) -> Iterator[tuple[str, CheckResult]]:
+    """Submit chunks with bounded look-ahead and yield each as it completes."""
+    in_flight = {
+        executor.submit(_check_chunk, chunk) for chunk in islice(chunks, max_in_flight)
+    }
+    while in_flight:
+        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+        for chunk in islice(chunks, len(done)):
+            in_flight.add(executor.submit(_check_chunk, chunk))
+        for future in done:
+            yield from future.result()
@@ -0,0 +1,48 @@
+"""Shared per-string context for a single Checker run.
+
+Checker builds one CheckContext per validated string and hands it to every
+rule, so derived views (stripped/lowercased text, prefix match, parsed
+filename) are computed at most once per string instead of once per rule.
+Each view is computed lazily on first access; folder checkers that never
+ask for the parsed filename never pay for it.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import cached_property
+
+from string_checker.data.parser import (
+    ParsedFilename,
+    match_prefix,
+    parse_prefix_match,
+)
+
+
+@dataclass(frozen=True)
+class CheckContext:
+    """The string under validation plus lazily cached derived views."""
+
+    text: str
+    """The original string passed to Checker.check."""
+
+    @cached_property
+    def stripped(self) -> str:
+        """Text with surrounding whitespace removed."""
+        return self.text.strip()
+
+    @cached_property
+    def stripped_lower(self) -> str:
+        """Stripped text, lowercased (for case-insensitive suffix checks)."""
+        return self.stripped.lower()
+
+    @cached_property
+    def prefix_match(self) -> re.Match[str] | None:
+        """Match of the 4-digit block prefix, or None if the prefix is invalid."""
+        return match_prefix(self.text)
+
+    @cached_property
+    def parsed(self) -> ParsedFilename | None:
+        """Parsed filename (blocks and names), or None if it does not parse."""
+        if self.prefix_match is None:
+            return None
+        return parse_prefix_match(self.text, self.prefix_match)
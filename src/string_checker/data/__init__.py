@@ -1,15 +1,55 @@
 """Data and parsing for instrument-code filenames."""
 
-from string_checker.data.catalogue import InstrumentCatalogue
-from string_checker.data.catalogue_data import CATALOGUE_TABLE
-from string_checker.data.folder_parser import ParsedFolderName, parse_folder_name
-from string_checker.data.parser import ParsedFilename, parse_filename
+from typing import TYPE_CHECKING
+
+from lazy_exports import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from string_checker.data.catalogue import InstrumentCatalogue
+    from string_checker.data.catalogue_data import CATALOGUE_TABLE
+    from string_checker.data.catalogue_index import (
+        CatalogueIndex,
+        normalize_instrument_name,
+    )
+    from string_checker.data.catalogue_io import COMPILED_SUFFIX, CatalogueError
+    from string_checker.data.folder_parser import ParsedFolderName, parse_folder_name
+    from string_checker.data.parser import (
+        ParsedFilename,
+        match_prefix,
+        parse_filename,
+        parse_prefix_match,
+    )
+
+# Public name -> defining module, imported on first access (see
+# lazy_exports).
+_LAZY_ATTRS = {
+    "CATALOGUE_TABLE": "string_checker.data.catalogue_data",
+    "COMPILED_SUFFIX": "string_checker.data.catalogue_io",
+    "CatalogueError": "string_checker.data.catalogue_io",
+    "CatalogueIndex": "string_checker.data.catalogue_index",
+    "InstrumentCatalogue": "string_checker.data.catalogue",
+    "ParsedFilename": "string_checker.data.parser",
+    "ParsedFolderName": "string_checker.data.folder_parser",
+    "match_prefix": "string_checker.data.parser",
+    "normalize_instrument_name": "string_checker.data.catalogue_index",
+    "parse_filename": "string_checker.data.parser",
+    "parse_folder_name": "string_checker.data.folder_parser",
+    "parse_prefix_match": "string_checker.data.parser",
+}
 
 __all__ = [
     "CATALOGUE_TABLE",
+    "COMPILED_SUFFIX",
+    "CatalogueError",
+    "CatalogueIndex",
     "InstrumentCatalogue",
     "ParsedFilename",
     "ParsedFolderName",
+    "match_prefix",
+    "normalize_instrument_name",
     "parse_filename",
     "parse_folder_name",
+    "parse_prefix_match",
 ]
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
@@ -1,36 +1,145 @@
 """Instrument catalogue: (instrument_range, code) -> normalized name."""
 
+from collections.abc import Mapping
+from functools import cache
+from pathlib import Path
+
 from string_checker.data.catalogue_data import CATALOGUE_TABLE
+from string_checker.data.catalogue_index import CatalogueIndex
+from string_checker.data.catalogue_io import (
+    CatalogueError,
+    load_catalogue_index,
+    write_compiled_catalogue,
+)
 
 
 class InstrumentCatalogue:
     """Maps (instrument_range, code) to normalized instrument name.
 
-    Use default() for the built-in catalogue from catalogue_data.
+    Use default() for the built-in catalogue from catalogue_data, or
+    from_file() for a CSV, JSON, TOML or compiled catalogue. The table
+    is compiled once into an immutable CatalogueIndex (see index) that also
+    supports reverse and normalized-name lookups.
+
+    The default catalogue is shared and pickles as a reference to
+    default(), and a catalogue loaded with from_file as a reference to its
+    file, so worker processes do not receive a copy of the table.
     """
 
-    def __init__(self, table: dict[tuple[int, str], str] | None = None) -> None:
+    def __init__(
+        self, table: Mapping[tuple[int, str], str] | CatalogueIndex | None = None
+    ) -> None:
         """Build catalogue from table or use built-in data.
 
         Args:
-            table: Optional (instrument_range, code) -> normalized instrument name.
-                If None, uses CATALOGUE_TABLE.
+            table: Optional (instrument_range, code) -> normalized instrument name,
+                or an already compiled CatalogueIndex. If None, uses
+                CATALOGUE_TABLE. A table is copied into the index; later
+                changes to it are not seen.
+
+        """
+        self._is_default = table is None
+        self._source: Path | None = None
+        if isinstance(table, CatalogueIndex):
+            self._index = table
+        else:
+            self._index = CatalogueIndex(
+                table if table is not None else CATALOGUE_TABLE
+            )
 
+    def __reduce__(self) -> tuple[object, tuple]:
+        """Pickle the default and file catalogues by reference, others by entries.
+
+        A file catalogue is pickled as its path and fingerprint; unpickling
+        loads the file once per process and fails if it has changed.
         """
-        self._table = table if table is not None else CATALOGUE_TABLE
+        if self._is_default:
+            return (_default_catalogue, ())
+        if self._source is not None:
+            return (_file_catalogue, (str(self._source), self.fingerprint()))
+        table = {(r, c): n for r, c, n in self._index}
+        return (InstrumentCatalogue, (table,))
 
     @classmethod
     def default(cls) -> "InstrumentCatalogue":
-        """Return the default catalogue (data from catalogue_data.py)."""
-        return cls()
+        """Return the default catalogue (data from catalogue_data.py).
+
+        The instance is built once per process and shared.
+        """
+        return _default_catalogue()
+
+    @classmethod
+    def from_file(cls, path: Path) -> "InstrumentCatalogue":
+        """Load a catalogue from a .csv, .json, .toml or compiled .fxcat file.
+
+        See catalogue_io for the file formats. Compiled files are read
+        through a memory map and skip parsing and normalization, which
+        keeps startup fast for catalogues with thousands of entries.
+
+        Args:
+            path: Catalogue file.
+
+        Returns:
+            The loaded catalogue.
+
+        Raises:
+            CatalogueError: If the file cannot be read or has invalid or
+                duplicate (instrument_range, code) entries.
+
+        """
+        catalogue = cls(load_catalogue_index(path))
+        catalogue._source = path.resolve()
+        return catalogue
+
+    def save_compiled(self, path: Path) -> None:
+        """Write the catalogue in the compiled format read by from_file.
+
+        Args:
+            path: Destination file, conventionally with a .fxcat suffix.
+
+        """
+        write_compiled_catalogue(self._index, path)
+
+    @property
+    def index(self) -> CatalogueIndex:
+        """Return the compiled lookup index."""
+        return self._index
 
     def get_name(self, instrument_range: int, code: str) -> str | None:
         """Return normalized name for (instrument_range, prefix_code),.
 
         or None if not in catalogue.
         """
-        return self._table.get((instrument_range, code))
+        return self._index.get_name(instrument_range, code)
 
     def has(self, instrument_range: int, code: str) -> bool:
         """Return True if (instrument_range, code) exists in the catalogue."""
-        return (instrument_range, code) in self._table
+        return self._index.has(instrument_range, code)
+
+    def fingerprint(self) -> str:
+        """Return a SHA-256 hex digest of the catalogue contents.
+
+        Two catalogues with the same entries have the same fingerprint.
+        """
+        return self._index.fingerprint()
+
+
+@cache
+def _default_catalogue() -> InstrumentCatalogue:
+    """Return the process-wide default catalogue."""
+    return InstrumentCatalogue()
+
+
+@cache
+def _file_catalogue(path: str, fingerprint: str) -> InstrumentCatalogue:
+    """Return the catalogue in path, loaded once per process.
+
+    Raises:
+        CatalogueError: If the file no longer has the given fingerprint.
+
+    """
+    catalogue = InstrumentCatalogue.from_file(Path(path))
+    if catalogue.fingerprint() != fingerprint:
+        msg = f"{path}: the catalogue changed after it was loaded"
+        raise CatalogueError(msg)
+    return catalogue
@@ -0,0 +1,157 @@
+"""Compiled, immutable lookup index over instrument catalogue entries.
+
+Built once from a (instrument_range, code) -> name table. Every lookup is a
+dict access: by key, by exact name, by normalized name (case-folded, accents
+and separators removed) and by instrument_range.
+"""
+
+import hashlib
+import unicodedata
+from collections.abc import Iterator, Mapping, Sequence
+from types import MappingProxyType
+
+CatalogueKey = tuple[int, str]
+CatalogueEntry = tuple[int, str, str]
+
+
+def normalize_instrument_name(name: str) -> str:
+    """Return name case-folded, without accents and without separators.
+
+    "CornAnglès", "corn angles" and "Corn-Angles" all normalize to
+    "cornangles", so near-miss names can be matched to catalogue entries.
+    """
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    return "".join(
+        char
+        for char in decomposed
+        if char.isalnum() and not unicodedata.combining(char)
+    )
+
+
+def _group(pairs: Iterator[tuple[object, object]]) -> Mapping:
+    """Group (key, value) pairs into a read-only key -> tuple(values) map."""
+    grouped: dict[object, list[object]] = {}
+    for key, value in pairs:
+        grouped.setdefault(key, []).append(value)
+    return MappingProxyType({k: tuple(v) for k, v in grouped.items()})
+
+
+class CatalogueIndex:
+    """Read-only index of catalogue entries in both directions.
+
+    Entries are sorted by (instrument_range, code). A name may appear under
+    several keys, so name lookups return a tuple of keys. Pickling only
+    stores the entries; the lookup maps are rebuilt on unpickling.
+    """
+
+    __slots__ = (
+        "_by_key",
+        "_by_name",
+        "_by_normalized",
+        "_by_range",
+        "_entries",
+        "_fingerprint",
+    )
+
+    def __init__(self, table: Mapping[CatalogueKey, str]) -> None:
+        """Compile the index from a table.
+
+        Args:
+            table: (instrument_range, code) -> normalized instrument name.
+                It is copied; later changes to it do not affect the index.
+
+        """
+        entries = tuple(sorted((r, c, n) for (r, c), n in table.items()))
+        normalized = tuple(normalize_instrument_name(n) for _, _, n in entries)
+        self._build(entries, normalized)
+
+    @classmethod
+    def from_sorted_entries(
+        cls,
+        entries: Sequence[CatalogueEntry],
+        normalized_names: Sequence[str],
+    ) -> "CatalogueIndex":
+        """Build an index from entries already sorted and normalized.
+
+        Skips sorting and name normalization; used to load compiled
+        catalogues. The caller guarantees that entries are sorted by
+        (instrument_range, code) without duplicate keys and that
+        normalized_names[i] is normalize_instrument_name(entries[i][2]).
+
+        Args:
+            entries: (instrument_range, code, name) sorted by key.
+            normalized_names: Normalized name of each entry, same order.
+
+        Returns:
+            The compiled index.
+
+        """
+        index = cls.__new__(cls)
+        index._build(tuple(entries), tuple(normalized_names))  # noqa: SLF001
+        return index
+
+    def _build(
+        self, entries: tuple[CatalogueEntry, ...], normalized: tuple[str, ...]
+    ) -> None:
+        self._entries: tuple[CatalogueEntry, ...] = entries
+        self._by_key: Mapping[CatalogueKey, str] = MappingProxyType(
+            {(r, c): n for r, c, n in entries}
+        )
+        self._by_name: Mapping[str, tuple[CatalogueKey, ...]] = _group(
+            (n, (r, c)) for r, c, n in entries
+        )
+        self._by_normalized: Mapping[str, tuple[CatalogueKey, ...]] = _group(
+            (norm, (r, c)) for (r, c, _), norm in zip(entries, normalized, strict=True)
+        )
+        self._by_range: Mapping[int, tuple[tuple[str, str], ...]] = _group(
+            (r, (c, n)) for r, c, n in entries
+        )
+        self._fingerprint: str | None = None
+
+    def __reduce__(self) -> tuple[object, tuple]:
+        """Pickle as the entries only."""
+        return (CatalogueIndex, (dict(self._by_key),))
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[CatalogueEntry]:
+        """Yield (instrument_range, code, name) sorted by range and code."""
+        return iter(self._entries)
+
+    def get_name(self, instrument_range: int, code: str) -> str | None:
+        """Return the name for (instrument_range, code), or None."""
+        return self._by_key.get((instrument_range, code))
+
+    def has(self, instrument_range: int, code: str) -> bool:
+        """Return True if (instrument_range, code) is in the index."""
+        return (instrument_range, code) in self._by_key
+
+    def keys_for_name(self, name: str) -> tuple[CatalogueKey, ...]:
+        """Return every (instrument_range, code) whose name is exactly name."""
+        return self._by_name.get(name, ())
+
+    def keys_for_normalized_name(self, name: str) -> tuple[CatalogueKey, ...]:
+        """Return every key whose name matches name once both are normalized.
+
+        See normalize_instrument_name.
+        """
+        return self._by_normalized.get(normalize_instrument_name(name), ())
+
+    def entries_in_range(self, instrument_range: int) -> tuple[tuple[str, str], ...]:
+        """Return (code, name) pairs of one instrument_range, sorted by code."""
+        return self._by_range.get(instrument_range, ())
+
+    def ranges(self) -> tuple[int, ...]:
+        """Return the instrument ranges present, in ascending order."""
+        return tuple(self._by_range)
+
+    def fingerprint(self) -> str:
+        """Return a SHA-256 hex digest of the entries."""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for instrument_range, code, name in self._entries:
+                digest.update(f"{instrument_range}\x1f{code}\x1f{name}\x1e".encode())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
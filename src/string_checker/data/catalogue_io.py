@@ -0,0 +1,226 @@
+"""Load instrument catalogues from CSV, JSON, TOML or a compiled binary file.
+
+Text formats hold one entry per row/object with the keys instrument_range
+(0-9), code (two digits) and name:
+
+- CSV: a header row "instrument_range,code,name" and one row per entry.
+- JSON: a list of {"instrument_range": 1, "code": "00", "name": "Flauta"}.
+- TOML: an array of tables, [[instrument]] with the same three keys.
+
+The compiled format (suffix COMPILED_SUFFIX) stores the entries sorted and
+with their normalized names, so it is read through a memory map without
+parsing, sorting or normalizing. Layout (little-endian):
+
+- header: magic b"FXCAT", version (u8), entry count (u32), blob size (u32);
+- one 12-byte record per entry: range (u8), code (2 ASCII bytes), pad,
+  blob offset (u32), name length (u16), normalized name length (u16);
+- blob: UTF-8 name followed by UTF-8 normalized name, per entry.
+"""
+
+import csv
+import json
+import mmap
+import re
+import struct
+import tomllib
+from collections.abc import Iterable, Mapping
+from itertools import pairwise
+from pathlib import Path
+
+from string_checker.data.catalogue_index import (
+    CatalogueIndex,
+    CatalogueKey,
+    normalize_instrument_name,
+)
+
+COMPILED_SUFFIX = ".fxcat"
+
+_MAGIC = b"FXCAT"
+_VERSION = 1
+_HEADER = struct.Struct("<5sBII")
+_RECORD = struct.Struct("<B2sxIHH")
+_CODE_RE = re.compile(r"\d{2}")
+_MAX_RANGE = 9
+_FIELDS = ("instrument_range", "code", "name")
+
+
+class CatalogueError(Exception):
+    """Raised when a catalogue file cannot be read or has invalid entries."""
+
+
+def load_catalogue_index(path: Path) -> CatalogueIndex:
+    """Load a catalogue file into a compiled index.
+
+    The format is chosen by suffix: .csv, .json, .toml or COMPILED_SUFFIX.
+
+    Args:
+        path: Catalogue file.
+
+    Returns:
+        The compiled index of the file's entries.
+
+    Raises:
+        CatalogueError: If the file is missing, unreadable, not UTF-8, of
+            an unknown format, or has invalid or duplicate
+            (instrument_range, code).
+
+    """
+    suffix = path.suffix.lower()
+    if suffix == COMPILED_SUFFIX:
+        return _read_compiled(path)
+    readers = {".csv": _read_csv, ".json": _read_json, ".toml": _read_toml}
+    reader = readers.get(suffix)
+    if reader is None:
+        msg = (
+            f"{path}: unknown catalogue format {suffix!r} "
+            f"(expected .csv, .json, .toml or {COMPILED_SUFFIX})"
+        )
+        raise CatalogueError(msg)
+    try:
+        rows = reader(path)
+        table = _build_table(rows, path)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        msg = f"{path}: cannot read catalogue: {e}"
+        raise CatalogueError(msg) from e
+    return CatalogueIndex(table)
+
+
+def write_compiled_catalogue(index: CatalogueIndex, path: Path) -> None:
+    """Write index in the compiled binary format.
+
+    Args:
+        index: Catalogue index to store.
+        path: Destination file (conventionally with COMPILED_SUFFIX).
+
+    """
+    records = bytearray()
+    blob = bytearray()
+    for instrument_range, code, name in index:
+        name_bytes = name.encode()
+        normalized_bytes = normalize_instrument_name(name).encode()
+        records += _RECORD.pack(
+            instrument_range,
+            code.encode("ascii"),
+            len(blob),
+            len(name_bytes),
+            len(normalized_bytes),
+        )
+        blob += name_bytes + normalized_bytes
+    header = _HEADER.pack(_MAGIC, _VERSION, len(index), len(blob))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(header + records + blob)
+
+
+def _read_csv(path: Path) -> list[tuple[str, object]]:
+    with path.open(encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        missing = set(_FIELDS) - set(reader.fieldnames or ())
+        if missing:
+            msg = f"{path}: missing CSV columns {sorted(missing)}"
+            raise CatalogueError(msg)
+        return [(f"line {reader.line_num}", row) for row in reader]
+
+
+def _read_json(path: Path) -> list[tuple[str, object]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        msg = f"{path}: invalid JSON: {e}"
+        raise CatalogueError(msg) from e
+    if not isinstance(data, list):
+        msg = f"{path}: expected a JSON list of entries"
+        raise CatalogueError(msg)
+    return [(f"entry {i}", row) for i, row in enumerate(data)]
+
+
+def _read_toml(path: Path) -> list[tuple[str, object]]:
+    try:
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    except tomllib.TOMLDecodeError as e:
+        msg = f"{path}: invalid TOML: {e}"
+        raise CatalogueError(msg) from e
+    rows = data.get("instrument", [])
+    if not isinstance(rows, list):
+        msg = f"{path}: expected [[instrument]] tables"
+        raise CatalogueError(msg)
+    return [(f"instrument {i}", row) for i, row in enumerate(rows)]
+
+
+def _build_table(
+    rows: Iterable[tuple[str, object]], path: Path
+) -> dict[CatalogueKey, str]:
+    """Validate (location, row) pairs into a table, rejecting duplicate keys."""
+    table: dict[CatalogueKey, str] = {}
+    seen_at: dict[CatalogueKey, str] = {}
+    for location, row in rows:
+        key, name = _parse_row(row, f"{path}: {location}")
+        if key in table:
+            msg = (
+                f"{path}: {location}: duplicate (instrument_range, code) "
+                f"{key} (first at {seen_at[key]})"
+            )
+            raise CatalogueError(msg)
+        table[key] = name
+        seen_at[key] = location
+    return table
+
+
+def _parse_row(row: object, where: str) -> tuple[CatalogueKey, str]:
+    """Return ((instrument_range, code), name) from one entry, validated."""
+    if not isinstance(row, Mapping) or any(field not in row for field in _FIELDS):
+        msg = f"{where}: expected keys {', '.join(_FIELDS)}"
+        raise CatalogueError(msg)
+    raw_range, code, name = (row[field] for field in _FIELDS)
+    try:
+        instrument_range = int(raw_range)
+    except (TypeError, ValueError) as e:
+        msg = f"{where}: instrument_range {raw_range!r} is not an integer"
+        raise CatalogueError(msg) from e
+    if not 0 <= instrument_range <= _MAX_RANGE:
+        msg = f"{where}: instrument_range {instrument_range} is not in 0-{_MAX_RANGE}"
+        raise CatalogueError(msg)
+    if isinstance(code, int):
+        code = f"{code:02d}"
+    if not isinstance(code, str) or not _CODE_RE.fullmatch(code):
+        msg = f"{where}: code {code!r} is not two digits"
+        raise CatalogueError(msg)
+    if not isinstance(name, str) or not name:
+        msg = f"{where}: name must be a non-empty string"
+        raise CatalogueError(msg)
+    return (instrument_range, code), name
+
+
+def _read_compiled(path: Path) -> CatalogueIndex:
+    """Read a compiled catalogue through a memory map."""
+    try:
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            return _decode_compiled(data, path)
+    except (OSError, ValueError, struct.error) as e:
+        msg = f"{path}: cannot read compiled catalogue: {e}"
+        raise CatalogueError(msg) from e
+
+
+def _decode_compiled(data: mmap.mmap, path: Path) -> CatalogueIndex:
+    """Decode the header, records and names of a compiled catalogue."""
+    magic, version, count, blob_size = _HEADER.unpack_from(data)
+    blob_start = _HEADER.size + count * _RECORD.size
+    if magic != _MAGIC or version != _VERSION or len(data) != blob_start + blob_size:
+        msg = f"{path}: not a version {_VERSION} compiled catalogue"
+        raise CatalogueError(msg)
+    entries: list[tuple[int, str, str]] = []
+    normalized: list[str] = []
+    records = _RECORD.iter_unpack(data[_HEADER.size : blob_start])
+    for instrument_range, code, offset, name_len, norm_len in records:
+        start = blob_start + offset
+        name_end = start + name_len
+        name = data[start:name_end].decode()
+        entries.append((instrument_range, code.decode("ascii"), name))
+        normalized.append(data[name_end : name_end + norm_len].decode())
+    keys = [(r, c) for r, c, _ in entries]
+    if any(a >= b for a, b in pairwise(keys)):
+        msg = f"{path}: entries are not sorted or have duplicate keys"
+        raise CatalogueError(msg)
+    return CatalogueIndex.from_sorted_entries(entries, normalized)
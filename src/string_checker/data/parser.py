@@ -33,9 +33,39 @@ def parse_filename(text: str) -> ParsedFilename | None:
         ParsedFilename with blocks and names, or None if format does not match.
 
     """
-    match = _PREFIX_RE.match(text)
+    match = match_prefix(text)
     if not match:
         return None
+    return parse_prefix_match(text, match)
+
+
+def match_prefix(text: str) -> re.Match[str] | None:
+    """Match the prefix blocks and trailing underscore at the start of text.
+
+    Args:
+        text: Filename with or without .pdf.
+
+    Returns:
+        The prefix match, or None if text does not start with a valid prefix.
+
+    """
+    return _PREFIX_RE.match(text)
+
+
+def parse_prefix_match(text: str, match: re.Match[str]) -> ParsedFilename | None:
+    """Parse blocks and names from text given its prefix match.
+
+    Lets callers that already matched the prefix (see match_prefix) parse
+    without matching the regex a second time.
+
+    Args:
+        text: Filename with or without .pdf.
+        match: Result of match_prefix(text); must not be None.
+
+    Returns:
+        ParsedFilename with blocks and names, or None if format does not match.
+
+    """
     prefix_full = match.group(0)
     # Extract all 4-digit blocks from the prefix (before the final _)
     prefix_part = prefix_full.rstrip("_")
@@ -0,0 +1,106 @@
+"""Bounded LRU cache of Checker results.
+
+Archive filenames repeat a lot (the same part name exists in every work
+folder), so Checker can memoize its results. Keys are (text, fingerprint),
+where the fingerprint identifies the checker's rules and catalogue, so one
+cache can be shared by checkers with different rule sets.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from string_checker.checker import CheckResult
+
+# Results kept by default; each entry is one string and its (small) result.
+DEFAULT_MAXSIZE = 65536
+
+CacheKey = tuple[str, str]
+
+
+class ResultCache:
+    """Least-recently-used map from (text, fingerprint) to a check result.
+
+    Thread-safe. Counts a hit for each lookup served from the cache and a
+    miss otherwise. Pickling (e.g. to send a Checker to worker processes)
+    gives an empty cache with the same maxsize and zeroed counters.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Build an empty cache.
+
+        Args:
+            maxsize: Maximum number of results kept; the least recently
+                used entry is evicted beyond that.
+
+        Raises:
+            ValueError: If maxsize is less than 1.
+
+        """
+        if maxsize < 1:
+            msg = f"maxsize must be at least 1, got {maxsize}"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, CheckResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def __getstate__(self) -> dict[str, int]:
+        """Return the picklable state: the maxsize only."""
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state: dict[str, int]) -> None:
+        """Rebuild an empty cache from __getstate__ output."""
+        self.__init__(state["maxsize"])
+
+    @property
+    def hit_rate(self) -> float:
+        """Return hits / lookups, or 0.0 before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: CacheKey) -> "CheckResult | None":
+        """Return the cached result for key, or None on a miss.
+
+        Args:
+            key: (text, checker fingerprint).
+
+        Returns:
+            The stored result, now marked most recently used, or None.
+
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: CacheKey, result: "CheckResult") -> None:
+        """Store result for key, evicting the least recently used if full.
+
+        Args:
+            key: (text, checker fingerprint).
+            result: The check result; results are immutable and shared.
+
+        """
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
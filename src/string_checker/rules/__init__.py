@@ -7,6 +7,9 @@ and aggregates their failures.
 
 from abc import ABC, abstractmethod
 
+import attrs
+
+from string_checker.context import CheckContext
 from string_checker.failures.base import ValidationFailure
 
 
@@ -17,6 +20,11 @@ class RuleChecker(ABC):
     attribute or property for display (e.g. for logging or user messages).
     The checker runs each rule and collects all failures; no exceptions are
     raised for validation errors.
+
+    Checker calls ``check_context`` with a CheckContext shared by all rules.
+    Rules that need parsed or normalized views of the string override it to
+    reuse the context's cached values, and keep ``check`` as a shim that
+    builds a one-off context.
     """
 
     @abstractmethod
@@ -31,3 +39,42 @@ class RuleChecker(ABC):
 
         """
         ...
+
+    def check_context(self, context: CheckContext) -> list[ValidationFailure]:
+        """Run the rule on a shared check context.
+
+        The default delegates to ``check(context.text)``.
+
+        Args:
+            context: Context for the string being validated.
+
+        Returns:
+            List of validation failures; empty if the string passes this rule.
+
+        """
+        return self.check(context.text)
+
+    def fingerprint(self) -> str:
+        """Return a string identifying what this rule checks.
+
+        Used to key cached results: rules with equal fingerprints must
+        return the same failures for the same string. For attrs rules it
+        is the class name plus every field, using a field's own
+        ``fingerprint()`` when it has one (e.g. InstrumentCatalogue) and
+        its repr otherwise. Other rules fall back to repr(self).
+
+        Returns:
+            A string that changes whenever the rule's behaviour may change.
+
+        """
+        cls = type(self)
+        if not attrs.has(cls):
+            return repr(self)
+        parts = [f"{cls.__module__}.{cls.__qualname__}"]
+        for field in attrs.fields(cls):
+            value = getattr(self, field.name)
+            fingerprint = getattr(value, "fingerprint", None)
+            parts.append(
+                f"{field.name}={fingerprint() if callable(fingerprint) else value!r}"
+            )
+        return "|".join(parts)
@@ -1,4 +1,8 @@
-"""Folder valid-chars rule: same as sheet rule plus & for work folder names."""
+"""Folder valid-chars rule: same as sheet rule plus & for work folder names.
+
+Like ValidCharsRule, scans with a negated class so that only offending
+characters produce match objects.
+"""
 
 import re
 
@@ -10,9 +14,10 @@ from string_checker.rules.folder_valid_chars.failures import (
     InvalidFolderCharacterFailure,
 )
 
-# Letters (incl. accents via \w), digits, space, _ - + . · and &
-_FOLDER_ALLOWED_RE = re.compile(
-    r"[\w\s\-+.\u00B7&]",
+# Any character other than letters (incl. accents via \w), digits, space,
+# _ - + . · and &
+_FOLDER_DISALLOWED_RE = re.compile(
+    r"[^\w\s\-+.\u00B7&]",
     re.UNICODE,
 )
 
@@ -25,8 +30,9 @@ class FolderValidCharsRule(RuleChecker):
 
     def check(self, text: str) -> list[ValidationFailure]:
         """Return failures for each disallowed character."""
-        failures: list[ValidationFailure] = []
-        for i, char in enumerate(text):
-            if _FOLDER_ALLOWED_RE.fullmatch(char) is None:
-                failures.append(InvalidFolderCharacterFailure(index=i, char=char))
-        return failures
+        if _FOLDER_DISALLOWED_RE.search(text) is None:
+            return []
+        return [
+            InvalidFolderCharacterFailure(index=m.start(), char=m.group())
+            for m in _FOLDER_DISALLOWED_RE.finditer(text)
+        ]
@@ -4,7 +4,8 @@ import re
 
 import attrs
 
-from string_checker.data import InstrumentCatalogue, parse_filename
+from string_checker.context import CheckContext
+from string_checker.data import InstrumentCatalogue
 from string_checker.failures.base import ValidationFailure
 from string_checker.rules import RuleChecker
 from string_checker.rules.instrument_name_match.failures import (
@@ -29,8 +30,12 @@ class InstrumentNameMatchRule(RuleChecker):
 
     def check(self, text: str) -> list[ValidationFailure]:
         """Return failures when a name does not match the catalogue."""
+        return self.check_context(CheckContext(text))
+
+    def check_context(self, context: CheckContext) -> list[ValidationFailure]:
+        """Return name mismatch failures, using the shared parse."""
         failures: list[ValidationFailure] = []
-        parsed = parse_filename(text)
+        parsed = context.parsed
         if parsed is None:
             return failures
         for (instrument_range, code, _voice), name in zip(
@@ -2,6 +2,7 @@
 
 import attrs
 
+from string_checker.context import CheckContext
 from string_checker.failures.base import ValidationFailure
 from string_checker.rules import RuleChecker
 from string_checker.rules.pdf_extension.failures import NotPdfFailure
@@ -15,9 +16,12 @@ class PdfExtensionRule(RuleChecker):
 
     def check(self, text: str) -> list[ValidationFailure]:
         """Return failure when the string does not end with .pdf (case-insensitive)."""
-        stripped = text.strip()
-        if not stripped.lower().endswith(".pdf"):
-            if not stripped:
+        return self.check_context(CheckContext(text))
+
+    def check_context(self, context: CheckContext) -> list[ValidationFailure]:
+        """Return failure when the stripped text does not end with .pdf."""
+        if not context.stripped_lower.endswith(".pdf"):
+            if not context.stripped:
                 message = "Filename is empty; it must end with .pdf."
             else:
                 message = "Filename must end with .pdf."
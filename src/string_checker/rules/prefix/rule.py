@@ -1,16 +1,13 @@
 """Prefix rule: filename must start with valid instrument_range+code+voice blocks."""
 
-import re
-
 import attrs
 
-from string_checker.data import InstrumentCatalogue, parse_filename
+from string_checker.context import CheckContext
+from string_checker.data import InstrumentCatalogue
 from string_checker.failures.base import ValidationFailure
 from string_checker.rules import RuleChecker
 from string_checker.rules.prefix.failures import InvalidPrefixFailure
 
-_PREFIX_PATTERN = re.compile(r"^\d{4}(?:\+\d{4})*_")
-
 
 @attrs.define
 class PrefixRule(RuleChecker):
@@ -25,11 +22,15 @@ class PrefixRule(RuleChecker):
 
     def check(self, text: str) -> list[ValidationFailure]:
         """Return failures for invalid or missing prefix."""
+        return self.check_context(CheckContext(text))
+
+    def check_context(self, context: CheckContext) -> list[ValidationFailure]:
+        """Return failures for invalid or missing prefix, using the shared parse."""
         failures: list[ValidationFailure] = []
-        if not text:
+        if not context.text:
             failures.append(InvalidPrefixFailure(message="Filename is empty."))
             return failures
-        if not _PREFIX_PATTERN.match(text):
+        if context.prefix_match is None:
             failures.append(
                 InvalidPrefixFailure(
                     message=(
@@ -39,7 +40,7 @@ class PrefixRule(RuleChecker):
                 )
             )
             return failures
-        parsed = parse_filename(text)
+        parsed = context.parsed
         if parsed is None:
             failures.append(
                 InvalidPrefixFailure(message="Prefix or name part could not be parsed.")
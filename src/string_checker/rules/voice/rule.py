@@ -2,7 +2,7 @@
 
 import attrs
 
-from string_checker.data import parse_filename
+from string_checker.context import CheckContext
 from string_checker.failures.base import ValidationFailure
 from string_checker.rules import RuleChecker
 from string_checker.rules.voice.failures import InvalidVoiceFailure
@@ -18,8 +18,12 @@ class VoiceRule(RuleChecker):
 
     def check(self, text: str) -> list[ValidationFailure]:
         """Return failures when a block's voice digit is not 0-9."""
+        return self.check_context(CheckContext(text))
+
+    def check_context(self, context: CheckContext) -> list[ValidationFailure]:
+        """Return invalid voice failures, using the shared parse."""
         failures: list[ValidationFailure] = []
-        parsed = parse_filename(text)
+        parsed = context.parsed
         if parsed is None:
             return failures
         for instrument_range, code, voice in parsed.blocks:
@@ -0,0 +1,180 @@
+"""Throughput benchmark harness: corpora, timing, baselines and thresholds.
+
+Benchmarks are skipped unless pytest runs with --benchmark. Each benchmark
+times a callable over a synthetic corpus (best of a few rounds) and
+records names per second under "<test name>@<corpus size>", or under the
+test name alone for benchmarks that do not use bench_size. A result more
+than --benchmark-tolerance below the stored baseline fails the test;
+--benchmark-save writes the results to baseline.json. Timings only mean
+something on the machine that took them, so baseline.json is not committed:
+save one locally before comparing. Its results are kept per interpreter and
+platform (see _machine_key), and only those of the running one are compared.
+"""
+
+import json
+import platform
+import time
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.corpus import generate
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_ROUNDS = 3
+
+_RESULTS_KEY = pytest.StashKey[dict[str, float]]()
+
+
+class Benchmark:
+    """Times a callable over a corpus and checks it against the baseline."""
+
+    def __init__(self, key: str, baseline: dict[str, float], tolerance: float) -> None:
+        """Build a benchmark that records its result under key."""
+        self.key = key
+        self._baseline = baseline
+        self._tolerance = tolerance
+        self.result: float | None = None
+
+    def __call__(
+        self,
+        func: Callable[[str], object],
+        items: Sequence[str],
+        *,
+        rounds: int = DEFAULT_ROUNDS,
+    ) -> float:
+        """Return the best throughput (items per second) of func over items.
+
+        Fails the test if it is more than the tolerance below the baseline.
+        """
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for item in items:
+                func(item)
+            best = min(best, time.perf_counter() - start)
+        return self.record(len(items) / best)
+
+    def measure(
+        self, func: Callable[[], int], *, rounds: int = DEFAULT_ROUNDS
+    ) -> float:
+        """Return the best throughput of func, which returns its item count.
+
+        Fails the test if it is more than the tolerance below the baseline.
+        """
+        best = 0.0
+        for _ in range(rounds):
+            start = time.perf_counter()
+            count = func()
+            best = max(best, count / (time.perf_counter() - start))
+        return self.record(best)
+
+    def record(self, throughput: float) -> float:
+        """Record an externally measured throughput and check the baseline."""
+        self.result = throughput
+        expected = self._baseline.get(self.key)
+        if expected is not None and throughput < expected * (1 - self._tolerance):
+            pytest.fail(
+                f"{self.key}: {throughput:,.0f}/s is more than "
+                f"{self._tolerance:.0%} below the baseline {expected:,.0f}/s"
+            )
+        return throughput
+
+
+def _machine_key() -> str:
+    """Return the interpreter and platform a baseline belongs to."""
+    return (
+        f"{platform.python_implementation()}-{platform.python_version()}-"
+        f"{platform.system()}-{platform.machine()}"
+    )
+
+
+def _load_machines() -> dict[str, dict]:
+    """Return every stored baseline, by machine key."""
+    if not BASELINE_PATH.is_file():
+        return {}
+    return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))["machines"]
+
+
+def _load_baseline() -> dict[str, float]:
+    """Return the baseline results of the running interpreter and platform."""
+    return _load_machines().get(_machine_key(), {}).get("results", {})
+
+
+@pytest.fixture(scope="session")
+def bench_size(request: pytest.FixtureRequest) -> int:
+    """Return the corpus size given by --benchmark-size."""
+    return request.config.getoption("--benchmark-size")
+
+
+@pytest.fixture(scope="session")
+def corpus(bench_size: int) -> Callable[[str], list[str]]:
+    """Return a function giving the (cached) corpus of a kind at bench_size."""
+    cache: dict[str, list[str]] = {}
+
+    def get(kind: str) -> list[str]:
+        if kind not in cache:
+            cache[kind] = generate(kind, bench_size)
+        return cache[kind]
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def baseline() -> dict[str, float]:
+    """Return the stored baseline throughputs by benchmark key."""
+    return _load_baseline()
+
+
+@pytest.fixture
+def benchmark(
+    request: pytest.FixtureRequest, baseline: dict[str, float]
+) -> Iterator[Benchmark]:
+    """Yield a Benchmark keyed by this test's name and, if it uses one, corpus size.
+
+    A test depends on the corpus size when bench_size is among its fixtures,
+    directly or through corpus or an archive fixture.
+    """
+    key = request.node.name
+    if "bench_size" in request.fixturenames:
+        key = f"{key}@{request.config.getoption('--benchmark-size')}"
+    # When saving a new baseline, record results without comparing them.
+    if request.config.getoption("--benchmark-save"):
+        baseline = {}
+    bench = Benchmark(key, baseline, request.config.getoption("--benchmark-tolerance"))
+    yield bench
+    if bench.result is not None:
+        request.config.stash.setdefault(_RESULTS_KEY, {})[key] = bench.result
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    """Print the throughput table and save the baseline if requested."""
+    results = config.stash.get(_RESULTS_KEY, {})
+    if not results:
+        return
+    baseline = _load_baseline()
+    terminalreporter.section("benchmark throughput (items/s)")
+    for key, value in sorted(results.items()):
+        expected = baseline.get(key)
+        change = f"{value / expected - 1:+.1%}" if expected else "new"
+        terminalreporter.write_line(f"{key:<70} {value:>14,.0f}  {change}")
+    if config.getoption("--benchmark-save"):
+        machines = _load_machines()
+        machines[_machine_key()] = {
+            "machine": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "processor": platform.processor() or platform.machine(),
+            },
+            "results": {**baseline, **{k: round(v) for k, v in results.items()}},
+        }
+        BASELINE_PATH.write_text(
+            json.dumps({"machines": machines}, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        terminalreporter.write_line(
+            f"baseline for {_machine_key()} saved to {BASELINE_PATH}"
+        )
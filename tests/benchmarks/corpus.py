@@ -0,0 +1,109 @@
+"""Synthetic corpora of sheet filenames and work folder names.
+
+Names are built from CATALOGUE_TABLE so they look like the real archive:
+"1010_Flautí.pdf", "1000+2020_Flauta+Trompeta.pdf", and so on. Every
+generator is deterministic for a given seed.
+"""
+
+import random
+from collections.abc import Callable
+
+from string_checker.data import CATALOGUE_TABLE
+
+_ENTRIES = sorted(CATALOGUE_TABLE.items())
+_EMOJIS = "🎵🎶🎺🎷🥁🎻🎹"
+_WORKS = (
+    "Amparito Roca",
+    "El Fallero",
+    "Paquito el Chocolatero",
+    "Valencia",
+    "Lo Cant del Valencià",
+    "Suite Alcoiana",
+)
+_AUTHORS = ("Texidor", "Serrano", "Ferrero", "Giner", "Blanquer", "Pérez")
+
+
+def _block(rng: random.Random) -> tuple[str, str]:
+    (instrument_range, code), name = rng.choice(_ENTRIES)
+    return f"{instrument_range}{code}{rng.randrange(10)}", name
+
+
+def valid_name(rng: random.Random) -> str:
+    """Return a valid single-block filename, e.g. "1010_Flautí.pdf"."""
+    block, name = _block(rng)
+    return f"{block}_{name}.pdf"
+
+
+def multi_block_name(rng: random.Random) -> str:
+    """Return a valid filename with 2-4 blocks, e.g. "1000+2020_Flauta+Trompeta.pdf"."""
+    blocks = [_block(rng) for _ in range(rng.randint(2, 4))]
+    prefix = "+".join(b for b, _ in blocks)
+    names = "+".join(n for _, n in blocks)
+    return f"{prefix}_{names}.pdf"
+
+
+def emoji_name(rng: random.Random) -> str:
+    """Return a filename with an emoji in the instrument name."""
+    block, name = _block(rng)
+    cut = rng.randrange(len(name) + 1)
+    return f"{block}_{name[:cut]}{rng.choice(_EMOJIS)}{name[cut:]}.pdf"
+
+
+def _wrong_name(rng: random.Random) -> str:
+    block, name = _block(rng)
+    return f"{block}_{name[::-1]}.pdf"
+
+
+def _bad_prefix(rng: random.Random) -> str:
+    _, name = _block(rng)
+    return f"{rng.randrange(100)}_{name}.pdf"
+
+
+def _unknown_code(rng: random.Random) -> str:
+    return f"9{rng.randrange(100):02d}0_Desconegut.pdf"
+
+
+def _no_extension(rng: random.Random) -> str:
+    return valid_name(rng).removesuffix(".pdf")
+
+
+def mixed_name(rng: random.Random) -> str:
+    """Return a filename that is valid about half the time, else has one error."""
+    maker: Callable[[random.Random], str] = rng.choice(
+        (
+            valid_name,
+            valid_name,
+            valid_name,
+            multi_block_name,
+            emoji_name,
+            _wrong_name,
+            _bad_prefix,
+            _unknown_code,
+            _no_extension,
+        )
+    )
+    return maker(rng)
+
+
+def folder_name(rng: random.Random) -> str:
+    """Return a work folder name, with arrangers a third of the time."""
+    work = rng.choice(_WORKS)
+    authors = "+".join(rng.sample(_AUTHORS, rng.randint(1, 2)))
+    if rng.randrange(3) == 0:
+        return f"{work}_{authors}_{rng.choice(_AUTHORS)}"
+    return f"{work}_{authors}"
+
+
+CORPUS_KINDS: dict[str, Callable[[random.Random], str]] = {
+    "valid": valid_name,
+    "mixed": mixed_name,
+    "emoji": emoji_name,
+    "multi_block": multi_block_name,
+}
+
+
+def generate(kind: str, size: int, *, seed: int = 0) -> list[str]:
+    """Return size names of the given kind (see CORPUS_KINDS or "folder")."""
+    maker = folder_name if kind == "folder" else CORPUS_KINDS[kind]
+    rng = random.Random(f"{kind}:{seed}")  # noqa: S311 - reproducible, not secret
+    return [maker(rng) for _ in range(size)]
@@ -0,0 +1,218 @@
+"""In-memory stand-in for the Drive v3 service, backed by a synthetic archive.
+
+FakeDriveService answers the files().list(...).execute() and
+files().get(...).execute() calls made by drive_connection, so listings and
+the CLIs can be benchmarked without network access. Each execute() can
+sleep for a fixed latency to model the API round trip, and pages are capped
+at a server-side page size like the real API.
+
+generate_archive builds the archive: a root folder with fan_out work
+folders (named like real works), each holding sheet files (named from
+CATALOGUE_TABLE, see corpus) and fan_out subfolders, down to depth levels.
+"""
+
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from drive_connection import FOLDER_MIMETYPE
+from tests.benchmarks.corpus import folder_name, mixed_name
+
+ROOT_ID = "root"
+PDF_MIMETYPE = "application/pdf"
+
+_PARENT_RE = re.compile(r"'([^']+)' in parents")
+_FILES_FIELDS_RE = re.compile(r"files\(([^)]*)\)")
+
+
+@dataclass
+class Archive:
+    """A generated folder tree.
+
+    children maps each folder id to its direct children (file resources
+    with id, name, mimeType, parents and modifiedTime), in listing order.
+    """
+
+    children: dict[str, list[dict]] = field(default_factory=dict)
+
+    @property
+    def folder_ids(self) -> list[str]:
+        """Return every folder id, root first, breadth first."""
+        return list(self.children)
+
+    @property
+    def file_count(self) -> int:
+        """Return the number of non-folder files in the archive."""
+        return sum(
+            1
+            for items in self.children.values()
+            for item in items
+            if item["mimeType"] != FOLDER_MIMETYPE
+        )
+
+    @property
+    def folder_count(self) -> int:
+        """Return the number of folders below the root."""
+        return len(self.children) - 1
+
+
+def generate_archive(
+    *,
+    depth: int = 3,
+    fan_out: int = 6,
+    files_per_folder: int = 40,
+    seed: int = 0,
+) -> Archive:
+    """Return a deterministic archive tree.
+
+    Args:
+        depth: Folder levels below the root (1 = only work folders).
+        fan_out: Subfolders per folder above the last level.
+        files_per_folder: Sheet files in every folder below the root.
+        seed: Seed for the names; the same arguments give the same tree.
+
+    Returns:
+        The generated archive. The root holds only folders.
+
+    """
+    rng = random.Random(f"archive:{seed}")  # noqa: S311 - reproducible, not secret
+    archive = Archive({ROOT_ID: []})
+    level = [ROOT_ID]
+    counter = 0
+    for current_depth in range(1, depth + 1):
+        next_level: list[str] = []
+        for parent in level:
+            for _ in range(fan_out):
+                counter += 1
+                folder_id = f"d{counter}"
+                name = folder_name(rng) if current_depth == 1 else f"Part {counter}"
+                archive.children[parent].append(
+                    _resource(folder_id, name, FOLDER_MIMETYPE, parent)
+                )
+                archive.children[folder_id] = [
+                    _resource(
+                        f"{folder_id}f{i}", mixed_name(rng), PDF_MIMETYPE, folder_id
+                    )
+                    for i in range(files_per_folder)
+                ]
+                next_level.append(folder_id)
+        level = next_level
+    for items in archive.children.values():
+        rng.shuffle(items)
+    return archive
+
+
+def _resource(file_id: str, name: str, mime_type: str, parent: str) -> dict:
+    return {
+        "id": file_id,
+        "name": name,
+        "mimeType": mime_type,
+        "parents": [parent],
+        "modifiedTime": "2025-01-01T00:00:00.000Z",
+    }
+
+
+class _Request:
+    """A prepared call; execute() waits for the latency and returns the page."""
+
+    def __init__(
+        self, service: "FakeDriveService", respond: Callable[[], dict]
+    ) -> None:
+        self._service = service
+        self._respond = respond
+
+    def execute(self) -> dict:
+        self._service.record_call()
+        return self._respond()
+
+
+class _Files:
+    """The files() resource of FakeDriveService."""
+
+    def __init__(self, service: "FakeDriveService") -> None:
+        self._service = service
+
+    def list(self, **kwargs: object) -> _Request:
+        return _Request(self._service, lambda: self._service.list_page(**kwargs))
+
+    def get(self, **kwargs: object) -> _Request:
+        return _Request(self._service, lambda: self._service.get_file(**kwargs))
+
+
+class FakeDriveService:
+    """Drive v3 service stand-in serving an Archive.
+
+    Supports the queries drive_connection issues: "'id' in parents"
+    (optionally OR-ed and filtered by mimeType) and the all-folders query,
+    with the fields projection and nextPageToken pagination. Thread-safe,
+    so it can be shared by concurrent listings.
+    """
+
+    def __init__(
+        self, archive: Archive, *, page_size: int = 1000, latency: float = 0.0
+    ) -> None:
+        """Serve archive.
+
+        Args:
+            archive: Tree to serve.
+            page_size: Server-side cap on files per page.
+            latency: Seconds each execute() sleeps.
+
+        """
+        self.archive = archive
+        self.page_size = page_size
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._files = _Files(self)
+        self._by_id = {
+            item["id"]: item for items in archive.children.values() for item in items
+        }
+
+    def files(self) -> _Files:
+        """Return the files resource."""
+        return self._files
+
+    def record_call(self) -> None:
+        """Count one API call and sleep for the configured latency."""
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def list_page(self, **kwargs: object) -> dict:
+        """Answer files().list(q=..., fields=..., pageSize=..., pageToken=...)."""
+        q = str(kwargs["q"])
+        matches = self._query(q)
+        start = int(str(kwargs.get("pageToken") or 0))
+        size = min(int(str(kwargs.get("pageSize") or 100)), self.page_size)
+        page = matches[start : start + size]
+        fields = _FILES_FIELDS_RE.search(str(kwargs.get("fields", "")))
+        if fields:
+            keep = [f.strip() for f in fields.group(1).split(",")]
+            page = [{k: item[k] for k in keep if k in item} for item in page]
+        response: dict = {"files": page}
+        if start + size < len(matches):
+            response["nextPageToken"] = str(start + size)
+        return response
+
+    def get_file(self, **kwargs: object) -> dict:
+        """Answer files().get(fileId=...) with the stored resource."""
+        file_id = str(kwargs["fileId"])
+        item = self._by_id.get(file_id, {"id": file_id})
+        return {"modifiedTime": "2025-01-01T00:00:00.000Z", **item}
+
+    def _query(self, q: str) -> list[dict]:
+        parents = _PARENT_RE.findall(q)
+        if parents:
+            items = [c for p in parents for c in self.archive.children.get(p, [])]
+        else:
+            items = list(self._by_id.values())
+        if f"mimeType = '{FOLDER_MIMETYPE}'" in q:
+            items = [i for i in items if i["mimeType"] == FOLDER_MIMETYPE]
+        elif f"mimeType != '{FOLDER_MIMETYPE}'" in q:
+            items = [i for i in items if i["mimeType"] != FOLDER_MIMETYPE]
+        return items
@@ -0,0 +1,202 @@
+"""Throughput of Drive listings and the CLIs against FakeDriveService."""
+
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+from typer.testing import CliRunner
+
+from cli import sheet_parser, work_parser
+from drive_connection import (
+    DEFAULT_PAGE_SIZE,
+    AsyncDriveClient,
+    ListingStrategy,
+    RequestExecutor,
+    alist_file_names,
+    list_file_names,
+    list_subfolder_names,
+    set_request_executor,
+)
+from tests.benchmarks.conftest import Benchmark
+from tests.benchmarks.fake_drive import (
+    ROOT_ID,
+    Archive,
+    FakeDriveService,
+    generate_archive,
+)
+
+pytestmark = pytest.mark.benchmark
+
+_DEPTH = 3
+_FAN_OUT = 6
+# Per-call latency of the "slow network" benchmarks, in seconds.
+_LATENCY = 0.002
+
+
+@pytest.fixture(autouse=True)
+def _unthrottled() -> Iterator[None]:
+    """Lift the client-side rate limit, which FakeDriveService would hit at once.
+
+    The benchmarks measure the client-side cost per item, executor included.
+    """
+    previous = set_request_executor(RequestExecutor(rate=None))
+    yield
+    set_request_executor(previous)
+
+
+@pytest.fixture(scope="module")
+def archive(bench_size: int) -> Archive:
+    """Return an archive holding about bench_size files."""
+    folders = sum(_FAN_OUT**level for level in range(1, _DEPTH + 1))
+    return generate_archive(
+        depth=_DEPTH,
+        fan_out=_FAN_OUT,
+        files_per_folder=max(1, bench_size // folders),
+    )
+
+
+@pytest.mark.parametrize("strategy", list(ListingStrategy), ids=lambda s: s.value)
+def test_list_file_names(
+    benchmark: Benchmark, archive: Archive, strategy: ListingStrategy
+) -> None:
+    """Recursive listing without latency: client-side overhead per file."""
+    service = FakeDriveService(archive)
+
+    def run() -> int:
+        return sum(
+            1
+            for _ in list_file_names(
+                service, ROOT_ID, recursive=True, strategy=strategy
+            )
+        )
+
+    benchmark.measure(run)
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_list_file_names_with_latency(
+    benchmark: Benchmark, archive: Archive, concurrency: int
+) -> None:
+    """Recursive listing with per-call latency, sequential and concurrent."""
+    service = FakeDriveService(archive, latency=_LATENCY)
+
+    def run() -> int:
+        return sum(
+            1
+            for _ in list_file_names(
+                service, ROOT_ID, recursive=True, concurrency=concurrency
+            )
+        )
+
+    benchmark.measure(run, rounds=1)
+
+
+@pytest.mark.parametrize("concurrency", [8, 64])
+def test_alist_file_names_with_latency(
+    benchmark: Benchmark, archive: Archive, concurrency: int
+) -> None:
+    """Recursive asyncio listing with per-call latency, on one thread."""
+    service = FakeDriveService(archive)
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(_LATENCY)
+        params = request.url.params
+        return httpx.Response(
+            200,
+            json=service.list_page(
+                q=params["q"],
+                fields=params["fields"],
+                pageSize=params["pageSize"],
+                pageToken=params.get("pageToken"),
+            ),
+        )
+
+    async def count() -> int:
+        creds = Credentials(token="access-token")  # noqa: S106
+        transport = httpx.MockTransport(handle)
+        async with AsyncDriveClient(creds, transport=transport) as client:
+            names = alist_file_names(
+                client, ROOT_ID, recursive=True, concurrency=concurrency
+            )
+            return sum([1 async for _ in names])
+
+    benchmark.measure(lambda: asyncio.run(count()), rounds=1)
+
+
+@pytest.mark.parametrize("page_size", [100, DEFAULT_PAGE_SIZE])
+def test_list_large_folder_with_latency(
+    benchmark: Benchmark, bench_size: int, page_size: int
+) -> None:
+    """One folder of bench_size files with per-call latency, by page size."""
+    archive = generate_archive(depth=1, fan_out=1, files_per_folder=bench_size)
+    service = FakeDriveService(archive, latency=_LATENCY)
+
+    def run() -> int:
+        return sum(
+            1
+            for _ in list_file_names(
+                service, ROOT_ID, recursive=True, page_size=page_size
+            )
+        )
+
+    benchmark.measure(run, rounds=1)
+
+
+def test_list_subfolder_names(benchmark: Benchmark, archive: Archive) -> None:
+    """Direct subfolders of every folder in the archive."""
+    service = FakeDriveService(archive)
+
+    def run() -> int:
+        return sum(
+            1
+            for folder_id in archive.folder_ids
+            for _ in list_subfolder_names(service, folder_id)
+        )
+
+    benchmark.measure(run)
+
+
+def test_sheet_parser_cli(
+    benchmark: Benchmark,
+    archive: Archive,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """sheet_parser end to end: list recursively, validate, write the log."""
+    service = FakeDriveService(archive)
+    monkeypatch.setattr(sheet_parser, "_connect", lambda **_: service)
+    args = ["--folder-id", ROOT_ID, "--recursive", "--no-cache"]
+    args += ["--log", str(tmp_path / "sheets.log")]
+
+    def run() -> int:
+        result = CliRunner().invoke(sheet_parser.app, args)
+        assert result.exit_code == 0, result.output
+        return archive.file_count
+
+    benchmark.measure(run)
+
+
+def test_work_parser_cli(
+    benchmark: Benchmark,
+    archive: Archive,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """work_parser end to end over every folder of the archive."""
+    service = FakeDriveService(archive)
+    monkeypatch.setattr(
+        work_parser, "load_credentials_and_build_service", lambda: service
+    )
+    args = ["--no-cache", "--log", str(tmp_path / "works.log")]
+    for folder_id in archive.folder_ids:
+        args += ["--folder-id", folder_id]
+
+    def run() -> int:
+        result = CliRunner().invoke(work_parser.app, args)
+        assert result.exit_code == 0, result.output
+        return archive.folder_count
+
+    benchmark.measure(run)
@@ -0,0 +1,36 @@
+"""Start-up cost of the CLIs: fresh interpreters importing each app.
+
+Throughput is imports per second, so it is comparable with the baseline
+like any other benchmark; 1 / throughput is the start-up time of --help,
+shell completion and offline commands before they do any work.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.conftest import Benchmark
+
+pytestmark = pytest.mark.benchmark
+
+_SRC = Path(__file__).parents[2] / "src"
+_IMPORTS_PER_ROUND = 5
+
+
+@pytest.mark.parametrize(
+    "module", ["cli.sheet_parser", "cli.work_parser", "cli.catalogue_compiler"]
+)
+def test_import_cli(benchmark: Benchmark, module: str) -> None:
+    """Import one CLI app in a new interpreter, a few times per round."""
+    command = [sys.executable, "-c", f"from {module} import app"]
+    env = {**os.environ, "PYTHONPATH": str(_SRC)}
+
+    def run() -> int:
+        for _ in range(_IMPORTS_PER_ROUND):
+            subprocess.run(command, env=env, check=True)  # noqa: S603
+        return _IMPORTS_PER_ROUND
+
+    benchmark.measure(run)
@@ -0,0 +1,59 @@
+"""Throughput of local directory listings over the synthetic archive on disk."""
+
+from pathlib import Path
+
+import pytest
+
+from drive_connection import FOLDER_MIMETYPE
+from local_connection import list_local_file_entries
+from tests.benchmarks.conftest import Benchmark
+from tests.benchmarks.fake_drive import ROOT_ID, Archive, generate_archive
+
+pytestmark = pytest.mark.benchmark
+
+_DEPTH = 3
+_FAN_OUT = 6
+
+
+def _materialize(archive: Archive, root: Path) -> None:
+    """Create the archive's folders and (empty) files under root."""
+    paths = {ROOT_ID: root}
+    for folder_id in archive.folder_ids:
+        for item in archive.children[folder_id]:
+            path = paths[folder_id] / item["name"]
+            if item["mimeType"] == FOLDER_MIMETYPE:
+                path.mkdir(exist_ok=True)
+                paths[item["id"]] = path
+            else:
+                path.touch()
+
+
+@pytest.fixture(scope="module")
+def archive_root(bench_size: int, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a directory holding an archive of about bench_size files."""
+    folders = sum(_FAN_OUT**level for level in range(1, _DEPTH + 1))
+    archive = generate_archive(
+        depth=_DEPTH,
+        fan_out=_FAN_OUT,
+        files_per_folder=max(1, bench_size // folders),
+    )
+    root = tmp_path_factory.mktemp("archive")
+    _materialize(archive, root)
+    return root
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_list_local_file_entries(
+    benchmark: Benchmark, archive_root: Path, concurrency: int
+) -> None:
+    """Recursive scandir walk, sequential and on a thread pool."""
+
+    def run() -> int:
+        return sum(
+            1
+            for _ in list_local_file_entries(
+                archive_root, recursive=True, concurrency=concurrency
+            )
+        )
+
+    benchmark.measure(run)
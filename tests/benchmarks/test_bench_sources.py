@@ -0,0 +1,48 @@
+"""Throughput of the validation engine fed from a manifest, without network."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from cli.log_writer import LogWriter, OutputFormat
+from cli.sheet_parser import _build_checker
+from cli.sources import ManifestSource, validate_source
+from tests.benchmarks.conftest import Benchmark
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def manifest(
+    corpus: Callable[[str], list[str]], tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Return a JSONL manifest of the mixed corpus, one work folder per 40 names."""
+    path = tmp_path_factory.mktemp("sources") / "files.jsonl"
+    with path.open("w", encoding="utf-8") as f:
+        for i, name in enumerate(corpus("mixed")):
+            record = {"path": f"Obra {i // 40}/{name}", "id": f"f{i}"}
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return path
+
+
+def test_read_manifest(benchmark: Benchmark, manifest: Path) -> None:
+    """Parse the manifest into entries."""
+    source = ManifestSource(manifest)
+    benchmark.measure(lambda: sum(1 for _ in source.entries()))
+
+
+@pytest.mark.parametrize("output_format", list(OutputFormat), ids=lambda f: f.value)
+def test_validate_manifest(
+    benchmark: Benchmark, manifest: Path, tmp_path: Path, output_format: OutputFormat
+) -> None:
+    """sheet_parser's engine: read, validate with all rules and write the log."""
+    source = ManifestSource(manifest)
+    log_path = tmp_path / f"sheets.{output_format.value}"
+
+    def run() -> int:
+        with LogWriter(log_path, "Fitxer", output_format) as log:
+            return validate_source(source, _build_checker(), log)
+
+    benchmark.measure(run)
@@ -0,0 +1,92 @@
+"""Throughput of the string_checker hot paths over synthetic corpora."""
+
+from collections.abc import Callable
+
+import pytest
+
+from string_checker import (
+    Checker,
+    FolderNameRule,
+    FolderValidCharsRule,
+    InstrumentCatalogue,
+    InstrumentNameMatchRule,
+    PdfExtensionRule,
+    PrefixRule,
+    ResultCache,
+    ValidCharsRule,
+    VoiceRule,
+    parse_filename,
+    parse_folder_name,
+)
+from string_checker.rules import RuleChecker
+from tests.benchmarks.conftest import Benchmark
+from tests.benchmarks.corpus import CORPUS_KINDS
+
+pytestmark = pytest.mark.benchmark
+
+_KINDS = sorted(CORPUS_KINDS)
+
+
+def _sheet_rules() -> list[RuleChecker]:
+    catalogue = InstrumentCatalogue.default()
+    return [
+        ValidCharsRule(),
+        PrefixRule(catalogue),
+        InstrumentNameMatchRule(catalogue),
+        VoiceRule(),
+        PdfExtensionRule(),
+    ]
+
+
+@pytest.mark.parametrize("kind", _KINDS)
+def test_parse_filename(
+    benchmark: Benchmark, corpus: Callable[[str], list[str]], kind: str
+) -> None:
+    """parse_filename over each corpus kind."""
+    benchmark(parse_filename, corpus(kind))
+
+
+def test_parse_folder_name(
+    benchmark: Benchmark, corpus: Callable[[str], list[str]]
+) -> None:
+    """parse_folder_name over work folder names."""
+    benchmark(parse_folder_name, corpus("folder"))
+
+
+@pytest.mark.parametrize("kind", _KINDS)
+@pytest.mark.parametrize("rule_index", range(5), ids=lambda i: _sheet_rules()[i].name)
+def test_sheet_rule_check(
+    benchmark: Benchmark,
+    corpus: Callable[[str], list[str]],
+    kind: str,
+    rule_index: int,
+) -> None:
+    """Each sheet rule's check over each corpus kind."""
+    benchmark(_sheet_rules()[rule_index].check, corpus(kind))
+
+
+@pytest.mark.parametrize(
+    "rule", [FolderValidCharsRule(), FolderNameRule()], ids=lambda rule: rule.name
+)
+def test_folder_rule_check(
+    benchmark: Benchmark, corpus: Callable[[str], list[str]], rule: RuleChecker
+) -> None:
+    """Each folder rule's check over work folder names."""
+    benchmark(rule.check, corpus("folder"))
+
+
+@pytest.mark.parametrize("kind", _KINDS)
+def test_checker_check(
+    benchmark: Benchmark, corpus: Callable[[str], list[str]], kind: str
+) -> None:
+    """Checker.check with all five sheet rules."""
+    benchmark(Checker(rules=_sheet_rules()).check, corpus(kind))
+
+
+@pytest.mark.parametrize("kind", _KINDS)
+def test_checker_check_cached(
+    benchmark: Benchmark, corpus: Callable[[str], list[str]], kind: str
+) -> None:
+    """Checker.check with a ResultCache (repeated names hit the cache)."""
+    checker = Checker(rules=_sheet_rules(), cache=ResultCache())
+    benchmark(checker.check, corpus(kind))
@@ -0,0 +1,61 @@
+"""FakeDriveService serves its archive the way drive_connection expects."""
+
+import pytest
+
+from drive_connection import (
+    FOLDER_MIMETYPE,
+    ListingStrategy,
+    list_file_names,
+    list_subfolder_names,
+)
+from tests.benchmarks.fake_drive import (
+    ROOT_ID,
+    FakeDriveService,
+    generate_archive,
+)
+
+
+@pytest.mark.parametrize("strategy", list(ListingStrategy))
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_list_file_names_yields_every_file(
+    strategy: ListingStrategy, concurrency: int
+) -> None:
+    """Every strategy lists every file of a paginated archive once."""
+    archive = generate_archive(depth=2, fan_out=3, files_per_folder=5)
+    service = FakeDriveService(archive, page_size=4)
+
+    listed = list(
+        list_file_names(
+            service,
+            ROOT_ID,
+            recursive=True,
+            concurrency=concurrency,
+            strategy=strategy,
+        )
+    )
+
+    expected = sorted(
+        item["name"]
+        for items in archive.children.values()
+        for item in items
+        if item["mimeType"] != FOLDER_MIMETYPE
+    )
+    assert sorted(name for name, _ in listed) == expected
+    assert len(listed) == archive.file_count == 12 * 5
+
+
+def test_list_subfolder_names_follows_pages() -> None:
+    """Pages are capped at the service's page_size."""
+    archive = generate_archive(depth=1, fan_out=7, files_per_folder=0)
+    service = FakeDriveService(archive, page_size=3)
+
+    names = [name for name, _ in list_subfolder_names(service, ROOT_ID)]
+
+    assert len(names) == 7
+    assert service.calls == 3
+
+
+def test_generate_archive_is_deterministic() -> None:
+    """The same seed gives the same archive."""
+    assert generate_archive(seed=1) == generate_archive(seed=1)
+    assert generate_archive(seed=1) != generate_archive(seed=2)
@@ -1,10 +1,51 @@
-"""Shared pytest fixtures."""
+"""Shared pytest fixtures and the opt-in benchmark options."""
 
 import pytest
 
 from string_checker import InstrumentCatalogue
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the benchmark options (see tests/benchmarks)."""
+    group = parser.getgroup("benchmark", "throughput benchmarks (tests/benchmarks)")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run tests marked benchmark (skipped otherwise).",
+    )
+    group.addoption(
+        "--benchmark-size",
+        type=int,
+        default=10_000,
+        help="Names per synthetic corpus, e.g. 10000, 100000 or 1000000.",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.3,
+        help="Fail when throughput drops more than this fraction below baseline.",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        default=False,
+        help="Write the measured throughputs to the baseline file.",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip benchmark tests unless --benchmark is given."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark: run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture
 def default_catalogue() -> InstrumentCatalogue:
     """Default instrument catalogue (built-in data)."""
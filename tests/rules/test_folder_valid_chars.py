@@ -1,5 +1,7 @@
 """Tests for FolderValidCharsRule."""
 
+import re
+
 from string_checker import FolderValidCharsRule, InvalidFolderCharacterFailure
 
 
@@ -55,3 +57,17 @@ class TestFolderValidCharsRuleDisallowed:
         assert result[0].char == "@"
         assert result[1].index == 3
         assert result[1].char == "#"
+
+
+class TestFolderValidCharsRuleMatchesPerCharacterCheck:
+    """The single-pass scan reports exactly what a per-character check would."""
+
+    def test_every_code_point_matches_reference(self) -> None:
+        allowed = re.compile(r"[\w\s\-+.·&]")
+        text = "".join(chr(cp) for cp in range(0x30000) if not 0xD800 <= cp < 0xE000)
+        expected = [
+            InvalidFolderCharacterFailure(index=i, char=char)
+            for i, char in enumerate(text)
+            if allowed.fullmatch(char) is None
+        ]
+        assert FolderValidCharsRule().check(text) == expected
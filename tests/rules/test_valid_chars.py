@@ -1,5 +1,7 @@
 """Tests for ValidCharsRule."""
 
+import re
+
 from string_checker import InvalidCharacterFailure, ValidCharsRule
 
 
@@ -69,3 +71,17 @@ class TestValidCharsRuleAllowedOverride:
     def test_override_accepts_all_no_failures(self) -> None:
         rule = ValidCharsRule(allowed_override=lambda _: True)
         assert rule.check("!@#🎵") == []
+
+
+class TestValidCharsRuleMatchesPerCharacterCheck:
+    """The single-pass scan reports exactly what a per-character check would."""
+
+    def test_every_code_point_matches_reference(self) -> None:
+        allowed = re.compile(r"[\w\s\-+.·]")
+        text = "".join(chr(cp) for cp in range(0x30000) if not 0xD800 <= cp < 0xE000)
+        expected = [
+            InvalidCharacterFailure(index=i, char=char)
+            for i, char in enumerate(text)
+            if allowed.fullmatch(char) is None
+        ]
+        assert ValidCharsRule().check(text) == expected
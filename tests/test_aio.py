@@ -0,0 +1,279 @@
+"""Tests for the asyncio Drive client (httpx mock transport) and --async."""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import aclosing
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+from typer.testing import CliRunner
+
+from cli import sheet_parser, work_parser
+from drive_connection import (
+    AsyncDriveClient,
+    DriveConnectionError,
+    RequestExecutor,
+    alist_file_entries,
+    alist_file_names,
+    alist_subfolder_entries,
+    alist_subfolder_entries_many,
+    iter_blocking,
+    list_file_entries,
+    list_subfolder_entries,
+    set_request_executor,
+)
+from drive_connection.drive import LOOKAHEAD_PER_THREAD
+from tests.benchmarks.fake_drive import ROOT_ID, FakeDriveService, generate_archive
+
+_ARCHIVE = generate_archive(depth=3, fan_out=3, files_per_folder=4)
+
+
+@pytest.fixture(autouse=True)
+def sleeps() -> Iterator[list[float]]:
+    """Install an unthrottled executor (2 retries, 1 s backoff) recording waits."""
+    sleeps: list[float] = []
+
+    async def async_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    executor = RequestExecutor(
+        max_retries=2, rate=None, jitter=lambda: 1, async_sleep=async_sleep
+    )
+    previous = set_request_executor(executor)
+    yield sleeps
+    set_request_executor(previous)
+
+
+def _client(service: FakeDriveService, *statuses: int) -> AsyncDriveClient:
+    """Return a client served by service; the first requests get statuses."""
+    errors = list(statuses)
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "Bearer access-token"
+        if errors:
+            return httpx.Response(errors.pop(0), json={"error": {"code": 0}})
+        params = request.url.params
+        # The first page is requested without a pageToken, not an empty one.
+        assert params.get("pageToken", "first page")
+        return httpx.Response(
+            200,
+            json=service.list_page(
+                q=params["q"],
+                fields=params["fields"],
+                pageSize=params["pageSize"],
+                pageToken=params.get("pageToken"),
+            ),
+        )
+
+    creds = Credentials(token="access-token")  # noqa: S106
+    return AsyncDriveClient(creds, transport=httpx.MockTransport(handle))
+
+
+def _collect(iterator: AsyncIterator[Any]) -> list[Any]:
+    async def collect() -> list[Any]:
+        return [item async for item in iterator]
+
+    return asyncio.run(collect())
+
+
+class TestAsyncListing:
+    """The async generators yield the synchronous listings, in order."""
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    @pytest.mark.parametrize("recursive", [True, False])
+    def test_file_entries_match_list_file_entries(
+        self,
+        concurrency: int,
+        recursive: bool,  # noqa: FBT001
+    ) -> None:
+        service = FakeDriveService(_ARCHIVE, page_size=3)
+        entries = _collect(
+            alist_file_entries(
+                _client(service),
+                ROOT_ID,
+                recursive=recursive,
+                concurrency=concurrency,
+            )
+        )
+        expected = list(
+            list_file_entries(FakeDriveService(_ARCHIVE), ROOT_ID, recursive=recursive)
+        )
+        assert entries == expected
+        names = _collect(
+            alist_file_names(_client(service), ROOT_ID, recursive=recursive)
+        )
+        assert names == [(e.name, e.display_path) for e in expected]
+
+    def test_recursive_listing_keeps_a_bounded_lookahead(self) -> None:
+        """A stalled consumer holds back the walk instead of the whole tree."""
+        archive = generate_archive(depth=2, fan_out=12, files_per_folder=2)
+        service = FakeDriveService(archive)
+
+        async def first_then_rest() -> tuple[int, int]:
+            entries = alist_file_entries(
+                _client(service), ROOT_ID, recursive=True, concurrency=2
+            )
+            async with aclosing(entries):
+                await anext(entries)
+                await asyncio.sleep(0.1)
+                calls = service.calls
+                return calls, 1 + len([entry async for entry in entries])
+
+        calls, total = asyncio.run(first_then_rest())
+        # The lookahead, plus the folders taken on the way to the first file.
+        assert calls <= 2 * LOOKAHEAD_PER_THREAD + 3
+        assert total == archive.file_count
+
+    def test_subfolder_entries_match_list_subfolder_entries(self) -> None:
+        service = FakeDriveService(_ARCHIVE, page_size=2)
+        entries = _collect(alist_subfolder_entries(_client(service), ROOT_ID))
+        assert entries == list(list_subfolder_entries(service, ROOT_ID))
+
+    def test_subfolder_entries_of_several_folders_concurrently(self) -> None:
+        service = FakeDriveService(_ARCHIVE)
+        folder_ids = [e.file_id for e in list_subfolder_entries(service, ROOT_ID)]
+        active = [0, 0]  # In flight, most in flight.
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            active[0] += 1
+            active[1] = max(active)
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            params = request.url.params
+            return httpx.Response(
+                200,
+                json=service.list_page(
+                    q=params["q"],
+                    fields=params["fields"],
+                    pageSize=params["pageSize"],
+                    pageToken=params.get("pageToken"),
+                ),
+            )
+
+        creds = Credentials(token="access-token")  # noqa: S106
+        client = AsyncDriveClient(creds, transport=httpx.MockTransport(handle))
+        entries = _collect(
+            alist_subfolder_entries_many(client, folder_ids, concurrency=2)
+        )
+        assert entries == [
+            entry
+            for folder_id in folder_ids
+            for entry in list_subfolder_entries(service, folder_id)
+        ]
+        assert active[1] == 2
+
+    def test_transient_errors_are_retried(self, sleeps: list[float]) -> None:
+        service = FakeDriveService(_ARCHIVE)
+        client = _client(service, 503, 429)
+        entries = _collect(alist_file_entries(client, ROOT_ID, recursive=False))
+        assert entries == list(list_file_entries(service, ROOT_ID, recursive=False))
+        assert sleeps == [1.0, 2.0]
+
+    def test_other_errors_raise_drive_connection_error(self) -> None:
+        client = _client(FakeDriveService(_ARCHIVE), 404)
+        with pytest.raises(DriveConnectionError) as info:
+            _collect(alist_file_entries(client, ROOT_ID, recursive=True))
+        assert isinstance(info.value.__cause__, HttpError)
+
+    def test_invalid_page_size_raises(self) -> None:
+        client = _client(FakeDriveService(_ARCHIVE))
+        with pytest.raises(ValueError, match="page_size"):
+            _collect(alist_file_entries(client, ROOT_ID, recursive=True, page_size=0))
+
+
+class TestIterBlocking:
+    """iter_blocking hands an async listing over to synchronous code."""
+
+    def test_yields_in_order_and_stops_early(self) -> None:
+        service = FakeDriveService(_ARCHIVE)
+        entries = iter_blocking(
+            lambda: alist_file_entries(_client(service), ROOT_ID, recursive=True)
+        )
+        first = list(itertools.islice(entries, 2))
+        entries.close()
+        expected = list(list_file_entries(service, ROOT_ID, recursive=True))
+        assert first == expected[:2]
+        assert not any(t.name == "drive-asyncio" for t in threading.enumerate())
+
+    def test_slow_caller_holds_the_listing_back(self) -> None:
+        produced: list[int] = []
+
+        async def count() -> AsyncIterator[int]:
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        items = iter_blocking(count, buffer=5)
+        assert next(items) == 0
+        time.sleep(0.1)
+        # The buffer, the item taken and the one waiting for a slot.
+        assert len(produced) <= 5 + 2
+        assert list(items) == list(range(1, 100))
+
+    def test_errors_are_raised_in_the_caller(self) -> None:
+        client = _client(FakeDriveService(_ARCHIVE), 404)
+        with pytest.raises(DriveConnectionError):
+            list(
+                iter_blocking(
+                    lambda: alist_file_entries(client, ROOT_ID, recursive=True)
+                )
+            )
+
+
+class TestCliAsync:
+    """--async lists Drive with the asyncio client."""
+
+    def test_sheet_parser(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        service = FakeDriveService(_ARCHIVE)
+        monkeypatch.setattr(
+            sheet_parser, "_connect_async", lambda **_: _client(service)
+        )
+        result = CliRunner().invoke(
+            sheet_parser.app,
+            ["--folder-id", ROOT_ID, "--recursive", "--async", "-c", "8"],
+        )
+        assert result.exit_code == 0, result.output
+        total = len(list(list_file_entries(service, ROOT_ID, recursive=True)))
+        assert f"Validats {total} fitxers." in result.output
+
+    def test_sheet_parser_requires_a_drive_folder(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(
+            sheet_parser.app, ["--path", str(tmp_path), "--async"]
+        )
+        assert result.exit_code == 1
+        assert "--async" in result.output
+
+    def test_work_parser(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        service = FakeDriveService(_ARCHIVE)
+        connected: list[dict] = []
+
+        def connect(**kwargs: object) -> AsyncDriveClient:
+            connected.append(kwargs)
+            return _client(service)
+
+        monkeypatch.setattr(work_parser, "_connect", connect)
+        result = CliRunner().invoke(
+            work_parser.app,
+            ["--folder-id", ROOT_ID, "--async", "-c", "8", "--no-cache"],
+        )
+        assert result.exit_code == 0, result.output
+        assert connected == [{"use_async": True, "concurrency": 8}]
+        total = len(list(list_subfolder_entries(service, ROOT_ID)))
+        assert f"Validades {total} carpetes." in result.output
+
+    @pytest.mark.parametrize("option", ["--path", "--manifest"])
+    def test_work_parser_requires_a_drive_folder(
+        self, tmp_path: Path, option: str
+    ) -> None:
+        source = tmp_path / "m.jsonl" if option == "--manifest" else tmp_path
+        source.touch()
+        result = CliRunner().invoke(work_parser.app, [option, str(source), "--async"])
+        assert result.exit_code == 1
+        assert "--async" in result.output
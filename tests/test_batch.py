@@ -0,0 +1,248 @@
+"""Tests for create_folders and create_shortcuts (mocked batch requests)."""
+
+import json
+from collections.abc import Callable, Iterator
+from unittest.mock import Mock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from drive_connection import (
+    FOLDER_MIMETYPE,
+    MAX_BATCH_SIZE,
+    SHORTCUT_MIMETYPE,
+    DriveConnectionError,
+    FolderSpec,
+    RequestExecutor,
+    ShortcutSpec,
+    ThreadLocalService,
+    create_folders,
+    create_shortcuts,
+    set_request_executor,
+)
+
+
+def _http_error(status: int, reason: str | None = None) -> HttpError:
+    error: dict = {"code": status, "message": "error"}
+    if reason is not None:
+        error["errors"] = [{"reason": reason}]
+    content = json.dumps({"error": error}).encode()
+    return HttpError(Mock(status=status, reason="error"), content)
+
+
+@pytest.fixture(autouse=True)
+def sleep() -> Iterator[Mock]:
+    """Install an unthrottled executor (2 retries, 1 s backoff) that records sleeps."""
+    sleep = Mock()
+    executor = RequestExecutor(max_retries=2, rate=None, sleep=sleep, jitter=lambda: 1)
+    previous = set_request_executor(executor)
+    yield sleep
+    set_request_executor(previous)
+
+
+class _BatchService:
+    """Service answering batch requests item by item.
+
+    answer(body, attempt) returns the item's response or raises its error;
+    attempt counts the times that body's name has been sent. Records the
+    size of each batch executed.
+    """
+
+    def __init__(self, answer: Callable[[dict, int], dict]) -> None:
+        self.answer = answer
+        self.batch_sizes: list[int] = []
+        self.attempts: dict[str, int] = {}
+        files_return = Mock()
+        files_return.create = Mock(side_effect=lambda **kwargs: kwargs["body"])
+        self.files = Mock(return_value=files_return)
+
+    def new_batch_http_request(self, callback: Callable) -> Mock:
+        items: list[tuple[str, dict]] = []
+
+        def execute() -> None:
+            self.batch_sizes.append(len(items))
+            for request_id, body in items:
+                attempt = self.attempts.get(body["name"], 0)
+                self.attempts[body["name"]] = attempt + 1
+                try:
+                    response = self.answer(body, attempt)
+                except HttpError as e:
+                    callback(request_id, None, e)
+                else:
+                    callback(request_id, response, None)
+
+        batch = Mock()
+        batch.add = Mock(
+            side_effect=lambda req, request_id: items.append((request_id, req))
+        )
+        batch.execute = Mock(side_effect=execute)
+        return batch
+
+
+def _created(body: dict, _attempt: int) -> dict:
+    return {
+        "id": f"id-{body['name']}",
+        "name": body["name"],
+        "mimeType": body["mimeType"],
+    }
+
+
+def test_create_folders_returns_results_in_order() -> None:
+    """Each folder gets a Success with its resource, in input order."""
+    service = _BatchService(_created)
+    specs = [FolderSpec("A"), FolderSpec("B", "parent")]
+    results = create_folders(service, specs)
+    assert [r.unwrap()["id"] for r in results] == ["id-A", "id-B"]
+    create = service.files.return_value.create
+    bodies = [c.kwargs["body"] for c in create.call_args_list]
+    assert bodies == [
+        {"name": "A", "mimeType": FOLDER_MIMETYPE, "parents": ["root"]},
+        {"name": "B", "mimeType": FOLDER_MIMETYPE, "parents": ["parent"]},
+    ]
+    assert service.batch_sizes == [2]
+
+
+def test_create_shortcuts_builds_shortcut_bodies() -> None:
+    """Shortcut specs become the same bodies as create_shortcut's."""
+    service = _BatchService(_created)
+    results = create_shortcuts(
+        service, [ShortcutSpec("t1", "Link", "p", "application/pdf")]
+    )
+    body = service.files.return_value.create.call_args.kwargs["body"]
+    assert body["mimeType"] == SHORTCUT_MIMETYPE
+    assert body["shortcutDetails"] == {
+        "targetId": "t1",
+        "targetMimeType": "application/pdf",
+    }
+    assert results[0].unwrap()["name"] == "Link"
+
+
+def test_item_error_does_not_fail_the_others(sleep: Mock) -> None:
+    """A non-rate-limit error is a Failure for that item only, not retried."""
+
+    def answer(body: dict, attempt: int) -> dict:
+        if body["name"] == "bad":
+            raise _http_error(404)
+        return _created(body, attempt)
+
+    service = _BatchService(answer)
+    results = create_folders(
+        service, [FolderSpec("a"), FolderSpec("bad"), FolderSpec("c")]
+    )
+    assert results[0].unwrap()["id"] == "id-a"
+    assert results[2].unwrap()["id"] == "id-c"
+    error = results[1].failure()
+    assert isinstance(error, DriveConnectionError)
+    assert isinstance(error.__cause__, HttpError)
+    assert service.attempts["bad"] == 1
+    sleep.assert_not_called()
+
+
+def test_rate_limited_items_are_retried_with_backoff(sleep: Mock) -> None:
+    """Rate-limited items are sent again in a later batch."""
+
+    def answer(body: dict, attempt: int) -> dict:
+        if body["name"] == "b" and attempt < 2:
+            raise _http_error(403, "userRateLimitExceeded")
+        if body["name"] == "c" and attempt < 1:
+            raise _http_error(429)
+        return _created(body, attempt)
+
+    service = _BatchService(answer)
+    specs = [FolderSpec(name) for name in "abcd"]
+    results = create_folders(service, specs)
+    assert [r.unwrap()["id"] for r in results] == ["id-a", "id-b", "id-c", "id-d"]
+    assert service.batch_sizes == [4, 2, 1]
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0]
+
+
+def test_server_errors_are_not_retried(sleep: Mock) -> None:
+    """An item failing with a 5xx may have been created: it is a Failure."""
+
+    def answer(body: dict, attempt: int) -> dict:
+        if body["name"] == "b":
+            raise _http_error(503)
+        return _created(body, attempt)
+
+    service = _BatchService(answer)
+    results = create_folders(service, [FolderSpec("a"), FolderSpec("b")])
+    assert results[0].unwrap()["id"] == "id-a"
+    assert "503" in str(results[1].failure())
+    assert service.attempts["b"] == 1
+    sleep.assert_not_called()
+
+
+def test_retries_exhausted_fail_with_last_error() -> None:
+    """An item still rate-limited after max_retries is a Failure."""
+
+    def answer(_body: dict, _attempt: int) -> dict:
+        raise _http_error(429)
+
+    service = _BatchService(answer)
+    results = create_folders(service, [FolderSpec("a")])
+    assert service.attempts["a"] == 3
+    assert "429" in str(results[0].failure())
+
+
+def test_chunks_into_batches_of_batch_size() -> None:
+    """More items than batch_size are split into several batch requests."""
+    service = _BatchService(_created)
+    specs = [FolderSpec(str(i)) for i in range(MAX_BATCH_SIZE + 30)]
+    results = create_folders(service, specs)
+    assert len(results) == len(specs)
+    assert service.batch_sizes == [MAX_BATCH_SIZE, 30]
+    create_folders(service, specs[:5], batch_size=2)
+    assert service.batch_sizes[2:] == [2, 2, 1]
+
+
+@pytest.mark.parametrize("batch_size", [0, MAX_BATCH_SIZE + 1])
+def test_invalid_batch_size_raises(batch_size: int) -> None:
+    """batch_size must be between 1 and MAX_BATCH_SIZE."""
+    with pytest.raises(ValueError, match="batch_size"):
+        create_folders(_BatchService(_created), [], batch_size=batch_size)
+
+
+def test_failed_batch_request_fails_its_items_only(sleep: Mock) -> None:
+    """A batch request failing with a server error is a Failure for its items.
+
+    The items created by earlier batches keep their Success, and later
+    batches are still sent.
+    """
+    service = _BatchService(_created)
+    new_batch = service.new_batch_http_request
+
+    def new_batch_http_request(callback: Callable) -> Mock:
+        """Answer batches as _BatchService does, failing the one with "c"."""
+        batch = new_batch(callback)
+        send = batch.execute.side_effect
+
+        def execute() -> None:
+            if any(c.args[0]["name"] == "c" for c in batch.add.call_args_list):
+                raise _http_error(500)
+            send()
+
+        batch.execute.side_effect = execute
+        return batch
+
+    service.new_batch_http_request = new_batch_http_request
+    specs = [FolderSpec(name) for name in "abcde"]
+    results = create_folders(service, specs, batch_size=2)
+    assert [r.unwrap()["id"] for r in (results[0], results[1], results[4])] == [
+        "id-a",
+        "id-b",
+        "id-e",
+    ]
+    for result in results[2:4]:
+        error = result.failure()
+        assert isinstance(error, DriveConnectionError)
+        assert isinstance(error.__cause__, HttpError)
+    assert service.batch_sizes == [2, 1]
+    sleep.assert_not_called()
+
+
+def test_thread_local_service_passes_batches_through() -> None:
+    """ThreadLocalService exposes new_batch_http_request of its service."""
+    service = _BatchService(_created)
+    results = create_folders(ThreadLocalService(lambda: service), [FolderSpec("a")])
+    assert results[0].unwrap()["id"] == "id-a"
+    assert service.batch_sizes == [1]
@@ -0,0 +1,124 @@
+"""Tests for DriveMetadataCache."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from cli.sheet_parser import _open_cache
+from drive_connection import DriveMetadataCache, get_cache_path
+
+_ITEMS = [
+    {"id": "f1", "name": "1010_Flautí.pdf", "mimeType": "application/pdf"},
+    {
+        "id": "d1",
+        "name": "Work",
+        "mimeType": "application/vnd.google-apps.folder",
+        "modifiedTime": "2026-01-01T00:00:00Z",
+    },
+]
+
+
+def _expected(items: list[dict]) -> list[dict]:
+    return [{"modifiedTime": None, **item} for item in items]
+
+
+def test_get_children_miss_when_empty(tmp_path: Path) -> None:
+    """An empty cache misses and counts it."""
+    with DriveMetadataCache(tmp_path / "cache.sqlite3") as cache:
+        assert cache.get_children("root", "t1") is None
+        assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_put_then_get_same_modified_time_hits(tmp_path: Path) -> None:
+    """A stored listing is returned in order for the same modifiedTime."""
+    with DriveMetadataCache(tmp_path / "cache.sqlite3") as cache:
+        cache.put_children("root", "t1", _ITEMS)
+        assert cache.get_children("root", "t1") == _expected(_ITEMS)
+        assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_changed_modified_time_misses(tmp_path: Path) -> None:
+    """A different modifiedTime invalidates the stored listing."""
+    with DriveMetadataCache(tmp_path / "cache.sqlite3") as cache:
+        cache.put_children("root", "t1", _ITEMS)
+        assert cache.get_children("root", "t2") is None
+
+
+def test_put_replaces_previous_listing(tmp_path: Path) -> None:
+    """Storing a folder again replaces its children."""
+    with DriveMetadataCache(tmp_path / "cache.sqlite3") as cache:
+        cache.put_children("root", "t1", _ITEMS)
+        cache.put_children("root", "t2", _ITEMS[:1])
+        assert cache.get_children("root", "t2") == _expected(_ITEMS[:1])
+
+
+def test_listing_persists_across_connections(tmp_path: Path) -> None:
+    """Listings are stored on disk and reused by a later run."""
+    path = tmp_path / "sub" / "cache.sqlite3"
+    with DriveMetadataCache(path) as cache:
+        cache.put_children("root", "t1", _ITEMS)
+    with DriveMetadataCache(path) as cache:
+        assert cache.get_children("root", "t1") == _expected(_ITEMS)
+
+
+def test_refresh_never_serves_cached_listings(tmp_path: Path) -> None:
+    """With refresh=True every lookup misses but listings are still stored."""
+    path = tmp_path / "cache.sqlite3"
+    with DriveMetadataCache(path, refresh=True) as cache:
+        cache.put_children("root", "t1", _ITEMS)
+        assert cache.get_children("root", "t1") is None
+        assert cache.misses == 1
+    with DriveMetadataCache(path) as cache:
+        assert cache.get_children("root", "t1") == _expected(_ITEMS)
+
+
+def test_listing_older_than_max_age_misses(tmp_path: Path) -> None:
+    """A listing is served for max_age seconds, even with the same modifiedTime."""
+    now = [1000.0]
+    path = tmp_path / "cache.sqlite3"
+    with DriveMetadataCache(path, max_age=60, clock=lambda: now[0]) as cache:
+        cache.put_children("root", "t1", _ITEMS)
+        now[0] += 59
+        assert cache.get_children("root", "t1") == _expected(_ITEMS)
+        now[0] += 1
+        assert cache.get_children("root", "t1") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+    with DriveMetadataCache(path, max_age=None) as cache:
+        assert cache.get_children("root", "t1") == _expected(_ITEMS)
+
+
+def test_listing_from_cache_without_listing_times_misses(tmp_path: Path) -> None:
+    """Listings stored before max_age existed are treated as expired."""
+    path = tmp_path / "cache.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        "CREATE TABLE listings (folder_id TEXT PRIMARY KEY, modified_time TEXT);"
+        "INSERT INTO listings VALUES ('root', 't1');"
+    )
+    connection.commit()
+    connection.close()
+    with DriveMetadataCache(path) as cache:
+        assert cache.get_children("root", "t1") is None
+        cache.put_children("root", "t1", _ITEMS)
+        assert cache.get_children("root", "t1") == _expected(_ITEMS)
+
+
+def test_get_cache_path_reads_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """FENTARXIU_CACHE_DB overrides the default cache path."""
+    monkeypatch.setenv("FENTARXIU_CACHE_DB", "/data/custom.sqlite3")
+    assert get_cache_path() == Path("/data/custom.sqlite3")
+    monkeypatch.delenv("FENTARXIU_CACHE_DB")
+    assert get_cache_path() == Path("fentarxiu_cache.sqlite3")
+
+
+def test_sheet_parser_cache_max_age_zero_lists_again(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """--cache-max-age 0 never serves a cached listing."""
+    monkeypatch.setenv("FENTARXIU_CACHE_DB", str(tmp_path / "cache.sqlite3"))
+    for max_age in (24, 0):
+        with _open_cache(use_cache=True, refresh=False, max_age_hours=max_age) as cache:
+            cache.put_children("root", "t1", _ITEMS)
+            hit = cache.get_children("root", "t1") is not None
+        assert hit is (max_age > 0)
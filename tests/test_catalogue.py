@@ -1,5 +1,7 @@
 """Tests for InstrumentCatalogue."""
 
+import pickle
+
 from string_checker.data import InstrumentCatalogue
 
 
@@ -55,3 +57,41 @@ class TestInstrumentCatalogueCustomTable:
         assert cat.get_name(1, "01") is None
         assert cat.has(0, "00") is False
         assert cat.get_name(0, "00") is None
+
+
+class TestInstrumentCatalogueFingerprint:
+    """fingerprint() identifies catalogue contents."""
+
+    def test_equal_tables_have_equal_fingerprints(self) -> None:
+        first = InstrumentCatalogue(table={(1, "00"): "Flauta", (2, "01"): "Oboè"})
+        second = InstrumentCatalogue(table={(2, "01"): "Oboè", (1, "00"): "Flauta"})
+        assert first.fingerprint() == second.fingerprint()
+
+    def test_different_tables_have_different_fingerprints(self) -> None:
+        first = InstrumentCatalogue(table={(1, "00"): "Flauta"})
+        second = InstrumentCatalogue(table={(1, "00"): "Flautí"})
+        assert first.fingerprint() != second.fingerprint()
+        assert InstrumentCatalogue.default().fingerprint() != first.fingerprint()
+
+
+class TestInstrumentCatalogueSharing:
+    """The default catalogue is shared and pickles as a reference."""
+
+    def test_default_is_shared(self) -> None:
+        assert InstrumentCatalogue.default() is InstrumentCatalogue.default()
+
+    def test_default_pickles_as_reference(self) -> None:
+        default = InstrumentCatalogue.default()
+        data = pickle.dumps(default)
+        assert len(data) < 200
+        assert pickle.loads(data) is default  # noqa: S301
+
+    def test_custom_catalogue_pickles_its_entries(self) -> None:
+        cat = InstrumentCatalogue(table={(1, "00"): "Flauta"})
+        copy = pickle.loads(pickle.dumps(cat))  # noqa: S301
+        assert copy.get_name(1, "00") == "Flauta"
+        assert copy.fingerprint() == cat.fingerprint()
+
+    def test_index_supports_reverse_lookup(self) -> None:
+        index = InstrumentCatalogue.default().index
+        assert index.keys_for_name("Flautí") == ((1, "01"),)
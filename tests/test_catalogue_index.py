@@ -0,0 +1,79 @@
+"""Tests for CatalogueIndex and normalize_instrument_name."""
+
+import pickle
+
+import pytest
+
+from string_checker.data import CatalogueIndex, normalize_instrument_name
+
+_TABLE: dict[tuple[int, str], str] = {
+    (1, "01"): "Flautí",
+    (1, "00"): "Flauta",
+    (1, "03"): "CornAnglès",
+    (2, "02"): "Trompeta",
+    (9, "00"): "Flauta",
+}
+
+
+@pytest.fixture
+def index() -> CatalogueIndex:
+    """Return an index over a small table with a repeated name."""
+    return CatalogueIndex(_TABLE)
+
+
+class TestNormalizeInstrumentName:
+    """Case, accents and separators are ignored."""
+
+    @pytest.mark.parametrize("name", ["CornAnglès", "corn angles", "Corn-Angles"])
+    def test_variants_normalize_alike(self, name: str) -> None:
+        assert normalize_instrument_name(name) == "cornangles"
+
+
+class TestCatalogueIndex:
+    """Lookups by key, name, normalized name and range."""
+
+    def test_forward_lookup(self, index: CatalogueIndex) -> None:
+        assert index.get_name(1, "01") == "Flautí"
+        assert index.get_name(1, "99") is None
+        assert index.has(2, "02") is True
+        assert index.has(2, "03") is False
+
+    def test_entries_are_sorted(self, index: CatalogueIndex) -> None:
+        assert list(index) == [
+            (1, "00", "Flauta"),
+            (1, "01", "Flautí"),
+            (1, "03", "CornAnglès"),
+            (2, "02", "Trompeta"),
+            (9, "00", "Flauta"),
+        ]
+        assert len(index) == 5
+
+    def test_reverse_lookup_returns_every_key(self, index: CatalogueIndex) -> None:
+        assert index.keys_for_name("Flauta") == ((1, "00"), (9, "00"))
+        assert index.keys_for_name("flauta") == ()
+
+    def test_normalized_lookup(self, index: CatalogueIndex) -> None:
+        assert index.keys_for_normalized_name("corn angles") == ((1, "03"),)
+        assert index.keys_for_normalized_name("FLAUTI") == ((1, "01"),)
+        assert index.keys_for_normalized_name("Tuba") == ()
+
+    def test_range_lookup(self, index: CatalogueIndex) -> None:
+        assert index.entries_in_range(1) == (
+            ("00", "Flauta"),
+            ("01", "Flautí"),
+            ("03", "CornAnglès"),
+        )
+        assert index.entries_in_range(5) == ()
+        assert index.ranges() == (1, 2, 9)
+
+    def test_source_table_changes_are_not_seen(self) -> None:
+        table = dict(_TABLE)
+        index = CatalogueIndex(table)
+        table[(5, "00")] = "Violí"
+        assert index.has(5, "00") is False
+
+    def test_pickle_round_trip(self, index: CatalogueIndex) -> None:
+        copy = pickle.loads(pickle.dumps(index))  # noqa: S301
+        assert list(copy) == list(index)
+        assert copy.keys_for_normalized_name("corn angles") == ((1, "03"),)
+        assert copy.fingerprint() == index.fingerprint()
@@ -0,0 +1,154 @@
+"""Tests for loading catalogue files and the compiled catalogue format."""
+
+import csv
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from string_checker import CatalogueError, InstrumentCatalogue
+
+_CSV = "instrument_range,code,name\n1,00,Flauta\n1,01,Flautí\n2,02,Trompeta\n"
+_JSON = [
+    {"instrument_range": 1, "code": "00", "name": "Flauta"},
+    {"instrument_range": 1, "code": "01", "name": "Flautí"},
+    {"instrument_range": 2, "code": "02", "name": "Trompeta"},
+]
+_TOML = """
+[[instrument]]
+instrument_range = 1
+code = "00"
+name = "Flauta"
+
+[[instrument]]
+instrument_range = 1
+code = "01"
+name = "Flautí"
+
+[[instrument]]
+instrument_range = 2
+code = "02"
+name = "Trompeta"
+"""
+_ENTRIES = [(1, "00", "Flauta"), (1, "01", "Flautí"), (2, "02", "Trompeta")]
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestFromTextFormats:
+    """CSV, JSON and TOML files load the same entries."""
+
+    @pytest.mark.parametrize(
+        ("filename", "content"),
+        [
+            ("cat.csv", _CSV),
+            ("cat.json", json.dumps(_JSON)),
+            ("cat.toml", _TOML),
+        ],
+    )
+    def test_loads_entries(self, tmp_path: Path, filename: str, content: str) -> None:
+        catalogue = InstrumentCatalogue.from_file(_write(tmp_path / filename, content))
+        assert list(catalogue.index) == _ENTRIES
+        assert catalogue.get_name(1, "01") == "Flautí"
+
+    def test_duplicate_key_raises(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "cat.csv", _CSV + "1,01,Piccolo\n")
+        with pytest.raises(CatalogueError, match=r"duplicate .* \(1, '01'\)"):
+            InstrumentCatalogue.from_file(path)
+
+    @pytest.mark.parametrize(
+        "row",
+        ["1,1,Flauta", "10,00,Flauta", "x,00,Flauta", "1,00,"],
+    )
+    def test_invalid_row_raises(self, tmp_path: Path, row: str) -> None:
+        path = _write(tmp_path / "cat.csv", f"instrument_range,code,name\n{row}\n")
+        with pytest.raises(CatalogueError, match="line 2"):
+            InstrumentCatalogue.from_file(path)
+
+    def test_missing_csv_column_raises(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "cat.csv", "instrument_range,code\n1,00\n")
+        with pytest.raises(CatalogueError, match="missing CSV columns"):
+            InstrumentCatalogue.from_file(path)
+
+    def test_unknown_suffix_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(CatalogueError, match="unknown catalogue format"):
+            InstrumentCatalogue.from_file(_write(tmp_path / "cat.txt", _CSV))
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(CatalogueError, match="cannot read"):
+            InstrumentCatalogue.from_file(tmp_path / "absent.csv")
+
+    @pytest.mark.parametrize("filename", ["cat.csv", "cat.json", "cat.toml"])
+    def test_non_utf8_file_raises(self, tmp_path: Path, filename: str) -> None:
+        path = tmp_path / filename
+        path.write_bytes("Flautí".encode("latin-1"))
+        with pytest.raises(CatalogueError, match="cannot read"):
+            InstrumentCatalogue.from_file(path)
+
+    def test_oversized_csv_field_raises(self, tmp_path: Path) -> None:
+        row = "1,00," + "a" * (csv.field_size_limit() + 1)
+        path = _write(tmp_path / "cat.csv", f"instrument_range,code,name\n{row}\n")
+        with pytest.raises(CatalogueError, match="cannot read"):
+            InstrumentCatalogue.from_file(path)
+
+
+class TestCompiledFormat:
+    """save_compiled and from_file round-trip through the .fxcat format."""
+
+    def test_round_trip_default_catalogue(self, tmp_path: Path) -> None:
+        default = InstrumentCatalogue.default()
+        path = tmp_path / "default.fxcat"
+        default.save_compiled(path)
+
+        loaded = InstrumentCatalogue.from_file(path)
+
+        assert list(loaded.index) == list(default.index)
+        assert loaded.fingerprint() == default.fingerprint()
+        assert loaded.index.keys_for_normalized_name("corn angles") == ((1, "03"),)
+
+    def test_truncated_file_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "cat.fxcat"
+        InstrumentCatalogue.default().save_compiled(path)
+        path.write_bytes(path.read_bytes()[:-3])
+        with pytest.raises(CatalogueError, match="compiled catalogue"):
+            InstrumentCatalogue.from_file(path)
+
+    @pytest.mark.parametrize("content", [b"", b"not a catalogue at all"])
+    def test_garbage_raises(self, tmp_path: Path, content: bytes) -> None:
+        path = tmp_path / "cat.fxcat"
+        path.write_bytes(content)
+        with pytest.raises(CatalogueError):
+            InstrumentCatalogue.from_file(path)
+
+
+class TestPickleByPath:
+    """A catalogue loaded from a file pickles as a reference to the file."""
+
+    def test_pickles_as_path_reference(self, tmp_path: Path) -> None:
+        table = {
+            (r, f"{c:02d}"): f"Instrument {r} {c}"
+            for r in range(20)
+            for c in range(100)
+        }
+        path = tmp_path / "big.fxcat"
+        InstrumentCatalogue(table).save_compiled(path)
+        catalogue = InstrumentCatalogue.from_file(path)
+
+        data = pickle.dumps(catalogue)
+        copy = pickle.loads(data)  # noqa: S301
+
+        assert len(data) < 500
+        assert len(pickle.dumps(InstrumentCatalogue(table))) > 10_000
+        assert copy.fingerprint() == catalogue.fingerprint()
+        assert pickle.loads(data) is copy  # noqa: S301
+
+    def test_changed_file_raises_when_unpickled(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "cat.csv", _CSV)
+        data = pickle.dumps(InstrumentCatalogue.from_file(path))
+        _write(path, _CSV + "3,03,Trombó\n")
+        with pytest.raises(CatalogueError, match="changed"):
+            pickle.loads(data)  # noqa: S301
@@ -0,0 +1,242 @@
+"""Tests for DriveSnapshot, build_snapshot and apply_changes (mocked Drive API)."""
+
+import re
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from typer.testing import CliRunner
+
+from cli import sheet_parser
+from drive_connection import (
+    FOLDER_MIMETYPE,
+    DriveSnapshot,
+    apply_changes,
+    build_snapshot,
+)
+
+_PARENT_RE = re.compile(r"'([^']+)' in parents")
+_PDF = "application/pdf"
+
+
+class _ChangesService:
+    """Mock-backed service with a folder tree and a changes feed.
+
+    tree maps folder_id -> children (id, name, mimeType). Changes are served
+    one per page; the start token is the number of changes already queued.
+    """
+
+    def __init__(self, tree: dict[str, list[dict]]) -> None:
+        self.tree = tree
+        self.changes_feed: list[dict] = []
+        self.list_queries: list[str] = []
+        self.page_sizes: set[object] = set()
+        files_return = Mock()
+        files_return.list = Mock(side_effect=self._list_files)
+        self.files = Mock(return_value=files_return)
+        changes_return = Mock()
+        changes_return.getStartPageToken = Mock(side_effect=self._start_token)
+        changes_return.list = Mock(side_effect=self._list_changes)
+        self.changes = Mock(return_value=changes_return)
+
+    def _start_token(self, **_kwargs: object) -> Mock:
+        token = str(len(self.changes_feed))
+        return Mock(execute=lambda: {"startPageToken": token})
+
+    def _list_files(self, **kwargs: object) -> Mock:
+        q = str(kwargs["q"])
+        self.list_queries.append(q)
+        self.page_sizes.add(kwargs["pageSize"])
+        (parent,) = _PARENT_RE.findall(q)
+        page = self.tree.get(parent, [])
+        return Mock(execute=lambda: {"files": page})
+
+    def _list_changes(self, **kwargs: object) -> Mock:
+        index = int(str(kwargs["pageToken"]))
+        if index >= len(self.changes_feed):
+            response = {"changes": [], "newStartPageToken": str(index)}
+        else:
+            response = {
+                "changes": [self.changes_feed[index]],
+                "nextPageToken": str(index + 1),
+            }
+        return Mock(execute=lambda: response)
+
+
+def _tree() -> dict[str, list[dict]]:
+    return {
+        "root": [
+            {"id": "a", "name": "a.pdf", "mimeType": _PDF},
+            {"id": "w1", "name": "Work1", "mimeType": FOLDER_MIMETYPE},
+        ],
+        "w1": [
+            {"id": "p1", "name": "1000_Flauta.pdf", "mimeType": _PDF},
+            {"id": "w1s", "name": "Extra", "mimeType": FOLDER_MIMETYPE},
+        ],
+        "w1s": [{"id": "p2", "name": "2020_Trompeta.pdf", "mimeType": _PDF}],
+    }
+
+
+def _file_change(file_id: str, name: str, parent: str, mime: str = _PDF) -> dict:
+    return {
+        "fileId": file_id,
+        "removed": False,
+        "file": {"name": name, "mimeType": mime, "parents": [parent]},
+    }
+
+
+@pytest.fixture
+def service() -> _ChangesService:
+    """Return a changes service over a fresh copy of the test tree."""
+    return _ChangesService(_tree())
+
+
+@pytest.fixture
+def snapshot(service: _ChangesService) -> DriveSnapshot:
+    """Return a snapshot of the test tree taken before any change."""
+    return build_snapshot(service, "root")
+
+
+def test_build_snapshot_lists_whole_tree(
+    service: _ChangesService, snapshot: DriveSnapshot
+) -> None:
+    """build_snapshot records every folder and file with its parent."""
+    assert (snapshot.root_id, snapshot.page_token) == ("root", "0")
+    assert snapshot.folders == {"w1": ("Work1", "root"), "w1s": ("Extra", "w1")}
+    assert snapshot.files == {
+        "a": ("a.pdf", "root"),
+        "p1": ("1000_Flauta.pdf", "w1"),
+        "p2": ("2020_Trompeta.pdf", "w1s"),
+    }
+    assert snapshot.display_path("p2") == "Work1/Extra/2020_Trompeta.pdf"
+    assert snapshot.display_path("a") == "a.pdf"
+    assert len(service.list_queries) == 3
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_build_snapshot_page_size_and_concurrency(concurrency: int) -> None:
+    """Concurrent listing builds the same snapshot, with the given page size."""
+    service = _ChangesService(_tree())
+
+    snapshot = build_snapshot(service, "root", page_size=50, concurrency=concurrency)
+
+    assert snapshot == build_snapshot(_ChangesService(_tree()), "root")
+    assert list(snapshot.files) == ["a", "p1", "p2"]
+    assert service.page_sizes == {50}
+
+
+def test_apply_changes_returns_added_and_renamed_files(
+    service: _ChangesService, snapshot: DriveSnapshot
+) -> None:
+    """New and renamed files are returned; other changes are not."""
+    service.changes_feed += [
+        _file_change("new", "1010_Flautí.pdf", "w1"),
+        _file_change("p2", "2021_Trompeta.pdf", "w1s"),
+        _file_change("p1", "1000_Flauta.pdf", "w1"),  # content-only change
+        _file_change("out", "elsewhere.pdf", "not-tracked"),
+    ]
+    service.list_queries.clear()
+
+    changed = apply_changes(service, snapshot)
+
+    assert changed == ["p2", "new"]
+    assert snapshot.files["p2"] == ("2021_Trompeta.pdf", "w1s")
+    assert "out" not in snapshot.files
+    assert (snapshot.root_id, snapshot.page_token) == ("root", "4")
+    assert service.list_queries == []
+
+
+def test_apply_changes_drops_removed_and_detached_entries(
+    service: _ChangesService, snapshot: DriveSnapshot
+) -> None:
+    """Removed files and everything under a folder moved out are dropped."""
+    service.changes_feed += [
+        {"fileId": "a", "removed": True},
+        _file_change("w1", "Work1", "elsewhere", FOLDER_MIMETYPE),
+    ]
+
+    assert apply_changes(service, snapshot) == []
+    assert snapshot.folders == {}
+    assert snapshot.files == {}
+
+
+def test_apply_changes_lists_folder_moved_in(
+    service: _ChangesService, snapshot: DriveSnapshot
+) -> None:
+    """A folder moved into the tree is listed and its files are returned."""
+    service.tree["w3"] = [{"id": "p3", "name": "1060_Clarinet.pdf", "mimeType": _PDF}]
+    service.changes_feed.append(_file_change("w3", "Work3", "root", FOLDER_MIMETYPE))
+    service.changes_feed.append(_file_change("p3", "1060_Clarinet.pdf", "w3"))
+
+    changed = apply_changes(service, snapshot, page_size=10, concurrency=2)
+
+    assert changed == ["p3"]
+    assert snapshot.display_path("p3") == "Work3/1060_Clarinet.pdf"
+
+
+def test_apply_changes_renamed_folder_updates_display_path(
+    service: _ChangesService, snapshot: DriveSnapshot
+) -> None:
+    """Renaming a folder changes display paths but re-validates nothing."""
+    service.changes_feed.append(_file_change("w1", "Obra1", "root", FOLDER_MIMETYPE))
+
+    assert apply_changes(service, snapshot) == []
+    assert snapshot.display_path("p2") == "Obra1/Extra/2020_Trompeta.pdf"
+
+
+def test_snapshot_save_and_load_round_trip(
+    snapshot: DriveSnapshot, tmp_path: Path
+) -> None:
+    """A saved snapshot loads back equal."""
+    snapshot.failing = ["a"]
+    path = tmp_path / "state" / "snapshot.json"
+
+    snapshot.save(path)
+
+    assert DriveSnapshot.load(path) == snapshot
+
+
+def test_snapshot_load_invalid_raises_value_error(tmp_path: Path) -> None:
+    """A file that is not a snapshot raises ValueError."""
+    path = tmp_path / "snapshot.json"
+    path.write_text('{"version": 1}', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="invalid snapshot"):
+        DriveSnapshot.load(path)
+
+
+@pytest.mark.parametrize(
+    "option", [["--strategy", "batched"], ["--cache"], ["--refresh"]]
+)
+def test_incremental_rejects_listing_options(tmp_path: Path, option: list[str]) -> None:
+    """Options the changes feed cannot honour are a usage error."""
+    result = CliRunner().invoke(
+        sheet_parser.app,
+        ["--folder-id", "root", "--incremental", str(tmp_path / "s.json"), *option],
+    )
+
+    assert result.exit_code == 1
+    assert "--incremental" in result.output
+
+
+def test_incremental_lists_with_concurrency_and_page_size(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """--incremental lists the tree with --concurrency and --page-size."""
+    service = _ChangesService(_tree())
+    connected: list[int] = []
+
+    def connect(*, concurrency: int) -> _ChangesService:
+        connected.append(concurrency)
+        return service
+
+    monkeypatch.setattr(sheet_parser, "_connect", connect)
+    state = tmp_path / "state.json"
+    args = ["--folder-id", "root", "--incremental", str(state), "-c", "3"]
+
+    result = CliRunner().invoke(sheet_parser.app, [*args, "--page-size", "20"])
+
+    assert result.exit_code == 0, result.output
+    assert connected == [3]
+    assert service.page_sizes == {20}
+    assert DriveSnapshot.load(state).files.keys() == {"a", "p1", "p2"}
@@ -1,7 +1,11 @@
 """Tests for Checker (unit and integration)."""
 
+from pathlib import Path
+
+import pytest
 from returns.result import Failure, Success
 
+import string_checker.context
 from string_checker import (
     Checker,
     FolderNameRule,
@@ -14,9 +18,11 @@ from string_checker import (
     InvalidFolderNameFailure,
     InvalidPrefixFailure,
     PrefixRule,
+    ResultCache,
     ValidCharsRule,
     VoiceRule,
 )
+from string_checker.data import ParsedFilename
 from string_checker.failures.base import ValidationFailure
 from string_checker.rules import RuleChecker
 from string_checker.rules.pdf_extension import NotPdfFailure, PdfExtensionRule
@@ -200,3 +206,163 @@ class TestCheckerIntegrationFolder:
         assert isinstance(result, Failure)
         failures = result.failure()
         assert any(isinstance(f, InvalidFolderCharacterFailure) for f in failures)
+
+
+class TestCheckerSharedContext:
+    """Checker parses each string once and shares the result across rules."""
+
+    def test_filename_parsed_once_for_all_rules(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        original = string_checker.context.parse_prefix_match
+
+        def counting_parse(text: str, match: object) -> ParsedFilename | None:
+            calls.append(text)
+            return original(text, match)
+
+        monkeypatch.setattr(
+            string_checker.context, "parse_prefix_match", counting_parse
+        )
+        catalogue = InstrumentCatalogue.default()
+        checker = Checker(
+            rules=[
+                ValidCharsRule(),
+                PrefixRule(catalogue),
+                InstrumentNameMatchRule(catalogue),
+                VoiceRule(),
+                PdfExtensionRule(),
+            ]
+        )
+        result = checker.check("1010_Flauta.pdf")
+        assert isinstance(result, Failure)
+        assert calls == ["1010_Flauta.pdf"]
+
+    def test_rule_check_shim_matches_check_context(self) -> None:
+        rule = PrefixRule(InstrumentCatalogue.default())
+        for text in ["", "abc_foo.pdf", "1000_.pdf", "9999_X.pdf", "1010_Flautí.pdf"]:
+            assert rule.check(text) == rule.check_context(
+                string_checker.context.CheckContext(text)
+            )
+
+
+class TestCheckerCheckMany:
+    """check_many validates many strings in-process or in worker processes."""
+
+    _NAMES = (
+        "1010_Flautí.pdf",
+        "1010_Flauta.pdf",
+        "10_Flautí.pdf",
+        "1000+2020_Flauta+Trompeta.pdf",
+        "1010_Flautí🎵.pdf",
+        "1010_Flautí",
+    )
+
+    def _full_checker(self) -> Checker:
+        catalogue = InstrumentCatalogue.default()
+        return Checker(
+            rules=[
+                ValidCharsRule(),
+                PrefixRule(catalogue),
+                InstrumentNameMatchRule(catalogue),
+                VoiceRule(),
+                PdfExtensionRule(),
+            ]
+        )
+
+    def test_in_process_matches_check(self) -> None:
+        checker = self._full_checker()
+        results = list(checker.check_many(self._NAMES))
+        assert [name for name, _ in results] == list(self._NAMES)
+        assert [r for _, r in results] == [checker.check(n) for n in self._NAMES]
+
+    def test_empty_input_yields_nothing(self) -> None:
+        checker = self._full_checker()
+        assert list(checker.check_many([], workers=2)) == []
+
+    def test_workers_ordered_matches_check(self) -> None:
+        checker = self._full_checker()
+        names = list(self._NAMES) * 5
+        results = list(checker.check_many(iter(names), workers=2, chunk_size=4))
+        assert [name for name, _ in results] == names
+        assert [r for _, r in results] == [checker.check(n) for n in names]
+
+    def test_workers_unordered_yields_every_name(self) -> None:
+        checker = self._full_checker()
+        names = [f"{n}#{i}" for i, n in enumerate(self._NAMES * 3)]
+        results = dict(
+            checker.check_many(names, workers=2, ordered=False, chunk_size=2)
+        )
+        assert sorted(results) == sorted(names)
+        assert all(results[n] == checker.check(n) for n in names)
+
+
+class TestCheckerResultCache:
+    """Checker memoizes results in a ResultCache keyed by its fingerprint."""
+
+    def _rules(self, catalogue: InstrumentCatalogue) -> list[RuleChecker]:
+        return [
+            ValidCharsRule(),
+            PrefixRule(catalogue),
+            InstrumentNameMatchRule(catalogue),
+            VoiceRule(),
+        ]
+
+    def test_repeated_name_is_checked_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        original = ValidCharsRule.check
+
+        def counting_check(rule: ValidCharsRule, text: str) -> list:
+            calls.append(text)
+            return original(rule, text)
+
+        monkeypatch.setattr(ValidCharsRule, "check", counting_check)
+        cache = ResultCache()
+        checker = Checker(rules=self._rules(InstrumentCatalogue.default()), cache=cache)
+        first = checker.check("1010_Flautí🎵.pdf")
+        second = checker.check("1010_Flautí🎵.pdf")
+        assert first == second
+        assert isinstance(first, Failure)
+        assert calls == ["1010_Flautí🎵.pdf"]
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert checker.cache is cache
+
+    def test_equal_rule_sets_share_fingerprint(self) -> None:
+        first = Checker(rules=self._rules(InstrumentCatalogue.default()))
+        second = Checker(rules=self._rules(InstrumentCatalogue.default()))
+        assert first.fingerprint() == second.fingerprint()
+
+    def test_fingerprint_covers_catalogue_and_rules(self) -> None:
+        default = Checker(rules=self._rules(InstrumentCatalogue.default()))
+        custom = Checker(
+            rules=self._rules(InstrumentCatalogue(table={(1, "01"): "Flautí"}))
+        )
+        fewer = Checker(rules=self._rules(InstrumentCatalogue.default())[:2])
+        assert (
+            len({default.fingerprint(), custom.fingerprint(), fewer.fingerprint()}) == 3
+        )
+
+    def test_shared_cache_keeps_rule_sets_apart(self) -> None:
+        cache = ResultCache()
+        full = Checker(rules=self._rules(InstrumentCatalogue.default()), cache=cache)
+        empty = Checker(rules=[], cache=cache)
+        assert isinstance(full.check("abc.pdf"), Failure)
+        assert empty.check("abc.pdf") == Success(None)
+
+    def test_check_many_with_workers_and_cache(self) -> None:
+        checker = Checker(
+            rules=self._rules(InstrumentCatalogue.default()), cache=ResultCache()
+        )
+        names = ["1010_Flautí.pdf", "abc.pdf"] * 4
+        results = list(checker.check_many(names, workers=2, chunk_size=3))
+        assert [r for _, r in results] == [checker.check(n) for n in names]
+
+    def test_check_many_with_workers_and_catalogue_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "cat.fxcat"
+        InstrumentCatalogue.default().save_compiled(path)
+        checker = Checker(rules=self._rules(InstrumentCatalogue.from_file(path)))
+        names = ["1010_Flautí.pdf", "1010_Flauta.pdf", "abc.pdf"] * 3
+        results = list(checker.check_many(names, workers=2, chunk_size=2))
+        assert [r for _, r in results] == [checker.check(n) for n in names]
@@ -0,0 +1,232 @@
+"""Tests for checkpointed, resumable listings (CrawlCheckpoint, --resume)."""
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from cli import sheet_parser
+from cli.sources import ResumableDriveSource
+from drive_connection import (
+    CheckpointedCrawl,
+    CrawlCheckpoint,
+    DriveConnectionError,
+    DriveEntry,
+    list_file_entries,
+)
+from tests.benchmarks.fake_drive import ROOT_ID, FakeDriveService, generate_archive
+
+_ARCHIVE = generate_archive(depth=3, fan_out=3, files_per_folder=4)
+
+
+class _FailingService(FakeDriveService):
+    """FakeDriveService (3 items per page) that cannot list one folder.
+
+    Listing it raises error: DriveConnectionError, or KeyboardInterrupt
+    for a user stopping the run.
+    """
+
+    def __init__(
+        self,
+        failing_folder: str,
+        error: type[BaseException] = DriveConnectionError,
+    ) -> None:
+        super().__init__(_ARCHIVE, page_size=3)
+        self.failing_folder = failing_folder
+        self.error = error
+
+    def list_page(self, **kwargs: object) -> dict:
+        if f"'{self.failing_folder}' in parents" in str(kwargs["q"]):
+            msg = "boom"
+            raise self.error(msg)
+        return super().list_page(**kwargs)
+
+
+def _fails(entry: DriveEntry) -> bool:
+    return entry.file_id.endswith(("f0", "f3"))
+
+
+def _full_listing(*, recursive: bool = True) -> list[DriveEntry]:
+    return list(
+        list_file_entries(FakeDriveService(_ARCHIVE), ROOT_ID, recursive=recursive)
+    )
+
+
+# A folder listed about halfway through the depth-first walk.
+_MIDDLE_FOLDER = _full_listing()[len(_full_listing()) // 2].file_id.split("f")[0]
+
+
+def _run(crawl: CheckpointedCrawl, *, lag: int = 0) -> list[DriveEntry]:
+    """Consume crawl, validating each entry lag entries after it is listed.
+
+    Returns the validated entries; stops when the listing fails.
+    """
+    listed: list[DriveEntry] = []
+    validated: list[DriveEntry] = []
+    try:
+        for entry in crawl.entries():
+            listed.append(entry)
+            if len(listed) > lag:
+                done = listed[len(validated)]
+                crawl.validated(done, failed=_fails(done))
+                validated.append(done)
+    except DriveConnectionError:
+        return validated
+    for done in listed[len(validated) :]:
+        crawl.validated(done, failed=_fails(done))
+        validated.append(done)
+    return validated
+
+
+class TestCheckpointedCrawl:
+    """A crawl yields list_file_entries' order and resumes without gaps."""
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    @pytest.mark.parametrize("recursive", [True, False])
+    def test_uninterrupted_crawl_matches_list_file_entries(
+        self,
+        concurrency: int,
+        recursive: bool,  # noqa: FBT001
+    ) -> None:
+        checkpoint = CrawlCheckpoint.start(ROOT_ID, recursive=recursive)
+        crawl = CheckpointedCrawl(
+            FakeDriveService(_ARCHIVE), checkpoint, concurrency=concurrency
+        )
+        assert _run(crawl) == _full_listing(recursive=recursive)
+        final = crawl.checkpoint()
+        assert final.frontier == []
+        assert final.total == len(_full_listing(recursive=recursive))
+
+    @pytest.mark.parametrize("lag", [0, 5])
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_resume_after_failure_validates_every_file_once(
+        self, tmp_path: Path, lag: int, concurrency: int
+    ) -> None:
+        path = tmp_path / "checkpoint.json"
+        crawl = CheckpointedCrawl(
+            _FailingService(_MIDDLE_FOLDER),
+            CrawlCheckpoint.start(ROOT_ID, recursive=True),
+            concurrency=concurrency,
+        )
+        first = _run(crawl, lag=lag)
+        crawl.checkpoint().save(path)
+        saved = CrawlCheckpoint.load(path)
+        assert 0 < saved.total <= len(first)
+        assert saved.frontier
+
+        resumed = CheckpointedCrawl(
+            FakeDriveService(_ARCHIVE), saved, concurrency=concurrency
+        )
+        second = _run(resumed)
+        expected = _full_listing()
+        assert second[: len(saved.failing)] == saved.failing
+        new = second[len(saved.failing) :]
+        assert first[: saved.total] + new == expected
+        final = resumed.checkpoint()
+        assert final.total == resumed.resumed + len(second) == len(expected)
+        assert final.failing == [e for e in expected if _fails(e)]
+
+    def test_resume_lists_only_the_frontier(self) -> None:
+        full = FakeDriveService(_ARCHIVE, page_size=3)
+        _run(CheckpointedCrawl(full, CrawlCheckpoint.start(ROOT_ID, recursive=True)))
+        failing = _FailingService(_MIDDLE_FOLDER)
+        crawl = CheckpointedCrawl(
+            failing, CrawlCheckpoint.start(ROOT_ID, recursive=True)
+        )
+        _run(crawl)
+        resumed = FakeDriveService(_ARCHIVE, page_size=3)
+        _run(CheckpointedCrawl(resumed, crawl.checkpoint()))
+        # Nothing is listed twice; the first run also made the failed call.
+        assert failing.calls - 1 + resumed.calls == full.calls
+
+    def test_load_rejects_invalid_files(self, tmp_path: Path) -> None:
+        path = tmp_path / "checkpoint.json"
+        path.write_text('{"version": 99}')
+        with pytest.raises(ValueError, match="unsupported checkpoint version"):
+            CrawlCheckpoint.load(path)
+        path.write_text('{"version": 1}')
+        with pytest.raises(ValueError, match="invalid checkpoint"):
+            CrawlCheckpoint.load(path)
+
+    def test_load_ignores_the_completed_folders_of_older_files(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "checkpoint.json"
+        CrawlCheckpoint.start(ROOT_ID, recursive=True).save(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert "completed" not in data
+        path.write_text(json.dumps({**data, "completed": ["a", "b"]}))
+        assert CrawlCheckpoint.load(path) == CrawlCheckpoint.start(
+            ROOT_ID, recursive=True
+        )
+
+
+def test_resumable_source_saves_on_failure(tmp_path: Path) -> None:
+    """ResumableDriveSource writes the checkpoint when the listing fails."""
+    path = tmp_path / "checkpoint.json"
+    crawl = CheckpointedCrawl(
+        _FailingService(_MIDDLE_FOLDER),
+        CrawlCheckpoint.start(ROOT_ID, recursive=True),
+    )
+    source = ResumableDriveSource(crawl, path, interval=3600)
+
+    def consume() -> None:
+        for entry in source.entries():
+            source.validated(entry, failed=False)
+
+    with pytest.raises(DriveConnectionError):
+        consume()
+    assert CrawlCheckpoint.load(path).total > 0
+
+
+class TestCliResume:
+    """sheet_parser --resume continues an interrupted run."""
+
+    def _invoke(
+        self, monkeypatch: pytest.MonkeyPatch, service: object, *args: str
+    ) -> object:
+        monkeypatch.setattr(sheet_parser, "_connect", lambda **_: service)
+        return CliRunner().invoke(
+            sheet_parser.app,
+            ["--folder-id", ROOT_ID, "--recursive", "--no-cache", *args],
+        )
+
+    @pytest.mark.parametrize("error", [DriveConnectionError, KeyboardInterrupt])
+    def test_interrupted_run_resumes_to_the_same_log(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        error: type[BaseException],
+    ) -> None:
+        checkpoint = tmp_path / "checkpoint.json"
+        log = tmp_path / "sheets.log"
+        expected_log = tmp_path / "expected.log"
+        result = self._invoke(
+            monkeypatch, FakeDriveService(_ARCHIVE), "--log", str(expected_log)
+        )
+        assert result.exit_code == 0, result.output
+
+        args = ["--resume", str(checkpoint), "--log", str(log)]
+        service = _FailingService(_MIDDLE_FOLDER, error)
+        result = self._invoke(monkeypatch, service, *args)
+        assert result.exit_code != 0
+        assert checkpoint.is_file()
+        assert not log.exists()
+
+        result = self._invoke(monkeypatch, FakeDriveService(_ARCHIVE), *args)
+        assert result.exit_code == 0, result.output
+        assert "Continuant l'execució interrompuda" in result.output
+        assert f"Validats {len(_full_listing())} fitxers." in result.output
+        assert log.read_text(encoding="utf-8") == expected_log.read_text(
+            encoding="utf-8"
+        )
+        assert not checkpoint.exists()
+
+    def test_resume_requires_a_drive_folder(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(
+            sheet_parser.app,
+            ["--path", str(tmp_path), "--resume", str(tmp_path / "c.json")],
+        )
+        assert result.exit_code == 1
+        assert "--resume" in result.output
@@ -0,0 +1,48 @@
+"""Tests for CheckContext."""
+
+import pytest
+
+from string_checker import CheckContext
+
+
+class TestCheckContextViews:
+    """Derived views of the text."""
+
+    def test_stripped_and_stripped_lower(self) -> None:
+        context = CheckContext("  1010_Flautí.PDF  ")
+        assert context.stripped == "1010_Flautí.PDF"
+        assert context.stripped_lower == "1010_flautí.pdf"
+
+    def test_prefix_match_for_valid_prefix(self) -> None:
+        context = CheckContext("1000+2002_Flauta+Trompeta.pdf")
+        assert context.prefix_match is not None
+        assert context.prefix_match.group(0) == "1000+2002_"
+
+    def test_prefix_match_none_for_invalid_prefix(self) -> None:
+        context = CheckContext("abc_foo.pdf")
+        assert context.prefix_match is None
+        assert context.parsed is None
+
+    def test_parsed_matches_parse_filename(self) -> None:
+        context = CheckContext("1000+2010_Guió+Trompeta.pdf")
+        assert context.parsed is not None
+        assert context.parsed.blocks == [(1, "00", 0), (2, "01", 0)]
+        assert context.parsed.names == ["Guió", "Trompeta"]
+
+    def test_parsed_none_when_names_count_mismatch(self) -> None:
+        context = CheckContext("1000_A+B.pdf")
+        assert context.prefix_match is not None
+        assert context.parsed is None
+
+
+class TestCheckContextCaching:
+    """Views are computed once and the context is immutable."""
+
+    def test_parsed_is_cached(self) -> None:
+        context = CheckContext("1010_Flautí.pdf")
+        assert context.parsed is context.parsed
+
+    def test_text_is_frozen(self) -> None:
+        context = CheckContext("1010_Flautí.pdf")
+        with pytest.raises(AttributeError):
+            context.text = "other"  # type: ignore[misc]
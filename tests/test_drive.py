@@ -1,12 +1,139 @@
-"""Tests for list_subfolder_names, create_folder, create_shortcut (mocked Drive API)."""
+"""Tests for list_file_names, list_subfolder_names, create_* (mocked Drive API)."""
 
-from unittest.mock import Mock
+import re
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
 
 from drive_connection import (
+    FOLDER_MIMETYPE,
+    MAX_PAGE_SIZE,
+    DriveConnectionError,
+    DriveEntry,
+    DriveMetadataCache,
+    ListingStrategy,
+    ServicePool,
+    ThreadLocalService,
+    build_service,
     create_folder,
     create_shortcut,
+    list_file_entries,
+    list_file_names,
+    list_subfolder_entries,
     list_subfolder_names,
 )
+from drive_connection.drive import LOOKAHEAD_PER_THREAD, _discovery_document
+from tests.benchmarks.fake_drive import ROOT_ID, FakeDriveService, generate_archive
+
+_PARENT_RE = re.compile(r"'([^']+)' in parents")
+
+# folder_id -> children, as returned by files().list for that folder.
+_TREE: dict[str, list[dict]] = {
+    "root": [
+        {"id": "a.pdf", "name": "a.pdf", "mimeType": "application/pdf"},
+        {"id": "w1", "name": "Work1", "mimeType": FOLDER_MIMETYPE},
+        {"id": "b.pdf", "name": "b.pdf", "mimeType": "application/pdf"},
+        {"id": "w2", "name": "Work2", "mimeType": FOLDER_MIMETYPE},
+    ],
+    "w1": [
+        {"id": "w1p1", "name": "1010_Flautí.pdf", "mimeType": "application/pdf"},
+        {"id": "w1s", "name": "Extra", "mimeType": FOLDER_MIMETYPE},
+        {"id": "w1p2", "name": "1000_Flauta.pdf", "mimeType": "application/pdf"},
+    ],
+    "w1s": [
+        {"id": "w1s1", "name": "2020_Trompeta.pdf", "mimeType": "application/pdf"},
+    ],
+    "w2": [
+        {"id": "w2p1", "name": "1060_Clarinet.pdf", "mimeType": "application/pdf"},
+    ],
+    # Folder outside the listed subtree.
+    "elsewhere": [
+        {"id": "x", "name": "Other", "mimeType": FOLDER_MIMETYPE},
+    ],
+    "x": [
+        {"id": "xp", "name": "outside.pdf", "mimeType": "application/pdf"},
+    ],
+}
+
+
+class _TreeService:
+    """Mock-backed service serving a folder tree two items per page.
+
+    Answers "'id' in parents" queries (OR-ed and filtered by mimeType too)
+    and the all-folders query, with optional per-call latency. Records the
+    queries and the highest number of list calls executing at the same time.
+    """
+
+    def __init__(self, tree: dict[str, list[dict]], latency: float = 0.0) -> None:
+        self.tree = tree
+        self.latency = latency
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self.queries: list[str] = []
+        self.modified_times: dict[str, str] = {}
+        files_return = Mock()
+        files_return.list = Mock(side_effect=self._list)
+        files_return.get = Mock(side_effect=self._get)
+        self.files = Mock(return_value=files_return)
+
+    def _get(self, **kwargs: object) -> Mock:
+        file_id = str(kwargs["fileId"])
+        modified = self.modified_times.get(file_id, "t0")
+        return Mock(execute=lambda: {"modifiedTime": modified})
+
+    def _list(self, **kwargs: object) -> Mock:
+        q = str(kwargs["q"])
+        self.queries.append(q)
+        if q == f"mimeType = '{FOLDER_MIMETYPE}'":
+            children = [
+                {**item, "parents": [parent]}
+                for parent, items in self.tree.items()
+                for item in items
+                if item["mimeType"] == FOLDER_MIMETYPE
+            ]
+        else:
+            children = [
+                {**item, "parents": [parent]}
+                for parent in _PARENT_RE.findall(q)
+                for item in self.tree.get(parent, [])
+            ]
+            if f"mimeType != '{FOLDER_MIMETYPE}'" in q:
+                children = [c for c in children if c["mimeType"] != FOLDER_MIMETYPE]
+            elif f"mimeType = '{FOLDER_MIMETYPE}'" in q:
+                children = [c for c in children if c["mimeType"] == FOLDER_MIMETYPE]
+        children = [
+            {"modifiedTime": self.modified_times.get(c["id"], "t0"), **c}
+            for c in children
+        ]
+        start = int(str(kwargs.get("pageToken") or 0))
+        page = children[start : start + 2]
+        next_token = str(start + 2) if start + 2 < len(children) else None
+        return Mock(execute=lambda: self._execute(page, next_token))
+
+    def _execute(self, page: list[dict], next_token: str | None) -> dict:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self._lock:
+            self.active -= 1
+        return {"files": page, "nextPageToken": next_token}
+
+
+_EXPECTED_DEPTH_FIRST = [
+    ("a.pdf", "a.pdf"),
+    ("1010_Flautí.pdf", "Work1/1010_Flautí.pdf"),
+    ("2020_Trompeta.pdf", "Work1/Extra/2020_Trompeta.pdf"),
+    ("1000_Flauta.pdf", "Work1/1000_Flauta.pdf"),
+    ("b.pdf", "b.pdf"),
+    ("1060_Clarinet.pdf", "Work2/1060_Clarinet.pdf"),
+]
 
 
 def test_list_subfolder_names_yields_folder_names() -> None:
@@ -148,3 +275,301 @@ def test_create_shortcut_with_name_and_target_mime_type() -> None:
         == "application/vnd.google-apps.document"
     )
     assert call_kw["body"]["parents"] == ["root"]
+
+
+def test_list_file_names_non_recursive_skips_folders() -> None:
+    """Without recursive, only the direct files of the folder are yielded."""
+    service = _TreeService(_TREE)
+
+    result = list(list_file_names(service, "root", recursive=False))
+
+    assert result == [("a.pdf", "a.pdf"), ("b.pdf", "b.pdf")]
+
+
+def test_list_file_names_recursive_depth_first_with_paths() -> None:
+    """Recursive listing descends depth-first and prefixes folder names."""
+    service = _TreeService(_TREE)
+
+    result = list(list_file_names(service, "root", recursive=True))
+
+    assert result == _EXPECTED_DEPTH_FIRST
+
+
+@pytest.mark.parametrize("strategy", list(ListingStrategy))
+def test_list_file_entries_include_drive_ids(strategy: ListingStrategy) -> None:
+    """list_file_entries yields the same files as list_file_names, with IDs."""
+    service = _TreeService(_TREE)
+
+    result = list(list_file_entries(service, "w1", recursive=True, strategy=strategy))
+
+    assert sorted(result) == [
+        DriveEntry("1000_Flauta.pdf", "1000_Flauta.pdf", "w1p2"),
+        DriveEntry("1010_Flautí.pdf", "1010_Flautí.pdf", "w1p1"),
+        DriveEntry("2020_Trompeta.pdf", "Extra/2020_Trompeta.pdf", "w1s1"),
+    ]
+
+
+def test_list_subfolder_entries_include_drive_ids() -> None:
+    """list_subfolder_entries yields each direct subfolder with its ID."""
+    result = list(list_subfolder_entries(_TreeService(_TREE), "root"))
+
+    assert result == [
+        DriveEntry("Work1", "Work1", "w1"),
+        DriveEntry("Work2", "Work2", "w2"),
+    ]
+
+
+def test_list_file_names_concurrent_ordered_matches_sequential() -> None:
+    """Concurrent ordered listing yields exactly the sequential order."""
+    service = _TreeService(_TREE, latency=0.01)
+
+    result = list(list_file_names(service, "root", recursive=True, concurrency=4))
+
+    assert result == _EXPECTED_DEPTH_FIRST
+
+
+def test_list_file_names_concurrent_unordered_yields_all_files() -> None:
+    """Concurrent unordered listing yields every file exactly once."""
+    service = _TreeService(_TREE, latency=0.01)
+
+    result = list(
+        list_file_names(service, "root", recursive=True, concurrency=4, ordered=False)
+    )
+
+    assert sorted(result) == sorted(_EXPECTED_DEPTH_FIRST)
+
+
+def test_list_file_names_concurrent_overlaps_round_trips() -> None:
+    """With latency, sibling folders are listed at the same time."""
+    tree = {
+        "root": [
+            {"id": f"w{i}", "name": f"Work{i}", "mimeType": FOLDER_MIMETYPE}
+            for i in range(8)
+        ],
+        **{
+            f"w{i}": [{"id": f"p{i}", "name": "1010_Flautí.pdf", "mimeType": "x"}]
+            for i in range(8)
+        },
+    }
+    service = _TreeService(tree, latency=0.05)
+
+    result = list(list_file_names(service, "root", recursive=True, concurrency=8))
+
+    assert len(result) == 8
+    assert service.max_active > 1
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_list_file_names_concurrent_lists_a_bounded_lookahead(
+    ordered: bool,  # noqa: FBT001
+) -> None:
+    """A stalled consumer holds back the walk instead of the whole tree."""
+    archive = generate_archive(depth=2, fan_out=12, files_per_folder=2)
+    service = FakeDriveService(archive)
+    entries = list_file_names(
+        service, ROOT_ID, recursive=True, concurrency=2, ordered=ordered
+    )
+    next(entries)
+    time.sleep(0.2)
+    # The lookahead, plus the folders taken on the way to the first file.
+    assert service.calls <= 2 * LOOKAHEAD_PER_THREAD + 3
+    assert len(list(entries)) + 1 == archive.file_count
+
+
+def test_list_file_names_batched_yields_subtree_files_with_paths() -> None:
+    """BATCHED strategy yields the same files and paths as the per-folder walk."""
+    service = _TreeService(_TREE)
+
+    result = list(
+        list_file_names(
+            service, "root", recursive=True, strategy=ListingStrategy.BATCHED
+        )
+    )
+
+    assert sorted(result) == sorted(_EXPECTED_DEPTH_FIRST)
+
+
+def test_list_file_names_batched_uses_one_query_per_batch() -> None:
+    """BATCHED strategy issues one folders query plus one query per batch."""
+    service = _TreeService(_TREE)
+
+    list(
+        list_file_names(
+            service,
+            "root",
+            recursive=True,
+            strategy=ListingStrategy.BATCHED,
+            batch_size=2,
+        )
+    )
+
+    distinct = list(dict.fromkeys(service.queries))
+    assert distinct[0] == f"mimeType = '{FOLDER_MIMETYPE}'"
+    # Four folders in the subtree (root, w1, w1s, w2) in batches of two.
+    assert len(distinct) == 3
+    assert all(" or " in q for q in distinct[1:])
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_list_file_names_cache_serves_unchanged_folders(
+    tmp_path: Path, concurrency: int
+) -> None:
+    """A second run with the cache lists nothing whose modifiedTime is unchanged."""
+    path = tmp_path / "cache.sqlite3"
+    with DriveMetadataCache(path) as cache:
+        first = list(
+            list_file_names(
+                _TreeService(_TREE),
+                "root",
+                recursive=True,
+                concurrency=concurrency,
+                cache=cache,
+            )
+        )
+        assert (cache.hits, cache.misses) == (0, 4)
+
+    service = _TreeService(_TREE)
+    with DriveMetadataCache(path) as cache:
+        second = list(
+            list_file_names(
+                service,
+                "root",
+                recursive=True,
+                concurrency=concurrency,
+                cache=cache,
+            )
+        )
+        assert (cache.hits, cache.misses) == (4, 0)
+
+    assert first == second == _EXPECTED_DEPTH_FIRST
+    # No folder listings: only the subfolder times of the cached parents.
+    assert sorted(service.queries) == [
+        f"'root' in parents and mimeType = '{FOLDER_MIMETYPE}'",
+        f"'w1' in parents and mimeType = '{FOLDER_MIMETYPE}'",
+    ]
+
+
+def test_list_file_names_cache_relists_modified_folder(tmp_path: Path) -> None:
+    """Only the folder whose modifiedTime changed is listed again."""
+    path = tmp_path / "cache.sqlite3"
+    with DriveMetadataCache(path) as cache:
+        list(list_file_names(_TreeService(_TREE), "root", recursive=True, cache=cache))
+
+    service = _TreeService(_TREE)
+    service.modified_times["w2"] = "t1"
+    with DriveMetadataCache(path) as cache:
+        result = list(list_file_names(service, "root", recursive=True, cache=cache))
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    assert result == _EXPECTED_DEPTH_FIRST
+    listings = [q for q in service.queries if "mimeType" not in q]
+    assert listings == ["'w2' in parents"]
+    # Folders outside the listed tree are never looked up.
+    assert f"mimeType = '{FOLDER_MIMETYPE}'" not in service.queries
+
+
+def test_list_subfolder_names_with_cache(tmp_path: Path) -> None:
+    """list_subfolder_names reuses the cached listing of the parent folder."""
+    path = tmp_path / "cache.sqlite3"
+    with DriveMetadataCache(path) as cache:
+        first = list(list_subfolder_names(_TreeService(_TREE), "root", cache=cache))
+    service = _TreeService(_TREE)
+    with DriveMetadataCache(path) as cache:
+        second = list(list_subfolder_names(service, "root", cache=cache))
+        assert cache.hits == 1
+
+    assert first == second == [("Work1", "Work1"), ("Work2", "Work2")]
+    assert service.queries == []
+
+
+def test_listing_requests_page_size_and_minimal_fields() -> None:
+    """Listings ask for MAX_PAGE_SIZE (or page_size) files with few fields."""
+    service = _TreeService(_TREE)
+    list(list_file_entries(service, "root", recursive=True))
+    list(list_subfolder_entries(service, "root", page_size=10))
+    calls = service.files.return_value.list.call_args_list
+    assert {c.kwargs["pageSize"] for c in calls[:-2]} == {MAX_PAGE_SIZE}
+    assert {c.kwargs["fields"] for c in calls[:-2]} == {
+        "nextPageToken, files(id, name, mimeType)"
+    }
+    assert calls[-1].kwargs["pageSize"] == 10
+    assert calls[-1].kwargs["fields"] == "nextPageToken, files(id, name)"
+
+
+@pytest.mark.parametrize("page_size", [0, MAX_PAGE_SIZE + 1])
+def test_invalid_page_size_raises(page_size: int) -> None:
+    """page_size must be between 1 and MAX_PAGE_SIZE."""
+    service = _TreeService(_TREE)
+    with pytest.raises(ValueError, match="page_size"):
+        list(list_file_entries(service, "root", recursive=True, page_size=page_size))
+    with pytest.raises(ValueError, match="page_size"):
+        list(list_subfolder_entries(service, "root", page_size=page_size))
+
+
+def test_list_file_names_concurrent_wraps_http_error() -> None:
+    """A non-retryable HttpError in a worker thread raises DriveConnectionError."""
+    error = HttpError(Mock(status=404, reason="boom"), b"")
+    list_return = Mock()
+    list_return.execute = Mock(side_effect=error)
+    files_return = Mock()
+    files_return.list = Mock(return_value=list_return)
+    service = Mock(files=Mock(return_value=files_return))
+
+    with pytest.raises(DriveConnectionError):
+        list(list_file_names(service, "root", recursive=True, concurrency=2))
+
+
+def test_thread_local_service_builds_one_service_per_thread() -> None:
+    """ThreadLocalService calls the factory once per calling thread."""
+    built: list[Mock] = []
+
+    def factory() -> Mock:
+        service = Mock()
+        built.append(service)
+        return service
+
+    proxy = ThreadLocalService(factory)
+    proxy.files()
+    proxy.files()
+    worker = threading.Thread(target=proxy.files)
+    worker.start()
+    worker.join()
+
+    assert len(built) == 2
+
+
+def _credentials() -> Credentials:
+    return Credentials(token="access-token")  # noqa: S106
+
+
+def test_build_service_uses_the_bundled_discovery_document() -> None:
+    """Services are built offline; the document file is read once per process."""
+    with patch("httplib2.Http.request", side_effect=AssertionError("network")):
+        for _ in range(2):
+            service = build_service(_credentials())
+            request = service.files().list(q="x")
+            assert request.uri.startswith("https://www.googleapis.com/drive/v3/")
+    assert _discovery_document.cache_info().misses == 1
+
+
+def test_service_pool_gives_each_thread_its_own_transport() -> None:
+    """A ServicePool builds one authorized transport per thread, same creds."""
+    creds = _credentials()
+    pool = ServicePool(creds, timeout=5)
+    https: list[object] = []
+
+    def use() -> None:
+        https.append(pool.files().list(q="x").http)
+        https.append(pool.files().list(q="y").http)
+
+    use()
+    worker = threading.Thread(target=use)
+    worker.start()
+    worker.join()
+
+    assert pool.size == 2
+    assert https[0] is https[1]
+    assert https[2] is https[3]
+    assert https[0] is not https[2]
+    assert all(http.credentials is creds for http in https)
+    assert https[0].http.timeout == 5
@@ -0,0 +1,236 @@
+"""Tests for RequestExecutor and TokenBucket (retries and rate limiting)."""
+
+import json
+import threading
+from collections.abc import Iterator
+from unittest.mock import Mock
+
+import pytest
+from googleapiclient.errors import HttpError
+from typer.testing import CliRunner
+
+from cli import work_parser
+from drive_connection import (
+    FOLDER_MIMETYPE,
+    DriveConnectionError,
+    RequestExecutor,
+    TokenBucket,
+    create_folder,
+    list_subfolder_names,
+    set_request_executor,
+)
+from drive_connection.executor import is_rate_limited, is_retryable
+
+
+def _http_error(status: int, reason: str | None = None) -> HttpError:
+    error: dict = {"code": status, "message": "error"}
+    if reason is not None:
+        error["errors"] = [{"reason": reason}]
+    content = json.dumps({"error": error}).encode()
+    return HttpError(Mock(status=status, reason="error"), content)
+
+
+def _request(*outcomes: object) -> Mock:
+    """Return a request whose execute() raises or returns outcomes in turn."""
+    return Mock(execute=Mock(side_effect=list(outcomes)))
+
+
+class _Clock:
+    """Manual monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def sleep() -> Mock:
+    """Stand-in for time.sleep recording the waits."""
+    return Mock()
+
+
+@pytest.fixture
+def executor(sleep: Mock) -> Iterator[RequestExecutor]:
+    """Install an unthrottled executor with 3 retries and no jitter."""
+    executor = RequestExecutor(max_retries=3, rate=None, sleep=sleep, jitter=lambda: 1)
+    previous = set_request_executor(executor)
+    yield executor
+    set_request_executor(previous)
+
+
+class TestRequestExecutor:
+    """execute() retries transient errors with exponential backoff."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [_http_error(429), _http_error(500), _http_error(503)],
+        ids=["429", "500", "503"],
+    )
+    def test_retries_transient_errors(
+        self, executor: RequestExecutor, sleep: Mock, error: HttpError
+    ) -> None:
+        request = _request(error, error, {"id": "x"})
+        assert executor.execute(request) == {"id": "x"}
+        assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0]
+        assert (executor.requests, executor.retries) == (3, 2)
+
+    def test_does_not_retry_other_errors(
+        self, executor: RequestExecutor, sleep: Mock
+    ) -> None:
+        error = _http_error(403, "insufficientFilePermissions")
+        with pytest.raises(HttpError):
+            executor.execute(_request(error))
+        sleep.assert_not_called()
+        assert executor.retries == 0
+
+    def test_raises_last_error_after_max_retries(
+        self, executor: RequestExecutor
+    ) -> None:
+        errors = [_http_error(503) for _ in range(4)]
+        with pytest.raises(HttpError) as info:
+            executor.execute(_request(*errors))
+        assert info.value is errors[-1]
+        assert executor.requests == 4
+
+    def test_backoff_is_jittered_and_capped(self) -> None:
+        executor = RequestExecutor(backoff=1, max_backoff=8, jitter=lambda: 0)
+        assert [executor.backoff_delay(n) for n in range(5)] == [0.5, 1, 2, 4, 4]
+
+    def test_reset_stats(self, executor: RequestExecutor) -> None:
+        executor.execute(_request(_http_error(500), {}))
+        executor.reset_stats()
+        assert executor.requests == executor.retries == executor.throttle_waits == 0
+        assert executor.request_seconds == 0
+
+    def test_times_every_attempt(self) -> None:
+        clock = _Clock()
+
+        def answer() -> dict:
+            clock.now += 0.25
+            if clock.now < 0.3:
+                raise _http_error(503)
+            return {}
+
+        executor = RequestExecutor(rate=None, sleep=Mock(), clock=clock)
+        executor.execute(Mock(execute=answer))
+        assert executor.requests == 2
+        assert executor.request_seconds == pytest.approx(0.5)
+
+    def test_throttles_with_the_token_bucket(self, sleep: Mock) -> None:
+        clock = _Clock()
+        executor = RequestExecutor(rate=10, burst=2, sleep=sleep, clock=clock)
+        for _ in range(4):
+            executor.execute(_request({}))
+        assert [c.args[0] for c in sleep.call_args_list] == pytest.approx([0.1, 0.2])
+        assert executor.throttle_waits == 2
+
+
+def test_is_rate_limited_and_is_retryable() -> None:
+    """429s and 403s with a rate-limit reason are rate limiting."""
+    assert is_rate_limited(_http_error(429))
+    assert is_rate_limited(_http_error(403, "rateLimitExceeded"))
+    assert is_retryable(_http_error(403, "userRateLimitExceeded"))
+    assert not is_retryable(_http_error(403, "insufficientFilePermissions"))
+    assert not is_retryable(_http_error(404))
+
+
+def test_non_idempotent_requests_retry_rate_limiting_only() -> None:
+    """Without idempotent, server errors are not retried; rate limiting is."""
+    assert not is_retryable(_http_error(503), idempotent=False)
+    assert is_retryable(_http_error(429), idempotent=False)
+    assert is_retryable(_http_error(403, "rateLimitExceeded"), idempotent=False)
+
+
+class TestTokenBucket:
+    """reserve() hands out burst tokens, then waits at the refill rate."""
+
+    def test_refills_at_rate_up_to_capacity(self) -> None:
+        clock = _Clock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0.5]
+        clock.now = 10
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0.5]
+
+    def test_reserve_several_tokens(self) -> None:
+        bucket = TokenBucket(rate=10, capacity=10, clock=_Clock())
+        assert bucket.reserve(10) == 0
+        assert bucket.reserve(5) == pytest.approx(0.5)
+
+    def test_concurrent_callers_queue_up(self) -> None:
+        bucket = TokenBucket(rate=1, capacity=1, clock=_Clock())
+        delays: list[float] = []
+        lock = threading.Lock()
+
+        def take() -> None:
+            for _ in range(5):
+                delay = bucket.reserve()
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=take) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(delays) == list(range(20))
+
+    @pytest.mark.parametrize(("rate", "capacity"), [(0, None), (1, 0)])
+    def test_invalid_parameters_raise(self, rate: float, capacity: float) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            TokenBucket(rate, capacity)
+
+
+class TestDriveFunctionsUseTheExecutor:
+    """Listing and creation functions go through the installed executor."""
+
+    def test_listing_retries_and_counts(
+        self, executor: RequestExecutor, sleep: Mock
+    ) -> None:
+        page = {"files": [{"id": "w", "name": "Work", "mimeType": FOLDER_MIMETYPE}]}
+        service = Mock()
+        service.files.return_value.list.return_value = _request(_http_error(503), page)
+        assert list(list_subfolder_names(service, "root")) == [("Work", "Work")]
+        assert (executor.requests, executor.retries) == (2, 1)
+        sleep.assert_called_once_with(1.0)
+
+    @pytest.mark.usefixtures("executor")
+    def test_creation_wraps_the_final_error(self) -> None:
+        service = Mock()
+        service.files.return_value.create.return_value = _request(_http_error(500))
+        with pytest.raises(DriveConnectionError) as info:
+            create_folder(service, "Obra")
+        assert isinstance(info.value.__cause__, HttpError)
+
+    def test_creation_is_not_retried_on_server_errors(
+        self, executor: RequestExecutor, sleep: Mock
+    ) -> None:
+        """A 5xx may hide a created folder: retrying could duplicate it."""
+        service = Mock()
+        create = service.files.return_value.create
+        create.return_value = _request(_http_error(500), {"id": "x"})
+        with pytest.raises(DriveConnectionError):
+            create_folder(service, "Obra")
+        assert executor.requests == 1
+        sleep.assert_not_called()
+        create.return_value = _request(_http_error(429), {"id": "x"})
+        assert create_folder(service, "Obra") == {"id": "x"}
+        assert executor.retries == 1
+
+
+def test_work_parser_reports_retries(
+    executor: RequestExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The CLI resets the counters per run and reports retries."""
+    executor.retries = 7
+    page = {"files": [{"id": "w", "name": "Obra_Autor", "mimeType": FOLDER_MIMETYPE}]}
+    service = Mock()
+    service.files.return_value.list.return_value = _request(_http_error(429), page)
+    monkeypatch.setattr(
+        work_parser, "load_credentials_and_build_service", lambda: service
+    )
+    result = CliRunner().invoke(work_parser.app, ["--folder-id", "root", "--no-cache"])
+    assert result.exit_code == 0, result.output
+    assert "Google Drive: 1 peticions repetides, 0 esperes" in result.output
+    assert "Google Drive: 2 peticions en " in result.output
@@ -0,0 +1,74 @@
+"""Tests for the lazy package exports and the CLI import footprint."""
+
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_SRC = Path(__file__).parents[1] / "src"
+_PACKAGES = ["cli", "drive_connection", "string_checker", "string_checker.data"]
+# Heavy dependencies that must wait until a command actually needs them.
+_DEFERRED = [
+    "googleapiclient",
+    "google.oauth2",
+    "google_auth_oauthlib",
+    "httpx",
+    "returns",
+    "attrs",
+    "string_checker.checker",
+]
+
+
+def _loaded_after_import(module: str) -> set[str]:
+    """Return the modules a fresh interpreter has loaded after importing module."""
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": str(_SRC)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyPackages:
+    """Package attributes are imported from their modules on first access."""
+
+    @pytest.mark.parametrize("package", _PACKAGES)
+    def test_every_public_name_resolves(self, package: str) -> None:
+        module = importlib.import_module(package)
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+        assert set(module.__all__) <= set(dir(module))
+
+    @pytest.mark.parametrize("package", _PACKAGES)
+    def test_unknown_name_raises(self, package: str) -> None:
+        module = importlib.import_module(package)
+        with pytest.raises(AttributeError, match="no_such_name"):
+            _ = module.no_such_name
+
+    def test_name_is_the_defining_module_object(self) -> None:
+        import string_checker  # noqa: PLC0415
+        from string_checker.checker import Checker  # noqa: PLC0415
+
+        assert string_checker.Checker is Checker
+
+    @pytest.mark.parametrize("package", ["cli", "drive_connection"])
+    def test_packages_do_not_import_each_other(self, package: str) -> None:
+        loaded = _loaded_after_import(package)
+        assert [name for name in _PACKAGES if name in loaded] == [package]
+
+
+class TestCliImportFootprint:
+    """Importing a CLI does not load the Google clients or the checker."""
+
+    @pytest.mark.parametrize(
+        "module", ["cli.sheet_parser", "cli.work_parser", "cli.catalogue_compiler"]
+    )
+    def test_heavy_modules_are_deferred(self, module: str) -> None:
+        loaded = _loaded_after_import(module)
+        assert [name for name in _DEFERRED if name in loaded] == []
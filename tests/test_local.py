@@ -0,0 +1,171 @@
+"""Tests for local directory listings and the CLIs' --path source."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from cli import sheet_parser, work_parser
+from drive_connection.drive import LOOKAHEAD_PER_THREAD
+from local_connection import (
+    LocalConnectionError,
+    list_local_file_entries,
+    list_local_subfolder_entries,
+)
+from local_connection.local import _scan
+
+_VALID_FILE = "1000_Flauta.pdf"
+
+
+def _make_tree(root: Path) -> Path:
+    """Create a small archive: two work folders, nested parts, hidden files."""
+    files = [
+        "Obra_Autor/" + _VALID_FILE,
+        "Obra_Autor/Parts/1001_Flauta.pdf",
+        "Obra_Autor/Parts/notes.txt",
+        "Altra@Obra_Autor/2000_Trompeta.pdf",
+        "solt.pdf",
+        ".DS_Store",
+        ".amagat/1000_Flauta.pdf",
+    ]
+    for name in files:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return root
+
+
+class TestListLocalFileEntries:
+    """list_local_file_entries yields files like the Drive listing."""
+
+    def test_top_level_only(self, tmp_path: Path) -> None:
+        entries = list(list_local_file_entries(_make_tree(tmp_path), recursive=False))
+        assert [(e.name, e.display_path) for e in entries] == [("solt.pdf", "solt.pdf")]
+        assert entries[0].file_id == str(tmp_path / "solt.pdf")
+
+    def test_recursive_is_sorted_and_depth_first(self, tmp_path: Path) -> None:
+        entries = list_local_file_entries(_make_tree(tmp_path), recursive=True)
+        assert [e.display_path for e in entries] == [
+            "Altra@Obra_Autor/2000_Trompeta.pdf",
+            "Obra_Autor/" + _VALID_FILE,
+            "Obra_Autor/Parts/1001_Flauta.pdf",
+            "Obra_Autor/Parts/notes.txt",
+            "solt.pdf",
+        ]
+
+    @pytest.mark.parametrize("concurrency", [2, 8])
+    def test_concurrent_keeps_sequential_order(
+        self, tmp_path: Path, concurrency: int
+    ) -> None:
+        root = _make_tree(tmp_path)
+        sequential = list(list_local_file_entries(root, recursive=True))
+        concurrent = list(
+            list_local_file_entries(root, recursive=True, concurrency=concurrency)
+        )
+        assert concurrent == sequential
+
+    def test_concurrent_reads_a_bounded_lookahead(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A stalled consumer holds back the scans instead of the whole tree."""
+        for i in range(12):
+            for j in range(12):
+                (tmp_path / f"d{i:02}" / f"e{j:02}").mkdir(parents=True)
+                (tmp_path / f"d{i:02}" / f"e{j:02}" / "f.pdf").touch()
+        scans: list[str] = []
+
+        def counting_scan(path: str) -> list[tuple[str, str, bool]]:
+            scans.append(path)
+            return _scan(path)
+
+        monkeypatch.setattr("local_connection.local._scan", counting_scan)
+        entries = list_local_file_entries(tmp_path, recursive=True, concurrency=2)
+        next(entries)
+        time.sleep(0.2)
+        # The lookahead, plus the directories taken on the way to the first file.
+        assert len(scans) <= 2 * LOOKAHEAD_PER_THREAD + 3
+        assert len(list(entries)) + 1 == 12 * 12
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_symlinked_directory_is_skipped(
+        self, tmp_path: Path, concurrency: int
+    ) -> None:
+        root = _make_tree(tmp_path / "archive")
+        expected = list(list_local_file_entries(root, recursive=True))
+        (root / "enllaç").symlink_to(root / "Obra_Autor", target_is_directory=True)
+        entries = list_local_file_entries(root, recursive=True, concurrency=concurrency)
+        paths = [e.display_path for e in entries]
+        assert "enllaç" not in paths
+        assert paths == [e.display_path for e in expected]
+        subfolders = [e.name for e in list_local_subfolder_entries(root)]
+        assert "enllaç" not in subfolders
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_missing_directory_raises(self, tmp_path: Path, concurrency: int) -> None:
+        entries = list_local_file_entries(
+            tmp_path / "absent", recursive=True, concurrency=concurrency
+        )
+        with pytest.raises(LocalConnectionError, match="absent"):
+            list(entries)
+
+
+def test_list_local_subfolder_entries(tmp_path: Path) -> None:
+    """Only direct, visible subdirectories are listed, sorted by name."""
+    entries = list(list_local_subfolder_entries(_make_tree(tmp_path)))
+    assert [(e.name, e.display_path) for e in entries] == [
+        ("Altra@Obra_Autor", "Altra@Obra_Autor"),
+        ("Obra_Autor", "Obra_Autor"),
+    ]
+    assert entries[1].file_id == str(tmp_path / "Obra_Autor")
+
+
+class TestCliPath:
+    """Both CLIs validate a local directory with --path, without credentials."""
+
+    def test_sheet_parser_logs_failing_files(self, tmp_path: Path) -> None:
+        root = _make_tree(tmp_path / "archive")
+        log = tmp_path / "sheets.jsonl"
+        result = CliRunner().invoke(
+            sheet_parser.app,
+            ["--path", str(root), "-r", "--log", str(log), "--format", "jsonl"],
+        )
+        assert result.exit_code == 0, result.output
+        assert "Validats 5 fitxers." in result.output
+        paths = [
+            json.loads(line)["path"]
+            for line in log.read_text(encoding="utf-8").splitlines()
+        ]
+        assert "Obra_Autor/" + _VALID_FILE not in paths
+        assert "Obra_Autor/Parts/notes.txt" in paths
+
+    def test_work_parser_logs_failing_folders(self, tmp_path: Path) -> None:
+        root = _make_tree(tmp_path / "archive")
+        log = tmp_path / "works.log"
+        result = CliRunner().invoke(
+            work_parser.app, ["--path", str(root), "--log", str(log)]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Validades 2 carpetes." in result.output
+        text = log.read_text(encoding="utf-8")
+        assert "Carpeta: Altra@Obra_Autor" in text
+        assert "Carpeta: Obra_Autor\n" not in text
+
+    @pytest.mark.parametrize(
+        "args",
+        [[], ["--folder-id", "abc", "--path", "."]],
+        ids=["none", "both"],
+    )
+    def test_exactly_one_source_is_required(self, args: list[str]) -> None:
+        result = CliRunner().invoke(sheet_parser.app, args)
+        assert result.exit_code == 1
+        assert "--folder-id" in result.output
+
+    def test_missing_directory_does_not_create_log(self, tmp_path: Path) -> None:
+        log = tmp_path / "sheets.log"
+        result = CliRunner().invoke(
+            sheet_parser.app, ["--path", str(tmp_path / "absent"), "--log", str(log)]
+        )
+        assert result.exit_code == 1
+        assert not log.exists()
@@ -0,0 +1,130 @@
+"""Tests for LogWriter: streamed blocks, published only on success."""
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from cli.log_writer import LogWriter, OutputFormat
+from cli.messages import Language, load_messages
+from cli.messages_ca import failure_to_message_ca
+from string_checker import (
+    InstrumentNameMismatchFailure,
+    InvalidFolderCharacterFailure,
+    NotPdfFailure,
+)
+
+_FAILURES = (InvalidFolderCharacterFailure(index=2, char="@"),)
+
+
+def test_writes_blocks_and_publishes_on_success(tmp_path: Path) -> None:
+    """Each failing entry becomes a block; the log appears when the block ends."""
+    log_path = tmp_path / "logs" / "run.log"
+
+    with LogWriter(log_path, "Carpeta") as log:
+        log.write("Work@1", _FAILURES)
+        log.write("Work@2", _FAILURES)
+        assert not log_path.exists()
+
+    text = log_path.read_text(encoding="utf-8")
+    assert text.startswith("Carpeta: Work@1\n")
+    assert "Carpeta: Work@2\n" in text
+    assert "«@»" in text
+    assert log.count == 2
+    assert list(log_path.parent.iterdir()) == [log_path]
+
+
+def test_error_leaves_no_log_and_keeps_previous(tmp_path: Path) -> None:
+    """On an exception the temporary file is removed and the old log kept."""
+    log_path = tmp_path / "run.log"
+    log_path.write_text("previous\n", encoding="utf-8")
+
+    def run() -> None:
+        with LogWriter(log_path, "Fitxer") as log:
+            log.write("a.pdf", _FAILURES)
+            raise SystemExit(1)
+
+    with pytest.raises(SystemExit):
+        run()
+
+    assert log_path.read_text(encoding="utf-8") == "previous\n"
+    assert list(tmp_path.iterdir()) == [log_path]
+
+
+def test_without_path_only_counts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With log_path None, failures are counted and nothing is written."""
+    monkeypatch.chdir(tmp_path)
+
+    with LogWriter(None, "Fitxer") as log:
+        log.write("a.pdf", _FAILURES)
+
+    assert log.count == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_jsonl_writes_one_object_per_entry(tmp_path: Path) -> None:
+    """JSONL records hold the path, the Drive ID and structured failures."""
+    log_path = tmp_path / "run.jsonl"
+    failures = (
+        InstrumentNameMismatchFailure(
+            instrument_range=1,
+            prefix_code="00",
+            received_name="Flute",
+            expected_name="Flauta",
+        ),
+        NotPdfFailure(message="Must end with .pdf"),
+    )
+
+    with LogWriter(log_path, "Fitxer", OutputFormat.JSONL) as log:
+        log.write("Work/1000_Flute", failures, "id1")
+        log.write("Work/x@", _FAILURES, "id2")
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    first = json.loads(lines[0])
+    assert len(lines) == 2
+    assert first["path"] == "Work/1000_Flute"
+    assert first["id"] == "id1"
+    assert first["failures"][0] == {
+        "code": "instrument_name_mismatch",
+        "message_ca": failure_to_message_ca(failures[0]),
+        "instrument_range": 1,
+        "prefix_code": "00",
+        "received_name": "Flute",
+        "expected_name": "Flauta",
+    }
+    assert first["failures"][1]["message"] == "Must end with .pdf"
+    assert json.loads(lines[1])["failures"][0]["char"] == "@"
+
+
+def test_csv_writes_one_row_per_failure(tmp_path: Path) -> None:
+    """CSV rows hold path, ID, code, Valencian message and JSON details."""
+    log_path = tmp_path / "run.csv"
+    failures = (*_FAILURES, InvalidFolderCharacterFailure(index=5, char="#"))
+
+    with LogWriter(log_path, "Carpeta", OutputFormat.CSV) as log:
+        log.write("Work@#", failures, "folder1")
+
+    with log_path.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["code"] for r in rows] == ["folder_valid_chars"] * 2
+    assert rows[0]["path"] == "Work@#"
+    assert rows[0]["id"] == "folder1"
+    assert "«@»" in rows[0]["message_ca"]
+    assert json.loads(rows[1]["details"]) == {"index": 5, "char": "#"}
+
+
+def test_csv_uses_the_catalogue_language(tmp_path: Path) -> None:
+    """The message column is named and written in the catalogue's language."""
+    log_path = tmp_path / "run.csv"
+
+    with LogWriter(
+        log_path, "Folder", OutputFormat.CSV, load_messages(Language.EN)
+    ) as log:
+        log.write("Work@", _FAILURES, "folder1")
+
+    with log_path.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["message_en"].startswith("Character not allowed")
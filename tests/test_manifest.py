@@ -0,0 +1,101 @@
+"""Tests for reading manifest files (exported listings)."""
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from cli.log_writer import LogWriter, OutputFormat
+from local_connection import LocalConnectionError, LocalEntry, read_manifest_entries
+from string_checker import InvalidCharacterFailure, NotPdfFailure
+
+_ENTRIES = [
+    LocalEntry("1000_Flauta.pdf", "Obra/1000_Flauta.pdf", "id1"),
+    LocalEntry("bad@.pdf", "Obra/Parts/bad@.pdf", "id2"),
+    LocalEntry("solt.txt", "solt.txt", ""),
+]
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_jsonl_manifest(tmp_path: Path) -> None:
+    """Each JSON line gives path and optional id; blank lines are skipped."""
+    lines = [
+        json.dumps({"path": "Obra/1000_Flauta.pdf", "id": "id1"}),
+        "",
+        json.dumps({"path": "Obra/Parts/bad@.pdf", "id": "id2", "extra": 1}),
+        json.dumps({"path": "solt.txt"}),
+    ]
+    path = _write(tmp_path / "m.jsonl", "\n".join(lines) + "\n")
+    assert list(read_manifest_entries(path)) == _ENTRIES
+
+
+def test_csv_manifest(tmp_path: Path) -> None:
+    """CSV rows need a path column; other columns are ignored."""
+    text = (
+        "path,id,code\n"
+        "Obra/1000_Flauta.pdf,id1,x\n"
+        "Obra/Parts/bad@.pdf,id2,y\n"
+        "solt.txt,,z\n"
+    )
+    path = _write(tmp_path / "m.csv", text)
+    assert list(read_manifest_entries(path)) == _ENTRIES
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.JSONL, OutputFormat.CSV])
+def test_log_is_a_manifest(tmp_path: Path, output_format: OutputFormat) -> None:
+    """A JSONL or CSV log lists each failing entry once."""
+    path = tmp_path / f"log.{output_format.value}"
+    failures = (InvalidCharacterFailure(index=0, char="@"), NotPdfFailure(message="x"))
+    with LogWriter(path, "Fitxer", output_format) as log:
+        log.write("Obra/a@", failures, "id1")
+        log.write("Obra/b@", failures, "id2")
+    assert list(read_manifest_entries(path)) == [
+        LocalEntry("a@", "Obra/a@", "id1"),
+        LocalEntry("b@", "Obra/b@", "id2"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("filename", "text", "match"),
+    [
+        ("m.txt", "a.pdf\n", "unknown manifest format"),
+        ("m.jsonl", '{"path": "a.pdf"}\n{bad json\n', r"m\.jsonl:2: invalid JSON"),
+        ("m.jsonl", '{"id": "x"}\n', r"m\.jsonl:1: record without a path"),
+        ("m.csv", "name,id\na.pdf,x\n", r"m\.csv:2: record without a path"),
+    ],
+)
+def test_invalid_manifest_raises(
+    tmp_path: Path, filename: str, text: str, match: str
+) -> None:
+    """Unknown suffixes and malformed records name the file and line."""
+    path = _write(tmp_path / filename, text)
+    with pytest.raises(LocalConnectionError, match=match):
+        list(read_manifest_entries(path))
+
+
+def test_missing_manifest_raises(tmp_path: Path) -> None:
+    """An unreadable manifest raises LocalConnectionError."""
+    with pytest.raises(LocalConnectionError, match="Cannot read manifest"):
+        list(read_manifest_entries(tmp_path / "absent.jsonl"))
+
+
+@pytest.mark.parametrize("filename", ["m.jsonl", "m.csv"])
+def test_non_utf8_manifest_raises(tmp_path: Path, filename: str) -> None:
+    """A manifest that is not UTF-8 raises LocalConnectionError."""
+    path = tmp_path / filename
+    path.write_bytes("path\nObra/Viol\u00ed.pdf\n".encode("latin-1"))
+    with pytest.raises(LocalConnectionError, match="Cannot read manifest"):
+        list(read_manifest_entries(path))
+
+
+def test_malformed_csv_manifest_raises(tmp_path: Path) -> None:
+    """A CSV field over the csv module's size limit raises LocalConnectionError."""
+    field = "a" * (csv.field_size_limit() + 1)
+    path = _write(tmp_path / "m.csv", f"path,id\n{field},x\n")
+    with pytest.raises(LocalConnectionError, match="Cannot read manifest"):
+        list(read_manifest_entries(path))
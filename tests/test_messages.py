@@ -0,0 +1,70 @@
+"""Tests for the message catalogues of every language."""
+
+import pytest
+
+from cli.messages import Language, load_messages
+from string_checker import (
+    FailureKind,
+    InstrumentNameMismatchFailure,
+    InvalidCharacterFailure,
+    InvalidFolderCharacterFailure,
+    InvalidFolderNameFailure,
+    InvalidPrefixFailure,
+    InvalidVoiceFailure,
+    NotPdfFailure,
+    ValidationFailure,
+)
+
+
+class _UnregisteredFailure(ValidationFailure):
+    """Failure type without any formatter."""
+
+    @property
+    def code(self) -> FailureKind:
+        return FailureKind.PREFIX
+
+
+_FAILURES = [
+    InvalidFolderNameFailure(message="Expected Work_Author."),
+    InvalidFolderCharacterFailure(index=0, char="@"),
+    InvalidCharacterFailure(index=3, char="#"),
+    InvalidPrefixFailure(message="bad prefix"),
+    InstrumentNameMismatchFailure(
+        instrument_range=1,
+        prefix_code="00",
+        received_name="Flute",
+        expected_name="Flauta",
+    ),
+    InvalidVoiceFailure(instrument_range=1, prefix_code="00", voice=9, message="bad"),
+    NotPdfFailure(message="Must end with .pdf"),
+]
+
+
+def test_catalogues_have_the_same_keys() -> None:
+    """Every language defines every message of the default catalogue."""
+    expected = load_messages().keys
+    for language in Language:
+        assert load_messages(language).keys == expected
+
+
+@pytest.mark.parametrize("language", list(Language))
+def test_every_failure_type_has_a_message(language: Language) -> None:
+    """Built-in failure types never get the fallback message."""
+    messages = load_messages(language)
+    fallback = messages.failure_message(_UnregisteredFailure())
+
+    for failure in _FAILURES:
+        assert messages.failure_message(failure) != fallback
+
+
+@pytest.mark.parametrize("language", list(Language))
+def test_text_fills_in_fields(language: Language) -> None:
+    """Templates are filled in with the given fields."""
+    assert "42" in load_messages(language).text("files_validated", n=42)
+
+
+def test_load_messages_returns_one_catalogue_per_language() -> None:
+    """Catalogues are loaded once and shared."""
+    assert load_messages(Language.ES) is load_messages(Language.ES)
+    assert load_messages().language is Language.CA
+    assert "«#»" in load_messages(Language.EN).failure_message(_FAILURES[2])
@@ -1,9 +1,16 @@
-"""Tests for failure_to_message_ca with folder failure types."""
+"""Tests for the Valencian failure messages and their formatter registry."""
 
-from cli.messages_ca import failure_to_message_ca
+from cli.messages_ca import (
+    failure_to_message_ca,
+    failures_to_lines_ca,
+    format_failures_ca,
+    register_message_ca,
+)
 from string_checker import (
+    FailureKind,
     InvalidFolderCharacterFailure,
     InvalidFolderNameFailure,
+    ValidationFailure,
 )
 
 
@@ -22,3 +29,49 @@ def test_invalid_folder_character_failure_message() -> None:
     assert "carpeta" in result
     assert "«@»" in result
     assert "posició 3" in result
+
+
+class _CustomFailure(ValidationFailure):
+    """Failure type of a hypothetical rule package."""
+
+    @property
+    def code(self) -> FailureKind:
+        return FailureKind.VALID_CHARS
+
+
+class _SubFailure(_CustomFailure):
+    """Subclass that first inherits its base's formatter."""
+
+
+class _UnknownFailure(_CustomFailure):
+    """Failure type nobody registers a formatter for."""
+
+
+def test_registered_formatter_applies_to_subclasses() -> None:
+    """A registered formatter serves its type and subclasses, via the MRO."""
+    fallback = failure_to_message_ca(_UnknownFailure())
+    assert fallback.startswith("El nom del fitxer no compleix")
+
+    register_message_ca(_CustomFailure, lambda _: "Missatge propi.")
+
+    assert failure_to_message_ca(_CustomFailure()) == "Missatge propi."
+    assert failure_to_message_ca(_SubFailure()) == "Missatge propi."
+
+    register_message_ca(_SubFailure, lambda _: "Subclasse.")
+
+    assert failure_to_message_ca(_SubFailure()) == "Subclasse."
+    assert failure_to_message_ca(_CustomFailure()) == "Missatge propi."
+
+
+def test_format_failures_ca_matches_lines() -> None:
+    """format_failures_ca joins failures_to_lines_ca with newlines."""
+    failures = [
+        InvalidFolderNameFailure(message="x"),
+        InvalidFolderCharacterFailure(index=0, char="@"),
+        _UnknownFailure(),
+    ]
+
+    text = format_failures_ca(failures)
+
+    assert text == "".join(line + "\n" for line in failures_to_lines_ca(failures))
+    assert format_failures_ca([]) == ""
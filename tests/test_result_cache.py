@@ -0,0 +1,59 @@
+"""Tests for ResultCache."""
+
+import pickle
+
+import pytest
+from returns.result import Failure, Success
+
+from string_checker import ResultCache
+
+
+class TestResultCache:
+    """LRU behaviour, statistics and pickling."""
+
+    def test_get_miss_then_hit(self) -> None:
+        cache = ResultCache()
+        assert cache.get(("a", "fp")) is None
+        cache.put(("a", "fp"), Success(None))
+        assert cache.get(("a", "fp")) == Success(None)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_rate == 0.5
+
+    def test_hit_rate_is_zero_before_lookups(self) -> None:
+        assert ResultCache().hit_rate == 0.0
+
+    def test_fingerprint_is_part_of_the_key(self) -> None:
+        cache = ResultCache()
+        cache.put(("a", "fp1"), Success(None))
+        assert cache.get(("a", "fp2")) is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ResultCache(maxsize=2)
+        cache.put(("a", "fp"), Success(None))
+        cache.put(("b", "fp"), Failure(()))
+        cache.get(("a", "fp"))
+        cache.put(("c", "fp"), Success(None))
+        assert len(cache) == 2
+        assert cache.get(("b", "fp")) is None
+        assert cache.get(("a", "fp")) == Success(None)
+
+    def test_clear_drops_entries_and_counters(self) -> None:
+        cache = ResultCache()
+        cache.put(("a", "fp"), Success(None))
+        cache.get(("a", "fp"))
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_pickles_as_empty_cache(self) -> None:
+        cache = ResultCache(maxsize=10)
+        cache.put(("a", "fp"), Success(None))
+        cache.get(("a", "fp"))
+        copy = pickle.loads(pickle.dumps(cache))  # noqa: S301
+        assert copy.maxsize == 10
+        assert len(copy) == 0
+        assert (copy.hits, copy.misses) == (0, 0)
+
+    def test_rejects_non_positive_maxsize(self) -> None:
+        with pytest.raises(ValueError, match="maxsize"):
+            ResultCache(maxsize=0)
@@ -0,0 +1,132 @@
+"""Tests for the CLI file sources and the validation loop."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from typer.testing import CliRunner
+
+from cli import sheet_parser, work_parser
+from cli.log_writer import LogWriter, OutputFormat
+from cli.sources import (
+    DriveFileSource,
+    FileSource,
+    LocalFileSource,
+    ManifestSource,
+    validate_source,
+)
+from drive_connection import DriveConnectionError
+from local_connection import LocalEntry
+from string_checker import Checker, PdfExtensionRule
+
+_NAMES = ["a.pdf", "b.txt", "c.pdf", "d"]
+
+
+class _ListSource(FileSource):
+    """Source serving fixed entries, optionally failing after them."""
+
+    errors = (DriveConnectionError,)
+    error_key = "drive_error"
+
+    def __init__(self, names: list[str], *, fail: bool = False) -> None:
+        self.names = names
+        self.fail = fail
+
+    def entries(self) -> Iterator[LocalEntry]:
+        for i, name in enumerate(self.names):
+            yield LocalEntry(name, f"dir/{name}", f"id{i}")
+        if self.fail:
+            msg = "boom"
+            raise DriveConnectionError(msg)
+
+
+def _checker() -> Checker:
+    return Checker(rules=[PdfExtensionRule()])
+
+
+class TestValidateSource:
+    """validate_source logs failing entries in listing order."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_logs_failing_entries(self, tmp_path: Path, workers: int) -> None:
+        path = tmp_path / "log.jsonl"
+        with LogWriter(path, "Fitxer", OutputFormat.JSONL) as log:
+            total = validate_source(
+                _ListSource(_NAMES), _checker(), log, workers=workers
+            )
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert total == len(_NAMES)
+        assert [(r["path"], r["id"]) for r in records] == [
+            ("dir/b.txt", "id1"),
+            ("dir/d", "id3"),
+        ]
+
+    def test_source_error_exits_without_log(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        path = tmp_path / "log.txt"
+
+        def run() -> None:
+            with LogWriter(path, "Fitxer") as log:
+                validate_source(_ListSource(_NAMES, fail=True), _checker(), log)
+
+        with pytest.raises(SystemExit):
+            run()
+        assert "Error de Google Drive: boom" in capsys.readouterr().err
+        assert not path.exists()
+
+
+def test_drive_file_source_lists_with_its_options() -> None:
+    """DriveFileSource forwards its options to list_file_entries."""
+    service = Mock()
+    service.files.return_value.list.return_value.execute.return_value = {
+        "files": [{"id": "f1", "name": "a.pdf", "mimeType": "application/pdf"}]
+    }
+    source = DriveFileSource(service, "root")
+    assert [tuple(e) for e in source.entries()] == [("a.pdf", "a.pdf", "f1")]
+    assert source.error_key == "drive_error"
+
+
+def test_local_and_manifest_sources(tmp_path: Path) -> None:
+    """A directory and a manifest exported from it give the same names."""
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "a.pdf").touch()
+    manifest = tmp_path / "m.jsonl"
+    manifest.write_text(json.dumps({"path": "a.pdf", "id": "x"}) + "\n")
+    local = list(LocalFileSource(tmp_path / "dir").entries())
+    listed = list(ManifestSource(manifest).entries())
+    assert [e.name for e in local] == [e.name for e in listed] == ["a.pdf"]
+
+
+class TestCliManifest:
+    """Both CLIs validate the entries of a manifest with --manifest."""
+
+    def test_sheet_parser(self, tmp_path: Path) -> None:
+        manifest = tmp_path / "files.csv"
+        manifest.write_text("path,id\nObra/1000_Flauta.pdf,a\nObra/x.txt,b\n")
+        log = tmp_path / "sheets.log"
+        result = CliRunner().invoke(
+            sheet_parser.app, ["--manifest", str(manifest), "--log", str(log)]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Validats 2 fitxers." in result.output
+        assert "Fitxer: Obra/x.txt" in log.read_text(encoding="utf-8")
+
+    def test_work_parser(self, tmp_path: Path) -> None:
+        manifest = tmp_path / "folders.jsonl"
+        manifest.write_text(
+            json.dumps({"path": "Obra_Autor"}) + "\n" + json.dumps({"path": "x@"})
+        )
+        result = CliRunner().invoke(work_parser.app, ["--manifest", str(manifest)])
+        assert result.exit_code == 0, result.output
+        assert "1 carpetes amb errors." in result.output
+
+    def test_path_and_manifest_are_exclusive(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(
+            work_parser.app,
+            ["--path", str(tmp_path), "--manifest", str(tmp_path / "m.csv")],
+        )
+        assert result.exit_code == 1
+        assert "--manifest" in result.output